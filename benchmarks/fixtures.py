@@ -0,0 +1,236 @@
+"""
+Synthetic fixtures for the benchmarks: a local stand-in for top500.org.
+
+`build_site()` writes an overview page, one list page per issue and the XML and Excel files of each issue to a
+directory, mimicking the structure of top500.org closely enough for the scraper. `serve_site()` serves that directory
+via HTTP on localhost.
+"""
+
+import functools
+import http.server
+import random
+import threading
+from io import BytesIO
+from pathlib import Path
+
+import openpyxl
+
+NUM_ROWS = 500
+
+XML_FIELDS = (
+    "rank",
+    "system-name",
+    "system-id",
+    "system-address",
+    "computer",
+    "manufacturer",
+    "installation-site",  # Nested element, see make_xml()
+    "town",
+    "state",
+    "country",
+    "year",
+    "area-of-installation",
+    "number-of-processors",
+    "r-max",
+    "r-peak",
+    "n-max",
+    "n-half",
+    "power",
+)
+XML_INT_FIELDS = {"system-id", "number-of-processors", "n-max", "n-half"}
+XML_FLOAT_FIELDS = {"r-max", "r-peak", "power"}
+
+EXCEL_COLUMNS = (
+    "Rank",
+    "Previous Rank",
+    "First Appearance",
+    "First Rank",
+    "Name",
+    "Computer",
+    "Site",
+    "Manufacturer",
+    "Country",
+    "Year",
+    "Segment",
+    "Total Cores",
+    "Accelerator/Co-Processor Cores",
+    "Rmax [TFlop/s]",
+    "Rpeak [TFlop/s]",
+    "Nmax",
+    "Nhalf",
+    "HPCG [TFlop/s]",
+    "Power (kW)",
+    "Power Source",
+    "Energy Efficiency [GFlops/Watts]",
+    "Memory",
+    "architecture",
+    "processor",
+    "Processor Technology",
+    "Processor Speed (MHz)",
+    "Operating System",
+    "OS Family",
+    "Accelerator/Co-Processor",
+    "Cores per Socket",
+    "Processor Generation",
+    "System Model",
+    "System Family",
+    "Interconnect Family",
+    "Interconnect",
+    "Region",
+    "Continent",
+    "Site ID",
+    "System ID",
+    "Efficiency (%)",
+    "Measured Size",
+    "Processor Family",
+)
+EXCEL_INT_COLUMNS = {
+    "Rank",
+    "Previous Rank",
+    "First Appearance",
+    "First Rank",
+    "Year",
+    "Total Cores",
+    "Accelerator/Co-Processor Cores",
+    "Nmax",
+    "Nhalf",
+    "Memory",
+    "Processor Speed (MHz)",
+    "Cores per Socket",
+    "Site ID",
+    "System ID",
+    "Measured Size",
+}
+EXCEL_FLOAT_COLUMNS = {
+    "Rmax [TFlop/s]",
+    "Rpeak [TFlop/s]",
+    "HPCG [TFlop/s]",
+    "Power (kW)",
+    "Energy Efficiency [GFlops/Watts]",
+    "Efficiency (%)",
+}
+
+
+def iter_issues(num_issues: int):
+    """Yield (key, title, number) of the newest `num_issues` issues, newest-first."""
+    year, month = 2025, 6
+    for i in range(num_issues):
+        title = f"{'June' if month == 6 else 'November'} {year}"
+        yield f"{year}-{month:02d}", title, 65 - i
+        year, month = (year - 1, 11) if month == 6 else (year, 6)
+
+
+def make_xml(seed: int) -> bytes:
+    rng = random.Random(seed)
+    lines = [
+        '<?xml version="1.0" encoding="UTF-8"?>',
+        '<top500:list xmlns:top500="http://www.top500.org/xml/top500/1.0">',
+    ]
+    for rank in range(1, NUM_ROWS + 1):
+        lines.append("<top500:site>")
+        for field in XML_FIELDS:
+            if field == "installation-site":
+                lines += [
+                    "<top500:installation-site>",
+                    f"<top500:installation-site-name>Site {rng.randint(1, 300)}</top500:installation-site-name>",
+                    f"<top500:installation-site-address>Street {rank}</top500:installation-site-address>",
+                    f"<top500:site-id>{rng.randint(1, 3000)}</top500:site-id>",
+                    "</top500:installation-site>",
+                ]
+            elif field == "rank":
+                lines.append(f"<top500:rank>{rank}</top500:rank>")
+            elif field == "state" and rank % 3 != 0:
+                lines.append("<top500:state/>")
+            elif field == "year":
+                lines.append(f"<top500:year>{rng.randint(1993, 2025)}</top500:year>")
+            elif field in XML_INT_FIELDS:
+                lines.append(
+                    f"<top500:{field}>{rng.randint(1, 10**7)}</top500:{field}>"
+                )
+            elif field in XML_FLOAT_FIELDS:
+                lines.append(
+                    f"<top500:{field}>{rng.random() * 10**6:.1f}</top500:{field}>"
+                )
+            else:
+                value = f"{field} {rng.choice('ABCDEFGH')}"
+                lines.append(f"<top500:{field}>{value}</top500:{field}>")
+        lines.append("</top500:site>")
+    lines.append("</top500:list>")
+    return "\n".join(lines).encode("utf-8")
+
+
+def make_excel(seed: int) -> bytes:
+    rng = random.Random(seed)
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append([])  # The older lists start with an empty line.
+    sheet.append(EXCEL_COLUMNS)
+    for rank in range(1, NUM_ROWS + 1):
+        row = []
+        for column in EXCEL_COLUMNS:
+            if column == "Rank":
+                row.append(rank)
+            elif column in EXCEL_INT_COLUMNS:
+                row.append(rng.randint(1, 10**5))
+            elif column in EXCEL_FLOAT_COLUMNS:
+                row.append(round(rng.random() * 1000, 3))
+            elif column == "Accelerator/Co-Processor":
+                row.append(rng.choice((None, "NVIDIA H100", "AMD Instinct MI250X")))
+            else:
+                row.append(f"{column} {rng.choice('ABCDEFGH')}")
+        sheet.append(row)
+    bio = BytesIO()
+    workbook.save(bio)
+    return bio.getvalue()
+
+
+def build_site(site_dir: Path, num_issues: int) -> list[str]:
+    """Write a stand-in for top500.org with `num_issues` issues to `site_dir`.
+
+    Returns:
+        list[str]: The keys of the issues, newest-first.
+    """
+    files_dir = site_dir / "files"
+    files_dir.mkdir(parents=True, exist_ok=True)
+    overview_items = []
+    keys = []
+    for seed, (key, title, number) in enumerate(iter_issues(num_issues)):
+        keys.append(key)
+        year, month = key.split("-")
+        overview_items.append(
+            f'<li><h3>{title}</h3><a href="{year}/{month}">{title}</a>'
+            f"<p>The {number}th TOP500 List was published June 14, {year} in Hamburg, Germany.</p></li>"
+        )
+        list_dir = site_dir / "lists" / "top500" / year / month
+        list_dir.mkdir(parents=True, exist_ok=True)
+        (list_dir / "index.html").write_text(
+            '<html><body><div id="navbarSupportedContentSubmenu">'
+            f'<a href="/files/TOP500_{year}{month}_all.xml">TOP500 List (XML)</a>'
+            f'<a href="/files/TOP500_{year}{month}.xlsx">TOP500 List (Excel)</a>'
+            "</div></body></html>"
+        )
+        (files_dir / f"TOP500_{year}{month}_all.xml").write_bytes(make_xml(seed))
+        (files_dir / f"TOP500_{year}{month}.xlsx").write_bytes(make_excel(seed))
+    (site_dir / "lists" / "top500" / "index.html").write_text(
+        '<html><body><ul id="squarelist">'
+        + "".join(overview_items)
+        + "</ul></body></html>"
+    )
+    return keys
+
+
+def serve_site(site_dir: Path) -> tuple[http.server.ThreadingHTTPServer, str]:
+    """Serve `site_dir` on a free port of localhost in a background thread.
+
+    Returns:
+        tuple[http.server.ThreadingHTTPServer, str]: The server and the URL of the overview page.
+    """
+
+    class QuietHandler(http.server.SimpleHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+    handler = functools.partial(QuietHandler, directory=str(site_dir))
+    server = http.server.ThreadingHTTPServer(("127.0.0.1", 0), handler)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_address[1]}/lists/top500/"
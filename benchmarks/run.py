@@ -0,0 +1,652 @@
+#!/usr/bin/env python3
+"""
+Benchmarks for the download, conversion, normalization and read hot paths.
+
+The benchmarks run offline: a synthetic stand-in for top500.org (see `fixtures.py`) is generated and served on
+localhost, and a download directory is populated from it once. Alternatively, the read and conversion benchmarks can
+run against an existing download directory with real lists via `--mirror`.
+
+Every benchmark runs in a fresh interpreter, so that the first ("cold") call sees empty in-memory caches and the peak
+RSS is not inflated by other benchmarks. The call is then repeated `--repeat` times in the same interpreter ("warm").
+For each benchmark, the wall time, the bytes read via read() syscalls (Linux only) and the peak RSS are reported as
+JSON.
+
+Usage:
+    python benchmarks/run.py [-n issues] [-r repeat] [-m dir] [-o file] [benchmark ...]
+"""
+
+import argparse
+import dataclasses
+import importlib
+import json
+import os
+import platform
+import resource
+import shutil
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from collections.abc import Callable
+from datetime import UTC, datetime
+from io import BytesIO
+from pathlib import Path
+
+import fixtures
+
+SOURCES = ("normalized", "normalized-pretty", "xml", "excel")
+SCOPES = ("one", "all")
+HEAVY_MODULES = (
+    "bs4",
+    "lxml.etree",
+    "openpyxl",
+    "pandas",
+    "polars",
+    "requests",
+    "top500",
+)
+
+
+@dataclasses.dataclass
+class Context:
+    """Everything a benchmark needs to know about its environment.
+
+    Attributes:
+        overview_url (str): The URL of the overview page of the stand-in for top500.org.
+        mirror_dir (str): A download directory that contains all lists. Must not be modified by the benchmarks.
+        work_dir (str): A scratch directory for the benchmark.
+        keys (list[str]): The keys of the lists in `mirror_dir`, newest-first.
+        site_keys (list[str]): The keys of the lists of the stand-in, newest-first.
+    """
+
+    overview_url: str
+    mirror_dir: str
+    work_dir: str
+    keys: list[str]
+    site_keys: list[str]
+
+    def keys_for(self, scope: str) -> list[str]:
+        return self.keys[:1] if scope == "one" else self.keys
+
+
+# Maps the name of every benchmark to a setup function that prepares the environment and returns the function to time.
+BENCHMARKS: dict[str, Callable[[Context], Callable[[], object]]] = {}
+
+
+def benchmark(name: str):
+    def decorator(setup: Callable[[Context], Callable[[], object]]):
+        BENCHMARKS[name] = setup
+        return setup
+
+    return decorator
+
+
+def configure_http(ctx: Context) -> None:
+    """Point top500 at the stand-in with a private HTTP cache and without rate limiting."""
+    import top500
+
+    settings = dataclasses.replace(
+        top500.get_http_settings(),
+        overview_url=ctx.overview_url,
+        cache_dir=Path(tempfile.mkdtemp(dir=ctx.work_dir)),
+        requests_per_second=1000.0,
+        burst=1000,
+    )
+    top500.set_http_settings(settings)
+
+
+def use_mirror_copy(ctx: Context) -> Path:
+    """Copy the mirror to the scratch directory and use the copy as the download directory."""
+    import top500
+
+    download_dir = Path(ctx.work_dir) / "mirror"
+    shutil.copytree(ctx.mirror_dir, download_dir)
+    top500.set_download_dir(download_dir)
+    return download_dir
+
+
+def read_raw_files(
+    ctx: Context, keys: list[str], suffixes: tuple[str, ...]
+) -> list[bytes]:
+    """Read the raw XML or Excel files of the given lists from the mirror."""
+    import top500
+
+    top500.set_download_dir(ctx.mirror_dir)
+    contents = []
+    for key in keys:
+        with top500._ListArchive(top500._get_list_path(key)) as archive:
+            name = next(name for name in archive.names() if name.endswith(suffixes))
+            with archive.open(name) as fp:
+                contents.append(fp.read())
+    return contents
+
+
+def make_download_benchmark(scope: str, jobs: int):
+    def setup(ctx: Context):
+        import top500
+
+        configure_http(ctx)
+
+        def run():
+            # A fresh download directory for every call, so that nothing is skipped. The HTTP cache is kept, so warm
+            # calls revalidate the overview and list pages instead of fetching them.
+            top500.set_download_dir(Path(tempfile.mkdtemp(dir=ctx.work_dir)))
+            if scope == "one":
+                top500.download_list(ctx.site_keys[0])
+            else:
+                top500.download_all_lists(jobs=jobs)
+
+        return run
+
+    return setup
+
+
+benchmark("download_list[one]")(make_download_benchmark("one", 1))
+benchmark("download_all_lists[all,jobs=1]")(make_download_benchmark("all", 1))
+benchmark("download_all_lists[all,jobs=4]")(make_download_benchmark("all", 4))
+
+
+def make_conversion_benchmark(
+    scope: str, suffixes: tuple[str, ...], converter: str | Callable[[bytes], bytes]
+):
+    def setup(ctx: Context):
+        import top500
+
+        convert = (
+            getattr(top500, converter) if isinstance(converter, str) else converter
+        )
+        contents = read_raw_files(ctx, ctx.keys_for(scope), suffixes)
+        return lambda: [convert(content) for content in contents]
+
+    return setup
+
+
+def tsv_from_xml_pandas(xml_content: bytes) -> bytes:
+    """The conversion of `_tsv_from_xml()` via `pandas.read_xml()`, before it streamed the XML file with lxml. Kept as
+    the baseline of the "tsv_from_xml" benchmarks."""
+    import csv
+    import re
+    from io import StringIO
+
+    import pandas as pd
+
+    sio = StringIO(xml_content.decode("utf-8"))
+    sio2 = StringIO()
+    re_installation_site = re.compile(r"</?top500:installation-site>")
+    for line in sio:
+        if re_installation_site.match(line.strip()):
+            continue
+        sio2.write(line.replace("\t", " ") + "\n")
+    df = pd.read_xml(sio2, dtype=str)
+    bio = BytesIO()
+    df.to_csv(bio, index=False, header=True, sep="\t", quoting=csv.QUOTE_NONE)
+    return bio.getvalue()
+
+
+for _scope in SCOPES:
+    benchmark(f"tsv_from_xml[{_scope}]")(
+        make_conversion_benchmark(_scope, (".xml",), "_tsv_from_xml")
+    )
+    benchmark(f"tsv_from_xml[{_scope},pandas-read-xml]")(
+        make_conversion_benchmark(_scope, (".xml",), tsv_from_xml_pandas)
+    )
+    benchmark(f"tsv_from_excel[{_scope}]")(
+        make_conversion_benchmark(_scope, (".xls", ".xlsx"), "_tsv_from_excel")
+    )
+
+
+def make_normalize_benchmark(scope: str):
+    def setup(ctx: Context):
+        import top500
+
+        top500.set_download_dir(ctx.mirror_dir)
+        paths = [top500._get_list_path(key) for key in ctx.keys_for(scope)]
+
+        def run():
+            for path in paths:
+                with top500._ListArchive(path) as archive:
+                    top500._normalize_list(
+                        top500._read_tsv_member("from_xml.tsv", archive),
+                        top500._read_tsv_member("from_excel.tsv", archive),
+                    )
+
+        return run
+
+    return setup
+
+
+for _scope in SCOPES:
+    benchmark(f"normalize[{_scope}]")(make_normalize_benchmark(_scope))
+
+
+def make_write_archive_benchmark(archive_format: str, compression_level: int | None):
+    def setup(ctx: Context):
+        import top500
+
+        top500.set_download_dir(ctx.mirror_dir)
+        top500.set_archive_format(archive_format, compression_level)
+        members = []
+        for key in ctx.keys:
+            with top500._ListArchive(top500._get_list_path(key)) as archive:
+                list_members = []
+                for name in archive.names():
+                    with archive.open(name) as fp:
+                        list_members.append((name, fp.read()))
+                members.append(list_members)
+
+        def run():
+            for list_members in members:
+                top500._write_archive(BytesIO(), archive_format, list_members)
+
+        return run
+
+    return setup
+
+
+# The default level of every format and the fastest and the smallest level of "tar.gz" and "tar.zst".
+for _archive_format, _level in (
+    ("tar.gz", 1),
+    ("tar.gz", None),
+    ("tar.gz", 9),
+    ("tar.zst", 1),
+    ("tar.zst", None),
+    ("tar.zst", 19),
+    ("zip", None),
+):
+    benchmark(f"write_archive[all,{_archive_format},level={_level or 'default'}]")(
+        make_write_archive_benchmark(_archive_format, _level)
+    )
+
+
+def make_read_benchmark(
+    scope: str,
+    source: str,
+    cached: bool,
+    archive_format: str | None = None,
+    columns: list[str] | None = None,
+):
+    def setup(ctx: Context):
+        import top500
+
+        use_mirror_copy(ctx)
+        if archive_format is not None:
+            top500.migrate_local_lists(archive_format)
+        keys = ctx.keys_for(scope)
+
+        def run():
+            if not cached:
+                top500.clear_cache()
+            for key in keys:
+                top500.read_list(
+                    key, allow_download=False, source=source, columns=columns
+                )
+
+        return run
+
+    return setup
+
+
+for _scope in SCOPES:
+    for _source in SOURCES:
+        benchmark(f"read_list[{_scope},{_source}]")(
+            make_read_benchmark(_scope, _source, cached=True)
+        )
+        benchmark(f"read_list[{_scope},{_source},uncached]")(
+            make_read_benchmark(_scope, _source, cached=False)
+        )
+    # A projection onto a single column, e.g. to plot the Rmax over time.
+    benchmark(f"read_list[{_scope},normalized,uncached,columns=r-max-gflops]")(
+        make_read_benchmark(
+            _scope, "normalized", cached=False, columns=["r-max-gflops"]
+        )
+    )
+    for _source in ("xml", "excel"):
+        for _archive_format in ("tar.gz", "tar.zst", "zip"):
+            benchmark(f"read_list[{_scope},{_source},uncached,{_archive_format}]")(
+                make_read_benchmark(
+                    _scope, _source, cached=False, archive_format=_archive_format
+                )
+            )
+
+
+def make_read_lists_benchmark(source: str, workers: int):
+    def setup(ctx: Context):
+        import top500
+
+        use_mirror_copy(ctx)
+
+        def run():
+            top500.clear_cache()
+            top500.read_lists(source=source, workers=workers)
+
+        return run
+
+    return setup
+
+
+for _source in ("normalized", "xml"):
+    for _workers in (1, 4):
+        benchmark(f"read_lists[all,{_source},workers={_workers}]")(
+            make_read_lists_benchmark(_source, _workers)
+        )
+
+
+def make_group_by_benchmark(compact: bool):
+    def setup(ctx: Context):
+        import polars as pl
+        import top500
+
+        use_mirror_copy(ctx)
+        top500.set_compact_schema(compact)
+        df = top500.read_lists(concat=True)
+        return lambda: (
+            df.group_by("country", "manufacturer", "segment")
+            .agg(pl.len(), pl.col("r-max-gflops").sum())
+            .sort("country", "manufacturer", "segment")
+        )
+
+    return setup
+
+
+benchmark("group_by[all,string]")(make_group_by_benchmark(compact=False))
+benchmark("group_by[all,compact]")(make_group_by_benchmark(compact=True))
+
+
+@benchmark("scan_lists[all,rank-1]")
+def setup_scan_lists(ctx: Context):
+    import polars as pl
+
+    import top500
+
+    use_mirror_copy(ctx)
+    return lambda: (
+        top500.scan_lists()
+        .filter(pl.col("rank") == 1)
+        .select("list_key", "r-max-gflops")
+        .collect()
+    )
+
+
+@benchmark("system_history[all]")
+def setup_system_history(ctx: Context):
+    import top500
+
+    use_mirror_copy(ctx)
+    system_id = top500.read_list(ctx.keys[-1], allow_download=False)["system-id"][0]
+    # The first call has to build the history index, the following ones only look the system up.
+    return lambda: top500.system_history(system_id)
+
+
+@benchmark("iter_lists_local[all]")
+def setup_iter_lists_local(ctx: Context):
+    import top500
+
+    download_dir = use_mirror_copy(ctx)
+    # The first call has to build the index from the archives, the following ones read it.
+    (download_dir / "index.json").unlink(missing_ok=True)
+    return lambda: list(top500.iter_lists_local())
+
+
+def get_bytes_read() -> int | None:
+    """Get the number of bytes this process has read via read() syscalls so far, or None if unsupported."""
+    try:
+        with open("/proc/self/io") as f:
+            for line in f:
+                if line.startswith("rchar:"):
+                    return int(line.split()[1])
+    except OSError:
+        pass
+    return None
+
+
+def get_peak_rss() -> int:
+    """Get the peak resident set size of this process in bytes."""
+    # On Linux, ru_maxrss is retained across execve(), so a worker would report the peak of its parent if that is
+    # higher. The high water mark in /proc is reset by execve().
+    try:
+        with open("/proc/self/status") as f:
+            for line in f:
+                if line.startswith("VmHWM:"):
+                    return int(line.split()[1]) * 1024
+    except OSError:
+        pass
+    max_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # ru_maxrss is in bytes on macOS, but in kilobytes everywhere else.
+    return max_rss if sys.platform == "darwin" else max_rss * 1024
+
+
+def measure(function: Callable[[], object]) -> dict:
+    bytes_before = get_bytes_read()
+    start = time.perf_counter()
+    function()
+    wall_time = time.perf_counter() - start
+    bytes_after = get_bytes_read()
+    return {
+        "wall_time_s": wall_time,
+        "bytes_read": None if bytes_before is None else bytes_after - bytes_before,
+    }
+
+
+def run_worker(name: str, ctx: Context, repeat: int) -> dict:
+    """Run a single benchmark in this process."""
+    # top500 imports its dependencies lazily. Import them upfront, so that the cold call measures cold caches rather
+    # than module loading (see scripts/check_import_time.py for that).
+    for module in HEAVY_MODULES:
+        importlib.import_module(module)
+    function = BENCHMARKS[name](ctx)
+    # The stand-in is on localhost, so the progress output of top500 is just noise here.
+    with open(os.devnull, "w") as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            cold = measure(function)
+            warm = [measure(function) for _ in range(repeat)]
+        finally:
+            sys.stdout = stdout
+    warm_times = [m["wall_time_s"] for m in warm]
+    return {
+        "name": name,
+        "cold": cold,
+        "warm": {
+            "repeat": repeat,
+            "wall_time_s_min": min(warm_times, default=None),
+            "wall_time_s_median": statistics.median(warm_times) if warm else None,
+            "bytes_read_median": (
+                statistics.median(m["bytes_read"] for m in warm)
+                if warm and warm[0]["bytes_read"] is not None
+                else None
+            ),
+        },
+        "peak_rss_bytes": get_peak_rss(),
+    }
+
+
+def run_in_subprocess(name: str, ctx: Context, repeat: int) -> dict:
+    with tempfile.TemporaryDirectory(dir=ctx.work_dir) as work_dir:
+        worker_ctx = dataclasses.replace(ctx, work_dir=work_dir)
+        proc = subprocess.run(
+            [
+                sys.executable,
+                __file__,
+                "--worker",
+                name,
+                "--context",
+                json.dumps(dataclasses.asdict(worker_ctx)),
+                "--repeat",
+                str(repeat),
+            ],
+            stdout=subprocess.PIPE,
+            text=True,
+            check=False,
+        )
+    if proc.returncode != 0:
+        return {"name": name, "error": f"Worker exited with status {proc.returncode}"}
+    return json.loads(proc.stdout)
+
+
+def prepare_mirror(overview_url: str, work_dir: Path) -> Path:
+    """Download all lists from the stand-in once, so that the read benchmarks have something to read."""
+    import top500
+
+    ctx = Context(overview_url, "", str(work_dir), [], [])
+    configure_http(ctx)
+    mirror_dir = work_dir / "mirror"
+    mirror_dir.mkdir()
+    top500.set_download_dir(mirror_dir)
+    with open(os.devnull, "w") as devnull:
+        stdout, sys.stdout = sys.stdout, devnull
+        try:
+            top500.download_all_lists()
+        finally:
+            sys.stdout = stdout
+    return mirror_dir
+
+
+def get_git_commit() -> str | None:
+    try:
+        proc = subprocess.run(
+            ["git", "rev-parse", "HEAD"],
+            cwd=Path(__file__).parent,
+            capture_output=True,
+            text=True,
+            check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        return None
+    return proc.stdout.strip()
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        metavar="benchmark",
+        help="The benchmarks to run (default: all). A name matches every benchmark that starts with it.",
+    )
+    parser.add_argument(
+        "-n",
+        "--issues",
+        type=int,
+        default=10,
+        metavar="issues",
+        help="The number of synthetic issues of the stand-in (default: 10).",
+    )
+    parser.add_argument(
+        "-r",
+        "--repeat",
+        type=int,
+        default=3,
+        metavar="repeat",
+        help="The number of warm calls per benchmark (default: 3).",
+    )
+    parser.add_argument(
+        "-m",
+        "--mirror",
+        metavar="dir",
+        help="Run the read and conversion benchmarks against this download dir instead of the synthetic lists.",
+    )
+    parser.add_argument(
+        "-o",
+        "--output",
+        metavar="file",
+        help="Write the results to this file instead of stdout.",
+    )
+    parser.add_argument("--list", action="store_true", help="List the benchmarks.")
+    parser.add_argument("--worker", help=argparse.SUPPRESS)
+    parser.add_argument("--context", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        ctx = Context(**json.loads(args.context))
+        print(json.dumps(run_worker(args.worker, ctx, args.repeat)))
+        return 0
+
+    if args.repeat < 1:
+        parser.error("The number of warm calls must be at least 1.")
+
+    if args.list:
+        print("\n".join(BENCHMARKS))
+        return 0
+
+    names = [
+        name
+        for name in BENCHMARKS
+        if not args.benchmarks or any(name.startswith(b) for b in args.benchmarks)
+    ]
+    if not names:
+        parser.error("No benchmark matches the given names.")
+    skipped = []
+    try:
+        import top500
+
+        top500._get_zstd_backend()
+    except RuntimeError as e:
+        # "tar.zst" needs Python 3.14 or the optional zstandard package (`pip install top500[zstd]`).
+        skipped = [name for name in names if "tar.zst" in name]
+        names = [name for name in names if name not in skipped]
+        if skipped:
+            print(f"Skipping {len(skipped)} benchmark(s): {e}", file=sys.stderr)
+
+    with tempfile.TemporaryDirectory(prefix="top500-benchmarks-") as tmp:
+        work_dir = Path(tmp)
+        print("Generating the stand-in for top500.org...", file=sys.stderr)
+        site_dir = work_dir / "site"
+        site_keys = fixtures.build_site(site_dir, args.issues)
+        server, overview_url = fixtures.serve_site(site_dir)
+        try:
+            if args.mirror:
+                mirror_dir = Path(args.mirror).resolve()
+            else:
+                print("Populating the mirror...", file=sys.stderr)
+                mirror_dir = prepare_mirror(overview_url, work_dir)
+            keys = sorted(
+                (
+                    path.name.split(".")[0]
+                    for path in mirror_dir.iterdir()
+                    if path.name.endswith((".tar.gz", ".tar.zst", ".zip"))
+                ),
+                reverse=True,
+            )
+            ctx = Context(overview_url, str(mirror_dir), str(work_dir), keys, site_keys)
+            results = []
+            for name in names:
+                print(f"Running {name}...", file=sys.stderr)
+                result = run_in_subprocess(name, ctx, args.repeat)
+                if "error" in result:
+                    print(f"  {result['error']}", file=sys.stderr)
+                else:
+                    print(
+                        f"  cold {result['cold']['wall_time_s']:.3f} s,"
+                        f" warm {result['warm']['wall_time_s_median']:.3f} s,"
+                        f" peak RSS {result['peak_rss_bytes'] / 2**20:.0f} MiB",
+                        file=sys.stderr,
+                    )
+                results.append(result)
+        finally:
+            server.shutdown()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(UTC).isoformat(),
+            "git_commit": get_git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "cpu_count": os.cpu_count(),
+            "issues": len(keys),
+            "mirror": "synthetic" if not args.mirror else str(mirror_dir),
+            "repeat": args.repeat,
+        },
+        "results": results,
+        "skipped": skipped,
+    }
+    output = json.dumps(report, indent=2)
+    if args.output:
+        Path(args.output).write_text(output + "\n")
+    else:
+        print(output)
+    return 1 if any("error" in result for result in results) else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
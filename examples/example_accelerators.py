@@ -8,23 +8,31 @@ import matplotlib.pyplot as plt
 import top500
 import polars as pl
 
+
 def main():
-    has_acc_by_list = {}
-    lists_local = list(top500.iter_lists_local(newest_first=False))
-    if not lists_local:
+    limits = (500, 250, 50)
+    df_out = (
+        top500.scan_lists(newest_first=False)
+        .select(
+            "list_key", "rank", pl.col("accelerator").is_not_null().alias("has_acc")
+        )
+        .group_by("list_key", maintain_order=True)
+        .agg(
+            (
+                100.0 * pl.col("has_acc").filter(pl.col("rank") <= limit).sum() / limit
+            ).alias(f"top_{limit}")
+            for limit in limits
+        )
+        .filter(pl.col("top_500") > 0)
+        .rename({"list_key": "list_issue"})
+        .collect()
+    )
+    if len(df_out) == 0:
         raise RuntimeError("Download the TOP500 lists before running this example.")
-    for list_info in lists_local:
-        df = top500.read_list(list_info, allow_download=False, source="normalized")
-        assert len(df) == 500
-        has_acc = list(df["accelerator"].is_null().not_())
-        if sum(has_acc) > 0:
-            has_acc_by_list[list_info.key] = has_acc
-    x = list(has_acc_by_list.keys())
-    df_out = pl.DataFrame({"list_issue": x})
-    for limit in (500, 250, 50):
-        y = [(100.0 * sum(l[:limit]) / limit) for l in has_acc_by_list.values()]
+    x = list(df_out["list_issue"])
+    for limit in limits:
+        y = list(df_out[f"top_{limit}"])
         plt.scatter(x, y, label=f"TOP {limit}")
-        df_out = df_out.with_columns(pl.Series(name=f"top_{limit}", values=y))
     print(df_out)
     # df_out.write_csv("example_accelerators.csv")
     plt.xticks(rotation=90)
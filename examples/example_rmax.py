@@ -5,20 +5,21 @@ Download the lists before you run it.
 """
 
 import matplotlib.pyplot as plt
+import polars as pl
 import top500
 
 
 def main():
-    x = []
-    y = []
-    lists_local = list(top500.iter_lists_local(newest_first=False))
-    if not lists_local:
+    df = (
+        top500.scan_lists(newest_first=False)
+        .filter(pl.col("rank") == 1)
+        .select("list_key", "r-max-gflops")
+        .collect()
+    )
+    if len(df) == 0:
         raise RuntimeError("Download the TOP500 lists before running this example.")
-    for list_info in lists_local:
-        x.append(list_info.key)
-        df = top500.read_list(list_info, allow_download=False, source="normalized")
-        rmax = df["r-max-gflops"][0]
-        y.append(rmax)
+    x = list(df["list_key"])
+    y = list(df["r-max-gflops"])
     plt.scatter(x, y)
     plt.xticks(rotation=90)
     plt.xlabel("TOP500 list release")
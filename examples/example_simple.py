@@ -5,7 +5,7 @@ import top500
 
 def main() -> None:
     for list_info in top500.iter_lists_online():
-        df = top500.read_list(list_info)
+        df = top500.read_list(list_info, columns=["name"])
         fastest_computer = df["name"][0]
         if fastest_computer is None:
             continue
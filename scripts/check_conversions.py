@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Regression check for the tsv conversion.
+
+Converts the raw XML and Excel files stored in every local list archive again with the current code and compares the
+result byte by byte with the tsv files stored in the archive. Exits with status 1 if any of them differ.
+
+Usage:
+    python scripts/check_conversions.py [-d dir]
+"""
+
+import argparse
+import sys
+
+import top500
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "-d", "--download-dir", metavar="dir", help="The download dir to check."
+    )
+    args = parser.parse_args()
+    if args.download_dir:
+        top500.set_download_dir(args.download_dir)
+    converters = {
+        "from_xml.tsv": ((".xml",), top500._tsv_from_xml),
+        "from_excel.tsv": ((".xls", ".xlsx"), top500._tsv_from_excel),
+    }
+    num_checked = 0
+    failures = []
+    for list_info in top500.iter_lists_local(newest_first=False):
+        with top500._ListArchive(top500._get_list_path(list_info.key)) as archive:
+            names = archive.names()
+            for tsv_name, (raw_suffixes, convert) in converters.items():
+                raw_name = next(name for name in names if name.endswith(raw_suffixes))
+                with archive.open(tsv_name) as fp:
+                    expected = fp.read()
+                with archive.open(raw_name) as fp:
+                    actual = convert(fp.read())
+                num_checked += 1
+                if actual != expected:
+                    failures.append(
+                        f"{list_info.key}: {tsv_name} differs from the conversion of {raw_name}"
+                    )
+    for failure in failures:
+        print(failure)
+    print(f"Checked {num_checked} tsv files, {len(failures)} differ.")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
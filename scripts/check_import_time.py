@@ -0,0 +1,78 @@
+#!/usr/bin/env python3
+"""
+Regression check for the startup time of `import top500` and `top500 --help`.
+
+Runs both with `python -X importtime` and fails (exit status 1) if one of the heavy dependencies was imported, or if
+importing `top500` took longer than the given budget.
+
+Usage:
+    python scripts/check_import_time.py [--max-ms MS]
+"""
+
+import argparse
+import re
+import subprocess
+import sys
+
+# These must only be imported by the code paths that need them.
+HEAVY_MODULES = (
+    "bs4",
+    "lxml",
+    "openpyxl",
+    "pandas",
+    "polars",
+    "requests",
+    "urllib3",
+    "xlrd",
+)
+
+RE_IMPORTTIME = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+
+def get_imports(args: list[str]) -> dict[str, int]:
+    """Run Python with `-X importtime` and return the cumulative import time of every top-level module in µs."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", *args],
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    imports = {}
+    for line in result.stderr.splitlines():
+        m = RE_IMPORTTIME.match(line)
+        if m is None:
+            continue
+        module = m[4].split(".")[0]
+        imports[module] = max(imports.get(module, 0), int(m[2]))
+    return imports
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument(
+        "--max-ms",
+        type=float,
+        default=500.0,
+        help="Budget for the cumulative import time of top500 in ms. Defaults to 500.",
+    )
+    args = parser.parse_args()
+    failures = []
+    for name, python_args in (
+        ("import top500", ["-c", "import top500"]),
+        ("top500 --help", ["-m", "top500", "--help"]),
+    ):
+        imports = get_imports(python_args)
+        heavy = [module for module in HEAVY_MODULES if module in imports]
+        if heavy:
+            failures.append(f"{name} imports {', '.join(heavy)}")
+        import_ms = imports.get("top500", 0) / 1000
+        print(f"{name}: importing top500 took {import_ms:.1f} ms")
+        if import_ms > args.max_ms:
+            failures.append(f"{name}: {import_ms:.1f} ms exceeds {args.max_ms:.1f} ms")
+    for failure in failures:
+        print(failure)
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
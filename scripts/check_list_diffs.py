@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""
+Regression check for finding the consecutive list issues that `diff_lists()` and `scan_list_diffs()` materialize.
+
+Writes archives that only contain `metadata.json` for the issues around November 1995, whose key "1995-12" does not
+follow the June/November pattern, to a temporary download dir and checks which issues are paired up. Exits with status 1
+if the pairs are not as expected.
+
+Usage:
+    python scripts/check_list_diffs.py
+"""
+
+import datetime
+import sys
+import tempfile
+from pathlib import Path
+
+import top500
+
+# (key, number) of the issues, with a gap between 1994-06 and 1995-06.
+ISSUES = (("1994-06", 3), ("1995-06", 5), ("1995-12", 6), ("1996-06", 7))
+EXPECTED = {"1995-12": "1995-06", "1996-06": "1995-12"}
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as download_dir:
+        top500.set_download_dir(download_dir)
+        for key, number in ISSUES:
+            list_info = top500.Top500ListInfo(
+                key=key,
+                title=key,
+                number=number,
+                published_on=datetime.date.fromisoformat(f"{key}-01"),
+                published_at="",
+                url=f"https://top500.org/lists/top500/{key.replace('-', '/')}/",
+            )
+            path = Path(download_dir) / f"{key}.tar.gz"
+            with open(path, "wb") as f:
+                metadata = top500._LIST_INFO_ADAPTER.dump_json(list_info)
+                top500._write_archive(f, "tar.gz", [("metadata.json", metadata)])
+        actual = top500._get_previous_local_keys()
+    for new_key, old_key in sorted(actual.items()):
+        print(f"{old_key} -> {new_key}")
+    if actual != EXPECTED:
+        print(f"Expected {EXPECTED}, got {actual}.")
+        return 1
+    print("The consecutive issues are as expected.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Regression check for reusing the normalized Arrow IPC file of a list only while the normalized schema is unchanged.
+
+Writes a list built from the benchmark fixtures (see `benchmarks/fixtures.py`) to a temporary download dir, reads it
+once to create its normalized table and then changes the dtype of the "memory" column to Float64. Exits with status 1
+if `read_list()` still returns the old table or does not rewrite the normalized table.
+
+Usage:
+    python scripts/check_normalized_schema.py
+"""
+
+import dataclasses
+import datetime
+import sys
+import tempfile
+from pathlib import Path
+
+import polars as pl
+
+import top500
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+import fixtures  # noqa: E402
+
+KEY = "2025-06"
+
+
+def read_memory_dtype() -> pl.DataType:
+    top500.clear_cache()
+    df = top500.read_list(KEY, allow_download=False, source="normalized")
+    return df.schema["memory"]
+
+
+def main() -> int:
+    with tempfile.TemporaryDirectory() as download_dir:
+        top500.set_download_dir(download_dir)
+        list_info = top500.Top500ListInfo(
+            key=KEY,
+            title="June 2025",
+            number=65,
+            published_on=datetime.date(2025, 6, 10),
+            published_at="",
+            url="https://top500.org/lists/top500/2025/06/",
+        )
+        raw_xml = fixtures.make_xml(0)
+        raw_excel = fixtures.make_excel(0)
+        top500._write_list_archive(
+            list_info,
+            ("TOP500_202506_all.xml", raw_xml),
+            ("TOP500_202506.xlsx", raw_excel),
+            top500._tsv_from_xml(raw_xml),
+            top500._tsv_from_excel(raw_excel),
+            Path(download_dir) / f"{KEY}.{top500.get_archive_format()}",
+        )
+        normalized_path = top500._get_normalized_list_path(KEY)
+
+        failures = []
+        if read_memory_dtype() != pl.Int64:
+            failures.append("The memory column is not Int64 before the change.")
+        if not top500._is_normalized_list_up_to_date(KEY):
+            failures.append("The first read did not write the normalized table.")
+
+        mappings = tuple(
+            dataclasses.replace(m, dtype=pl.Float64) if m.key == "memory" else m
+            for m in top500._get_normalized_column_mappings()
+        )
+        top500._get_normalized_column_mappings = lambda: mappings
+        top500._get_normalized_schema_sha256.cache_clear()
+        if top500._is_normalized_list_up_to_date(KEY):
+            failures.append(
+                "The normalized table is still up to date after the change."
+            )
+        if read_memory_dtype() != pl.Float64:
+            failures.append("The memory column is not Float64 after the change.")
+        if pl.read_ipc_schema(normalized_path)["memory"] != pl.Float64:
+            failures.append("The normalized table has not been rewritten.")
+        if not top500._is_normalized_list_up_to_date(KEY):
+            failures.append("The rewritten normalized table is not up to date.")
+    for failure in failures:
+        print(failure)
+    if failures:
+        return 1
+    print("The normalized table is rewritten after a change of the normalized schema.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
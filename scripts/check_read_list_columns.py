@@ -0,0 +1,81 @@
+#!/usr/bin/env python3
+"""
+Regression check for the column selection of `read_list()`.
+
+Writes a list built from the benchmark fixtures (see `benchmarks/fixtures.py`) to a temporary download dir and checks
+for every source that an empty selection is rejected with a ValueError and that a projected read returns the same
+columns as selecting them from the full table, also before the normalized table has been written. Exits with status 1
+on any difference.
+
+Usage:
+    python scripts/check_read_list_columns.py
+"""
+
+import datetime
+import sys
+import tempfile
+from pathlib import Path
+
+import top500
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "benchmarks"))
+import fixtures  # noqa: E402
+
+KEY = "2025-06"
+SELECTIONS = {
+    "normalized": (["r-max-gflops", "rank"], ["memory", "country", "rank"]),
+    "normalized-pretty": (["Rank", "System Name"],),
+    "xml": (["rank", "system-name"],),
+    "excel": (["Rank", "Memory"],),
+}
+
+
+def main() -> int:
+    failures = []
+    with tempfile.TemporaryDirectory() as download_dir:
+        top500.set_download_dir(download_dir)
+        list_info = top500.Top500ListInfo(
+            key=KEY,
+            title="June 2025",
+            number=65,
+            published_on=datetime.date(2025, 6, 10),
+            published_at="",
+            url="https://top500.org/lists/top500/2025/06/",
+        )
+        raw_xml = fixtures.make_xml(0)
+        raw_excel = fixtures.make_excel(0)
+        top500._write_list_archive(
+            list_info,
+            ("TOP500_202506_all.xml", raw_xml),
+            ("TOP500_202506.xlsx", raw_excel),
+            top500._tsv_from_xml(raw_xml),
+            top500._tsv_from_excel(raw_excel),
+            Path(download_dir) / f"{KEY}.{top500.get_archive_format()}",
+        )
+        for source, selections in SELECTIONS.items():
+            try:
+                top500.read_list(KEY, allow_download=False, source=source, columns=[])
+                failures.append(f'An empty selection of "{source}" was accepted.')
+            except ValueError:
+                pass
+            for columns in selections:
+                # Without the cache, the projected read is served from the files.
+                top500.clear_cache()
+                projected = top500.read_list(
+                    KEY, allow_download=False, source=source, columns=columns
+                )
+                full = top500.read_list(KEY, allow_download=False, source=source)
+                if not projected.equals(full.select(columns)):
+                    failures.append(
+                        f'The selection {columns} of "{source}" differs from the full table.'
+                    )
+    for failure in failures:
+        print(failure)
+    if failures:
+        return 1
+    print("The column selections are as expected.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -2,31 +2,47 @@
 top500. A TOP500 list downloader and dataloader for polars.
 """
 
+from __future__ import annotations
+
 import argparse
+import contextlib
 import csv
 import dataclasses
+import functools
+import hashlib
+import json
+import logging
 import os
 import re
-import shutil
+import sys
 import tarfile
 import tempfile
-from collections.abc import Buffer, Iterable
+import threading
+import time
+import zipfile
+from collections import OrderedDict
+from collections.abc import AsyncIterator, Callable, Collection, Iterable, Sequence
+from concurrent.futures import Executor
 from datetime import date, datetime
 from io import BytesIO, StringIO
 from pathlib import Path
 from tarfile import TarFile, TarInfo
-from typing import Iterator
+from types import ModuleType
+from typing import IO, TYPE_CHECKING, Iterator, Self
 from urllib.parse import urljoin
 
-import pandas as pd
 import platformdirs
-import polars as pl
 import pydantic
-import requests
-from bs4 import BeautifulSoup
-from bs4.element import Tag as HtmlTag
 from pydantic import HttpUrl, TypeAdapter
-from ratelimit import limits, sleep_and_retry
+
+# The heavy dependencies are imported in the functions that need them, so that `import top500` and simple CLI commands
+# like `top500 --help` start fast: pandas only for the Excel conversion, lxml only for the XML conversion, requests and
+# BeautifulSoup only for network operations and polars only when tables are read or displayed.
+if TYPE_CHECKING:
+    import polars as pl
+    import requests
+    from bs4.element import Tag as HtmlTag
+    from lxml import etree
 
 
 @pydantic.dataclasses.dataclass
@@ -79,18 +95,652 @@ def get_download_dir() -> Path:
     return _download_dir or _DEFAULT_DOWNLOAD_DIR
 
 
-@sleep_and_retry
-@limits(calls=1, period=1)
-def _fetch(url):
-    print(f"Fetching {url}...")
-    return requests.get(url)
+# The formats that list archives can be stored in, see `set_archive_format()`. If a list exists in more than one format
+# (e.g. after an interrupted migration), the first one is used.
+_ARCHIVE_FORMATS = ("zip", "tar.zst", "tar.gz")
+# The allowed and the default compression level by archive format.
+_COMPRESSION_LEVELS = {
+    "zip": range(10),
+    "tar.zst": range(1, 23),
+    "tar.gz": range(10),
+}
+_DEFAULT_COMPRESSION_LEVELS = {"zip": 6, "tar.zst": 3, "tar.gz": 6}
+_archive_format = "tar.gz"
+_compression_level: int | None = None
+
+
+def set_archive_format(
+    archive_format: str, compression_level: int | None = None
+) -> None:
+    """Set the format and the compression level of the archives that newly downloaded lists are stored in.
+
+    - "tar.gz" (the default) is a gzip-compressed tarball. Reading a single member (e.g. `from_xml.tsv`) decompresses
+      all members in front of it, including the large raw XML and Excel files.
+    - "tar.zst" is a zstd-compressed tarball. Like "tar.gz", but compression and decompression are several times
+      faster at about the same size. Requires Python 3.14 (`compression.zstd`) or the `zstandard` package.
+    - "zip" compresses every member separately and has a central directory, so that a single member can be read
+      without decompressing any other member. Members that are compressed already (the .xlsx files) are stored
+      without compressing them again.
+
+    Measured per list on synthetic lists with about 0.8 MB of members, see the `write_archive` and
+    `read_list[all,excel,uncached,...]` benchmarks in `benchmarks/run.py`:
+
+    | Format  | Level       | Size   | Write  | `read_list(..., source="excel")` |
+    |---------|-------------|--------|--------|----------------------------------|
+    | tar.gz  | 1           | 205 kB | 10 ms  | 9 ms                             |
+    | tar.gz  | 6 (default) | 174 kB | 18 ms  | 11 ms                            |
+    | tar.gz  | 9           | 169 kB | 46 ms  | 11 ms                            |
+    | tar.zst | 3 (default) | 177 kB | 4 ms   | 5 ms                             |
+    | tar.zst | 19          | 155 kB | 685 ms | 4 ms                             |
+    | zip     | 6 (default) | 173 kB | 12 ms  | 3 ms                             |
+
+    Lists in all formats can be read regardless of this setting; the format of an archive is detected from its content.
+    Existing lists can be converted via `migrate_local_lists()`.
+
+    Args:
+        archive_format (str): The archive format. Can be one of {"tar.gz", "tar.zst", "zip"}.
+        compression_level (int | None, optional): The compression level, 0-9 for "tar.gz" and "zip" and 1-22 for
+            "tar.zst". Higher levels result in smaller archives, but take longer to write. If None, the default level of
+            the format is used (6 for "tar.gz" and "zip", 3 for "tar.zst"). Defaults to None.
+
+    Raises:
+        ValueError: When the given archive format or compression level is invalid.
+        RuntimeError: When "tar.zst" is requested, but neither `compression.zstd` nor `zstandard` is available.
+    """
+    if archive_format not in _ARCHIVE_FORMATS:
+        raise ValueError(
+            f'archive_format "{archive_format}" not allowed. Must be in {set(_ARCHIVE_FORMATS)}.'
+        )
+    levels = _COMPRESSION_LEVELS[archive_format]
+    if compression_level is not None and compression_level not in levels:
+        raise ValueError(
+            f'compression_level {compression_level} not allowed for "{archive_format}". Must be in [{levels.start}, {levels.stop - 1}].'
+        )
+    if archive_format == "tar.zst":
+        _get_zstd_backend()
+    global _archive_format, _compression_level
+    _archive_format = archive_format
+    _compression_level = compression_level
+
+
+def get_archive_format() -> str:
+    """Get the format of the archives that newly downloaded lists are stored in.
+
+    Returns:
+        str: The archive format, see `set_archive_format()`.
+    """
+    return _archive_format
+
+
+def get_compression_level() -> int:
+    """Get the compression level of the archives that newly downloaded lists are stored in.
+
+    Returns:
+        int: The compression level, see `set_archive_format()`.
+    """
+    return _get_compression_level(_archive_format)
+
+
+def _get_compression_level(archive_format: str) -> int:
+    """Get the compression level for writing an archive in the given format."""
+    if archive_format == _archive_format and _compression_level is not None:
+        return _compression_level
+    return _DEFAULT_COMPRESSION_LEVELS[archive_format]
+
+
+def _get_zstd_backend() -> ModuleType:
+    """Get the module that provides zstd (de-)compression: `compression.zstd` on Python 3.14+, or else the optional
+    `zstandard` package.
+
+    Raises:
+        RuntimeError: When neither is available.
+    """
+    try:
+        from compression import zstd
+
+        return zstd
+    except ImportError:
+        pass
+    try:
+        import zstandard
+
+        return zstandard
+    except ImportError:
+        raise RuntimeError(
+            'The archive format "tar.zst" requires Python 3.14 or the package "zstandard" (install "top500[zstd]").'
+        ) from None
+
+
+@contextlib.contextmanager
+def _atomic_output(path: Path, durable: bool = False) -> Iterator[IO[bytes]]:
+    """Open a temporary file next to `path` for writing and move it to `path` once the block has been left.
+
+    Readers will either see the old file or the complete new file, but never a partially written one.
+
+    Args:
+        path (Path): The path of the file that shall be written.
+        durable (bool, optional): Wether the file and the directory entry shall be flushed to disk before returning,
+            so that the new file also survives a crash of the system. Defaults to False.
+    """
+    fd, tmp_name = tempfile.mkstemp(
+        dir=path.parent, prefix=f".{path.name}.", suffix=".tmp"
+    )
+    try:
+        with os.fdopen(fd, "wb") as f:
+            yield f
+            if durable:
+                f.flush()
+                os.fsync(f.fileno())
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+    if durable and os.name == "posix":
+        # The rename itself is only durable once the directory has been flushed as well.
+        dir_fd = os.open(path.parent, os.O_RDONLY)
+        try:
+            os.fsync(dir_fd)
+        finally:
+            os.close(dir_fd)
+
+
+@contextlib.contextmanager
+def _list_lock(key: str) -> Iterator[None]:
+    """Hold an exclusive lock on a list for writing its files, also across processes.
+
+    The lock is an advisory lock on the file `.<key>.lock` in the download directory. The file is kept after the lock
+    has been released, because removing it would allow two processes to lock different files for the same list.
+    """
+    if _download_dir is None:
+        _DEFAULT_DOWNLOAD_DIR.mkdir(exist_ok=True)
+    with open(get_download_dir() / f".{key}.lock", "a+b") as lock_fp:
+        if os.name == "nt":
+            import msvcrt
+
+            lock_fp.seek(0)
+            # LK_LOCK only retries for 10 seconds, so keep trying until the other process is done.
+            while True:
+                try:
+                    msvcrt.locking(lock_fp.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    continue
+        else:
+            import fcntl
+
+            fcntl.flock(lock_fp.fileno(), fcntl.LOCK_EX)
+        # The lock is released when the file is closed.
+        yield
+
+
+@dataclasses.dataclass(frozen=True)
+class StageEvent:
+    """A single timed stage of a download, conversion or read, as passed to the hooks of `add_profile_hook()`.
+
+    Stages can be nested, e.g. a "download" contains "fetch" and "convert-xml" stages, a "rebuild" contains the
+    "convert-xml" and "convert-excel" stages, and a "read" may contain a "normalize" stage.
+
+    Attributes:
+        stage (str): The name of the stage, e.g. "fetch", "rate-limit", "convert-excel" or "read".
+        duration (float): The wall time of the stage in seconds. For "rate-limit", this is the time slept.
+        counters (dict[str, float]): Stage specific counters, e.g. {"bytes": 1234, "rows": 500}.
+        detail (str | None): The URL or list key the stage worked on, if any.
+    """
+
+    stage: str
+    duration: float
+    counters: dict[str, float]
+    detail: str | None = None
+
+
+@dataclasses.dataclass
+class StageStats:
+    """The aggregated statistics of a stage, see `get_profile()`.
+
+    Attributes:
+        calls (int): The number of times the stage was run.
+        duration (float): The total wall time of the stage in seconds.
+        counters (dict[str, float]): The sums of the counters of the stage.
+    """
+
+    calls: int = 0
+    duration: float = 0.0
+    counters: dict[str, float] = dataclasses.field(default_factory=dict)
+
+
+_logger = logging.getLogger(__name__)
+_profile: dict[str, StageStats] = {}
+_profile_hooks: list[Callable[[StageEvent], None]] = []
+_profile_lock = threading.Lock()
+
+
+def add_profile_hook(hook: Callable[[StageEvent], None]) -> None:
+    """Register a function that is called with a `StageEvent` after every stage, e.g. to forward it to a tracer.
+
+    Hooks are called from the thread that ran the stage. Stages of conversions that run in a process pool (see
+    `download_all_lists()`) are reported once the result has been received. Exceptions raised by a hook are logged and
+    otherwise ignored.
+
+    Args:
+        hook (Callable[[StageEvent], None]): The function to call.
+    """
+    with _profile_lock:
+        _profile_hooks.append(hook)
+
+
+def remove_profile_hook(hook: Callable[[StageEvent], None]) -> None:
+    """Unregister a function that was registered with `add_profile_hook()`.
+
+    Args:
+        hook (Callable[[StageEvent], None]): The function to unregister.
+
+    Raises:
+        ValueError: When the function is not registered.
+    """
+    with _profile_lock:
+        _profile_hooks.remove(hook)
+
+
+def get_profile() -> dict[str, StageStats]:
+    """Get the aggregated statistics of all stages since the start or the last `reset_profile()`.
+
+    Returns:
+        dict[str, StageStats]: The statistics per stage name, in the order in which the stages were first run.
+    """
+    with _profile_lock:
+        return {
+            stage: dataclasses.replace(stats, counters=dict(stats.counters))
+            for stage, stats in _profile.items()
+        }
+
+
+def reset_profile() -> None:
+    """Reset the statistics returned by `get_profile()`."""
+    with _profile_lock:
+        _profile.clear()
+
+
+def _record_stage(event: StageEvent) -> None:
+    with _profile_lock:
+        stats = _profile.setdefault(event.stage, StageStats())
+        stats.calls += 1
+        stats.duration += event.duration
+        for name, value in event.counters.items():
+            stats.counters[name] = stats.counters.get(name, 0) + value
+        hooks = list(_profile_hooks)
+    _logger.debug(
+        "%s%s took %.3f s %s",
+        event.stage,
+        f" ({event.detail})" if event.detail else "",
+        event.duration,
+        event.counters,
+    )
+    for hook in hooks:
+        try:
+            hook(event)
+        except Exception:
+            _logger.exception("Profile hook %r failed.", hook)
+
+
+@contextlib.contextmanager
+def _stage(stage: str, detail: str | None = None) -> Iterator[dict[str, float]]:
+    """Time the block as the given stage. The block may fill the yielded dict with counters."""
+    counters: dict[str, float] = {}
+    start = time.perf_counter()
+    try:
+        yield counters
+    finally:
+        _record_stage(StageEvent(stage, time.perf_counter() - start, counters, detail))
+
+
+def _call_with_stages[T](
+    function: Callable[..., T], *args
+) -> tuple[T, list[StageEvent]]:
+    """Call `function` and return its result together with the stages it ran.
+
+    Used for work that is submitted to a process pool, whose stages would otherwise only be recorded in the worker.
+    """
+    events: list[StageEvent] = []
+    add_profile_hook(events.append)
+    try:
+        return function(*args), events
+    finally:
+        remove_profile_hook(events.append)
+
+
+@dataclasses.dataclass(frozen=True)
+class HttpSettings:
+    """Settings for the requests towards top500.org. Use `dataclasses.replace()` to derive modified settings.
+
+    Attributes:
+        overview_url (str): The page listing all list issues.
+        timeout (float): Connect and read timeout per request in seconds.
+        retries (int): Number of retries on connection errors and on the status codes 429, 500, 502, 503 and 504.
+            Every retry waits for the rate limit like any other request.
+        backoff_factor (float): Retry number n waits `backoff_factor * 2**(n-1)` seconds, or as long as the
+            `Retry-After` header of the failed response asks for if that is longer.
+        requests_per_second (float): Average request rate, shared by all threads.
+        burst (int): Number of requests that may be sent at once after being idle.
+        cache_dir (Path): Directory for cached responses.
+        catalog_ttl (float): Seconds for which the result of `iter_lists_online()` is cached.
+    """
+
+    overview_url: str = "https://top500.org/lists/top500/"
+    timeout: float = 30.0
+    retries: int = 3
+    backoff_factor: float = 1.0
+    requests_per_second: float = 1.0
+    burst: int = 1
+    cache_dir: Path = (
+        Path(platformdirs.user_cache_dir("top500", "felsenhower")) / "http"
+    )
+    catalog_ttl: float = 24 * 60 * 60
+
+
+class _TokenBucket:
+    """A thread-safe token bucket rate limiter.
+
+    Every request takes a token; tokens are refilled at `rate` per second up to `capacity`. When no token is available,
+    the caller reserves the next one and sleeps until it has been refilled, so waiting callers are served in order.
+    """
+
+    def __init__(self, rate: float, capacity: int):
+        self._rate = rate
+        self._capacity = capacity
+        self._tokens = float(capacity)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def reserve(self) -> float:
+        """Take a token without waiting for it.
+
+        Returns:
+            float: The time in seconds the caller has to wait before it may send its request.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self._capacity, self._tokens + (now - self._updated) * self._rate
+            )
+            self._updated = now
+            self._tokens -= 1
+            return -self._tokens / self._rate if self._tokens < 0 else 0.0
+
+    def acquire(self) -> float:
+        """Take a token, sleeping if necessary.
+
+        Returns:
+            float: The time slept in seconds.
+        """
+        wait = self.reserve()
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire_async(self) -> float:
+        """Take a token, awaiting `asyncio.sleep()` if necessary instead of blocking the thread.
+
+        Returns:
+            float: The time waited in seconds.
+        """
+        import asyncio
+
+        wait = self.reserve()
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+
+_http_settings = HttpSettings()
+_http_lock = threading.Lock()
+_http_session: requests.Session | None = None
+_rate_limiter = _TokenBucket(_http_settings.requests_per_second, _http_settings.burst)
+
+
+def set_http_settings(settings: HttpSettings) -> None:
+    """Set the settings for the requests towards top500.org.
+
+    Args:
+        settings (HttpSettings): The new settings.
+
+    Raises:
+        ValueError: When the given settings are invalid.
+    """
+    if settings.timeout <= 0:
+        raise ValueError("timeout must be positive.")
+    if settings.retries < 0:
+        raise ValueError("retries must not be negative.")
+    if settings.requests_per_second <= 0:
+        raise ValueError("requests_per_second must be positive.")
+    if settings.burst < 1:
+        raise ValueError("burst must be at least 1.")
+    if settings.catalog_ttl < 0:
+        raise ValueError("catalog_ttl must not be negative.")
+    global _http_settings, _http_session, _rate_limiter
+    with _http_lock:
+        _http_settings = settings
+        if _http_session is not None:
+            _http_session.close()
+        _http_session = None
+        _rate_limiter = _TokenBucket(settings.requests_per_second, settings.burst)
+
+
+def get_http_settings() -> HttpSettings:
+    """Get the settings for the requests towards top500.org.
+
+    Returns:
+        HttpSettings: The current settings.
+    """
+    return _http_settings
+
+
+def _get_http_session() -> requests.Session:
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    global _http_session
+    with _http_lock:
+        if _http_session is None:
+            # Retries are sent by `_http_get()`, so that each of them waits for the rate limit.
+            adapter = HTTPAdapter(max_retries=0, pool_maxsize=16)
+            session = requests.Session()
+            session.mount("http://", adapter)
+            session.mount("https://", adapter)
+            _http_session = session
+        return _http_session
+
+
+@dataclasses.dataclass
+class _FetchResult:
+    url: str
+    content: bytes
+    etag: str | None
+    last_modified: str | None
+    from_cache: bool  # True when the server answered "304 Not Modified" and the content is from the cache
+
+
+def _get_http_cache_paths(url: str) -> tuple[Path, Path]:
+    name = hashlib.sha256(url.encode("utf-8")).hexdigest()
+    cache_dir = _http_settings.cache_dir
+    return cache_dir / f"{name}.json", cache_dir / f"{name}.body"
+
+
+_RETRY_STATUS_CODES = (429, 500, 502, 503, 504)
+
+
+def _http_get(
+    url: str, headers: dict[str, str], wait_for_rate_limit: bool = True
+) -> requests.Response:
+    """Send a GET request via the shared session. Does not raise on error statuses.
+
+    Connection errors and the status codes in `_RETRY_STATUS_CODES` are retried as configured in `HttpSettings`. Every
+    attempt waits for the rate limit first, except for the first one if `wait_for_rate_limit` is False (because the
+    caller has already taken a token, see `_afetch()`).
+    """
+    import requests
+
+    settings = _http_settings
+    attempt = 0
+    while True:
+        if wait_for_rate_limit or attempt > 0:
+            slept = _rate_limiter.acquire()
+            _record_stage(StageEvent("rate-limit", slept, {}, url))
+        print(f"Fetching {url}...")
+        response = None
+        try:
+            with _stage("fetch", url) as counters:
+                response = _get_http_session().get(
+                    url, headers=headers, timeout=settings.timeout
+                )
+                counters["bytes"] = len(response.content)
+                counters["not_modified"] = int(response.status_code == 304)
+        except (requests.ConnectionError, requests.Timeout):
+            if attempt >= settings.retries:
+                raise
+        else:
+            if (
+                response.status_code not in _RETRY_STATUS_CODES
+                or attempt >= settings.retries
+            ):
+                return response
+        attempt += 1
+        backoff = settings.backoff_factor * 2 ** (attempt - 1)
+        retry_after = (
+            response.headers.get("Retry-After", "") if response is not None else ""
+        )
+        if retry_after.isdigit():
+            backoff = max(backoff, int(retry_after))
+        time.sleep(backoff)
+
+
+def _fetch_if_changed(
+    url: str, etag: str | None, last_modified: str | None
+) -> _FetchResult | None:
+    """Fetch a resource from top500.org unless it is unchanged according to the given HTTP validators.
+
+    Unlike `_fetch(url, use_cache=True)`, the response is not cached; the caller keeps the validators and the content.
+
+    Args:
+        url (str): The URL to fetch.
+        etag (str | None): The ETag of the known version of the resource.
+        last_modified (str | None): The Last-Modified header of the known version of the resource.
+
+    Raises:
+        requests.HTTPError: When the server answered with an error status, even after retrying.
+
+    Returns:
+        _FetchResult | None: The fetched resource, or None when the server answered "304 Not Modified".
+    """
+    headers = {}
+    if etag:
+        headers["If-None-Match"] = etag
+    if last_modified:
+        headers["If-Modified-Since"] = last_modified
+    response = _http_get(url, headers)
+    if response.status_code == 304:
+        return None
+    response.raise_for_status()
+    return _FetchResult(
+        url=url,
+        content=response.content,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        from_cache=False,
+    )
+
+
+def _fetch(
+    url: str | HttpUrl, use_cache: bool = False, wait_for_rate_limit: bool = True
+) -> _FetchResult:
+    """Fetch a resource from top500.org, respecting the rate limit.
+
+    Connections are pooled in a shared session; failed requests are retried with exponential backoff (see
+    `HttpSettings`).
+
+    Args:
+        url (str | HttpUrl): The URL to fetch.
+        use_cache (bool, optional): Wether the response shall be cached on disk together with its ETag and
+            Last-Modified headers. When a cached response exists, the request is made conditional, so that unchanged
+            resources come back as a cheap "304 Not Modified". Defaults to False.
+        wait_for_rate_limit (bool, optional): Wether to wait for the rate limit. Only False when the caller has
+            already taken a token. Defaults to True.
+
+    Raises:
+        requests.HTTPError: When the server answered with an error status, even after retrying.
+
+    Returns:
+        _FetchResult: The fetched resource.
+    """
+    url = str(url)
+    headers = {}
+    cached_meta = None
+    if use_cache:
+        meta_path, body_path = _get_http_cache_paths(url)
+        try:
+            cached_meta = json.loads(meta_path.read_bytes())
+        except (OSError, ValueError):
+            cached_meta = None
+        if cached_meta is not None:
+            if cached_meta.get("etag"):
+                headers["If-None-Match"] = cached_meta["etag"]
+            if cached_meta.get("last_modified"):
+                headers["If-Modified-Since"] = cached_meta["last_modified"]
+    response = _http_get(url, headers, wait_for_rate_limit)
+    if response.status_code == 304 and cached_meta is not None:
+        try:
+            content = body_path.read_bytes()
+        except OSError:
+            # The cache was damaged in the meantime, so fetch the resource unconditionally.
+            return _fetch(url, use_cache=False)
+        return _FetchResult(
+            url=url,
+            content=content,
+            etag=cached_meta.get("etag"),
+            last_modified=cached_meta.get("last_modified"),
+            from_cache=True,
+        )
+    response.raise_for_status()
+    result = _FetchResult(
+        url=url,
+        content=response.content,
+        etag=response.headers.get("ETag"),
+        last_modified=response.headers.get("Last-Modified"),
+        from_cache=False,
+    )
+    if use_cache and (result.etag or result.last_modified):
+        meta = {"url": url, "etag": result.etag, "last_modified": result.last_modified}
+        try:
+            meta_path.parent.mkdir(parents=True, exist_ok=True)
+            with _atomic_output(body_path) as f:
+                f.write(result.content)
+            with _atomic_output(meta_path) as f:
+                f.write(json.dumps(meta).encode("utf-8"))
+        except OSError:
+            # The cache is optional, so an unwritable cache directory is not an error.
+            pass
+    return result
+
+
+async def _afetch(url: str | HttpUrl, use_cache: bool = False) -> _FetchResult:
+    """Like `_fetch()`, but for the asyncio API.
+
+    The rate limit is awaited on the event loop and shared with `_fetch()`, so concurrent coroutines and threads stay
+    within the same request budget. Only the request itself (and the disk cache) is run in a worker thread, so no
+    thread is blocked while waiting for the rate limit.
+    """
+    import asyncio
+
+    slept = await _rate_limiter.acquire_async()
+    _record_stage(StageEvent("rate-limit", slept, {}, str(url)))
+    return await asyncio.to_thread(_fetch, url, use_cache, False)
 
 
-_TOP500_OVERVIEW_URL = HttpUrl("https://top500.org/lists/top500/")
 _RE_LIST_NAME = re.compile(r"^(?:June)|(?:November) [0-9]{4}$")
 _RE_LIST_HREF = re.compile(r"^([0-9]{4})/([0-9]{2})$")
 _RE_LIST_KEY = re.compile(r"^([0-9]{4})-([0-9]{2})$")
-_RE_DOWNLOADED_LIST_FILE = re.compile(r"^([0-9]{4})-([0-9]{2})\.tar\.gz$")
+_RE_DOWNLOADED_LIST_FILE = re.compile(
+    r"^([0-9]{4})-([0-9]{2})\.(?:tar\.gz|tar\.zst|zip)$"
+)
 _RE_LIST_DESCRIPTION = re.compile(
     r"""
     ^
@@ -170,67 +820,133 @@ class NormalizedColumnMapping:
     names_in_source: tuple[str, ...]
 
 
-# fmt: off
-_NORMALIZED_COLUMN_MAPPINGS = (
-    NormalizedColumnMapping("Rank", "rank", pl.Int64, "xml", ("rank",)),
-    NormalizedColumnMapping("Previous Rank", "previous-rank", pl.Int64, "excel", ("Previous Rank",)),
-    NormalizedColumnMapping("First Appearance", "first-appearance", pl.Int64, "excel", ("First Appearance",)),
-    NormalizedColumnMapping("First Rank", "first-rank", pl.Int64, "excel", ("First Rank",)),
-    NormalizedColumnMapping("System Name", "name", pl.String, "xml", ("system-name",)),
-    NormalizedColumnMapping("System ID", "system-id", pl.Int64, "xml", ("system-id",)),
-    NormalizedColumnMapping("System Address", "system-address", pl.String, "xml", ("system-address",)),
-    NormalizedColumnMapping("System Model", "system-model", pl.String, "excel", ("System Model",)),
-    NormalizedColumnMapping("System Family", "system-family", pl.String, "excel", ("System Family",)),
-    NormalizedColumnMapping("Computer", "computer", pl.String, "xml", ("computer",)),
-    NormalizedColumnMapping("Manufacturer", "manufacturer", pl.String, "xml", ("manufacturer",)),
-    NormalizedColumnMapping("Architecture", "architecture", pl.String, "excel", ("architecture",)),
-    NormalizedColumnMapping("Processor", "processor", pl.String, "excel", ("processor",)),
-    NormalizedColumnMapping("Processor Family", "processor-family", pl.String, "excel", ("Processor Family",)),
-    NormalizedColumnMapping("Processor Technology", "processor-technology", pl.String, "excel", ("Processor Technology",)),
-    NormalizedColumnMapping("Processor Generation", "processor-generation", pl.String, "excel", ("Processor Generation",)),
-    NormalizedColumnMapping("Processor Speed [Mhz]", "processor-speed-mhz", pl.Int64, "excel", ("Processor Speed (MHz)", "Proc. Frequency",)),
-    NormalizedColumnMapping("Accelerator/Co-Processor", "accelerator", pl.String, "excel", ("Accelerator/Co-Processor", "Accelerator",)),
-    NormalizedColumnMapping("Operating System", "operating-system", pl.String, "excel", ("Operating System",)),
-    NormalizedColumnMapping("OS Family", "os-family", pl.String, "excel", ("OS Family",)),
-    NormalizedColumnMapping("Total Cores", "total-cores", pl.Int64, "xml", ("number-of-processors",)),
-    NormalizedColumnMapping("Cores Per Socket", "cores-per-socket", pl.Int64, "excel", ("Cores per Socket",)),
-    NormalizedColumnMapping("Accelerator/Co-Processor Cores", "accelerator-cores", pl.Int64, "excel", ("Accelerator/Co-Processor Cores", "Accelerator Cores",)),
-    NormalizedColumnMapping("Memory", "memory", pl.Int64, "excel", ("Memory",)),
-    NormalizedColumnMapping("Rmax [GFlop/s]", "r-max-gflops", pl.Float64, "xml", ("r-max",)),
-    NormalizedColumnMapping("Power [kW]", "power-kw", pl.Float64, "xml", ("power",)),
-    NormalizedColumnMapping("Power Source", "power-source", pl.String, "excel", ("Power Source",)),
-    NormalizedColumnMapping("Rpeak [GFlop/s]", "rpeak-gflops", pl.Float64, "xml", ("r-peak",)),
-    NormalizedColumnMapping("Nmax", "n-max", pl.Int64, "excel", ("Nmax",)),
-    NormalizedColumnMapping("Nhalf", "n-half", pl.Int64, "excel", ("Nhalf",)),
-    NormalizedColumnMapping("HPCG [TFlop/s]", "hpcg-tflops", pl.Float64, "excel", ("HPCG [TFlop/s]",)),
-    NormalizedColumnMapping("Energy Efficiency [GFlop/W]", "energy-efficiency-gflopw", pl.Float64, "excel", ("Energy Efficiency [GFlops/Watts]", "Power Efficiency [GFlops/Watts]", "Power Effeciency [GFlops/Watts]",)),
-    NormalizedColumnMapping("Efficiency [%]", "efficiency-percent", pl.Float64, "excel", ("Efficiency (%)", "Effeciency (%)",)),
-    NormalizedColumnMapping("Measured Size", "measured-size", pl.Int64, "excel", ("Measured Size",)),
-    NormalizedColumnMapping("Interconnect Family", "interconnect-family", pl.String, "excel",("Interconnect Family",)),
-    NormalizedColumnMapping("Interconnect", "interconnect", pl.String, "excel", ("Interconnect",)),
-    NormalizedColumnMapping("Site Name", "site", pl.String, "xml", ("installation-site-name",)),
-    NormalizedColumnMapping("Site Address", "site-address", pl.String, "xml", ("installation-site-address",)),
-    NormalizedColumnMapping("Site ID", "site-id", pl.Int64, "xml", ("site-id",)),
-    NormalizedColumnMapping("Segment", "segment", pl.String, "excel", ("Segment",)),
-    NormalizedColumnMapping("Town", "town", pl.String, "xml", ("town",)),
-    NormalizedColumnMapping("State", "state", pl.String, "xml", ("state",)),
-    NormalizedColumnMapping("Country", "country", pl.String, "xml", ("country",)),
-    NormalizedColumnMapping("Region", "region", pl.String, "excel", ("Region",)),
-    NormalizedColumnMapping("Continent", "continent", pl.String, "excel", ("Continent",)),
-    NormalizedColumnMapping("Year", "year", pl.Int64, "xml", ("year",)),
-)
-# fmt: on
+@functools.cache
+def _get_normalized_column_mappings() -> tuple[NormalizedColumnMapping, ...]:
+    import polars as pl
+
+    # fmt: off
+    return (
+        NormalizedColumnMapping("Rank", "rank", pl.Int64, "xml", ("rank",)),
+        NormalizedColumnMapping("Previous Rank", "previous-rank", pl.Int64, "excel", ("Previous Rank",)),
+        NormalizedColumnMapping("First Appearance", "first-appearance", pl.Int64, "excel", ("First Appearance",)),
+        NormalizedColumnMapping("First Rank", "first-rank", pl.Int64, "excel", ("First Rank",)),
+        NormalizedColumnMapping("System Name", "name", pl.String, "xml", ("system-name",)),
+        NormalizedColumnMapping("System ID", "system-id", pl.Int64, "xml", ("system-id",)),
+        NormalizedColumnMapping("System Address", "system-address", pl.String, "xml", ("system-address",)),
+        NormalizedColumnMapping("System Model", "system-model", pl.String, "excel", ("System Model",)),
+        NormalizedColumnMapping("System Family", "system-family", pl.String, "excel", ("System Family",)),
+        NormalizedColumnMapping("Computer", "computer", pl.String, "xml", ("computer",)),
+        NormalizedColumnMapping("Manufacturer", "manufacturer", pl.String, "xml", ("manufacturer",)),
+        NormalizedColumnMapping("Architecture", "architecture", pl.String, "excel", ("architecture",)),
+        NormalizedColumnMapping("Processor", "processor", pl.String, "excel", ("processor",)),
+        NormalizedColumnMapping("Processor Family", "processor-family", pl.String, "excel", ("Processor Family",)),
+        NormalizedColumnMapping("Processor Technology", "processor-technology", pl.String, "excel", ("Processor Technology",)),
+        NormalizedColumnMapping("Processor Generation", "processor-generation", pl.String, "excel", ("Processor Generation",)),
+        NormalizedColumnMapping("Processor Speed [Mhz]", "processor-speed-mhz", pl.Int64, "excel", ("Processor Speed (MHz)", "Proc. Frequency",)),
+        NormalizedColumnMapping("Accelerator/Co-Processor", "accelerator", pl.String, "excel", ("Accelerator/Co-Processor", "Accelerator",)),
+        NormalizedColumnMapping("Operating System", "operating-system", pl.String, "excel", ("Operating System",)),
+        NormalizedColumnMapping("OS Family", "os-family", pl.String, "excel", ("OS Family",)),
+        NormalizedColumnMapping("Total Cores", "total-cores", pl.Int64, "xml", ("number-of-processors",)),
+        NormalizedColumnMapping("Cores Per Socket", "cores-per-socket", pl.Int64, "excel", ("Cores per Socket",)),
+        NormalizedColumnMapping("Accelerator/Co-Processor Cores", "accelerator-cores", pl.Int64, "excel", ("Accelerator/Co-Processor Cores", "Accelerator Cores",)),
+        NormalizedColumnMapping("Memory", "memory", pl.Int64, "excel", ("Memory",)),
+        NormalizedColumnMapping("Rmax [GFlop/s]", "r-max-gflops", pl.Float64, "xml", ("r-max",)),
+        NormalizedColumnMapping("Power [kW]", "power-kw", pl.Float64, "xml", ("power",)),
+        NormalizedColumnMapping("Power Source", "power-source", pl.String, "excel", ("Power Source",)),
+        NormalizedColumnMapping("Rpeak [GFlop/s]", "rpeak-gflops", pl.Float64, "xml", ("r-peak",)),
+        NormalizedColumnMapping("Nmax", "n-max", pl.Int64, "excel", ("Nmax",)),
+        NormalizedColumnMapping("Nhalf", "n-half", pl.Int64, "excel", ("Nhalf",)),
+        NormalizedColumnMapping("HPCG [TFlop/s]", "hpcg-tflops", pl.Float64, "excel", ("HPCG [TFlop/s]",)),
+        NormalizedColumnMapping("Energy Efficiency [GFlop/W]", "energy-efficiency-gflopw", pl.Float64, "excel", ("Energy Efficiency [GFlops/Watts]", "Power Efficiency [GFlops/Watts]", "Power Effeciency [GFlops/Watts]",)),
+        NormalizedColumnMapping("Efficiency [%]", "efficiency-percent", pl.Float64, "excel", ("Efficiency (%)", "Effeciency (%)",)),
+        NormalizedColumnMapping("Measured Size", "measured-size", pl.Int64, "excel", ("Measured Size",)),
+        NormalizedColumnMapping("Interconnect Family", "interconnect-family", pl.String, "excel",("Interconnect Family",)),
+        NormalizedColumnMapping("Interconnect", "interconnect", pl.String, "excel", ("Interconnect",)),
+        NormalizedColumnMapping("Site Name", "site", pl.String, "xml", ("installation-site-name",)),
+        NormalizedColumnMapping("Site Address", "site-address", pl.String, "xml", ("installation-site-address",)),
+        NormalizedColumnMapping("Site ID", "site-id", pl.Int64, "xml", ("site-id",)),
+        NormalizedColumnMapping("Segment", "segment", pl.String, "excel", ("Segment",)),
+        NormalizedColumnMapping("Town", "town", pl.String, "xml", ("town",)),
+        NormalizedColumnMapping("State", "state", pl.String, "xml", ("state",)),
+        NormalizedColumnMapping("Country", "country", pl.String, "xml", ("country",)),
+        NormalizedColumnMapping("Region", "region", pl.String, "excel", ("Region",)),
+        NormalizedColumnMapping("Continent", "continent", pl.String, "excel", ("Continent",)),
+        NormalizedColumnMapping("Year", "year", pl.Int64, "xml", ("year",)),
+    )
+    # fmt: on
 
 
-def iter_lists_online(newest_first: bool = True) -> Iterator[Top500ListInfo]:
-    """Iterate over the TOP500 list issues that are available online.
+# The low-cardinality string columns of the normalized table, which are `pl.Categorical` in the compact schema (see
+# `set_compact_schema()`).
+_COMPACT_COLUMNS = frozenset(
+    (
+        "manufacturer", "architecture", "processor-family", "os-family", "power-source", "interconnect-family",
+        "segment", "country", "region", "continent",
+    )
+)  # fmt: skip
+_compact_schema = False
+
+
+def set_compact_schema(enabled: bool) -> None:
+    """Set wether normalized tables shall use the compact schema.
+
+    In the compact schema, the low-cardinality string columns (`manufacturer`, `architecture`, `processor-family`,
+    `os-family`, `power-source`, `interconnect-family`, `segment`, `country`, `region` and `continent`) are
+    `pl.Categorical` instead of `pl.String`. Every distinct string is then stored once instead of once per row, and
+    group-bys on these columns compare integers instead of hashing strings. Polars shares the categories globally, so
+    tables of different lists can still be concatenated and compared. The values are the same in both schemas.
+
+    Affects the sources "normalized" and "normalized-pretty" of `read_list()`, `read_lists()` and `scan_lists()`.
+    Disabled by default.
 
     Args:
-        newest_first (bool, optional): Wether the lists shall be sorted newest-first. Defaults to True.
+        enabled (bool): Wether the compact schema shall be used.
+    """
+    global _compact_schema
+    _compact_schema = enabled
 
-    Yields:
-        Iterator[Top500ListInfo]: An iterator over Top500ListInfo.
+
+def get_compact_schema() -> bool:
+    """Get wether normalized tables use the compact schema, see `set_compact_schema()`.
+
+    Returns:
+        bool: Wether the compact schema is used.
     """
+    return _compact_schema
+
+
+def _get_normalized_schema(compact: bool) -> dict[str, pl.DataType]:
+    """Get the schema of the normalized table, optionally with the compact dtypes (see `set_compact_schema()`)."""
+    import polars as pl
+
+    return {
+        m.key: pl.Categorical() if compact and m.key in _COMPACT_COLUMNS else m.dtype
+        for m in _get_normalized_column_mappings()
+    }
+
+
+def _to_compact_schema[F: (pl.DataFrame, pl.LazyFrame)](df: F) -> F:
+    """Cast the low-cardinality columns of a normalized table to `pl.Categorical`."""
+    import polars as pl
+
+    columns = df.collect_schema().names()
+    return df.cast(
+        {key: pl.Categorical() for key in _COMPACT_COLUMNS if key in columns}
+    )
+
+
+def _scrape_lists_online() -> Iterator[Top500ListInfo]:
+    """Scrape the TOP500 list issues from the overview page, newest-first."""
+    overview_url = get_http_settings().overview_url
+    response = _fetch(overview_url, use_cache=True)
+    yield from _parse_lists_overview(response.content, overview_url)
+
+
+def _parse_lists_overview(
+    content: bytes, overview_url: str
+) -> Iterator[Top500ListInfo]:
+    """Parse the TOP500 list issues from the content of the overview page, newest-first."""
+    from bs4 import BeautifulSoup
 
     def parse_date(date_str: str) -> date:
         for fmt in ("%B %d, %Y", "%b %d, %Y", "%b. %d, %Y"):
@@ -258,13 +974,9 @@ def iter_lists_online(newest_first: bool = True) -> Iterator[Top500ListInfo]:
                 return f"{place_str}, USA"
         raise ValueError(f'Unrecognized place "{place_str}"')
 
-    response = _fetch(_TOP500_OVERVIEW_URL)
-    response.raise_for_status()
-    html = BeautifulSoup(response.text, "html.parser")
+    html = BeautifulSoup(content, "html.parser")
     ul_lists = html.find(id="squarelist")
     list_items = ul_lists.find_all("li")
-    if not newest_first:
-        list_items = reversed(list_items)
     for li in list_items:
         headers = li.find_all("h3")
         assert len(headers) == 1, ("More than one <h3> inside <li>", headers, li)
@@ -279,7 +991,7 @@ def iter_lists_online(newest_first: bool = True) -> Iterator[Top500ListInfo]:
         m = _RE_LIST_HREF.match(href)
         assert m is not None, ("Unexpected link href", href)
         list_id = f"{m[1]}-{m[2]}"
-        full_list_url = HttpUrl(urljoin(str(_TOP500_OVERVIEW_URL), href))
+        full_list_url = HttpUrl(urljoin(overview_url, href))
         paragraphs = li.find_all("p")
         assert len(paragraphs) == 1, ("More than one <p> inside <li>", paragraphs, li)
         paragraph = paragraphs[0]
@@ -299,324 +1011,2832 @@ def iter_lists_online(newest_first: bool = True) -> Iterator[Top500ListInfo]:
         )
 
 
-def iter_lists_local(newest_first: bool = True) -> Iterator[Top500ListInfo]:
-    """Iterate over the TOP500 list issues that are available locally in the download directory.
+_LIST_INFOS_ADAPTER = TypeAdapter(list[Top500ListInfo])
+
+
+def _get_catalog_path() -> Path:
+    return get_http_settings().cache_dir / "catalog.json"
+
+
+def _get_online_catalog(refresh: bool = False) -> list[Top500ListInfo]:
+    """Get the TOP500 list issues that are available online, newest-first.
+
+    The scraped list infos are cached on disk and served from there until they are older than
+    `HttpSettings.catalog_ttl`.
 
     Args:
-        newest_first (bool, optional): Wether the lists shall be sorted newest-first. Defaults to True.
+        refresh (bool, optional): Wether the overview page shall be scraped even if the cache is still fresh. Defaults
+            to False.
 
-    Yields:
-        Iterator[Top500ListInfo]: An iterator over Top500ListInfo.
+    Returns:
+        list[Top500ListInfo]: The list infos.
     """
-    if _download_dir is None and not _DEFAULT_DOWNLOAD_DIR.exists():
-        return
-    for path in sorted(get_download_dir().iterdir(), reverse=newest_first):
-        if not _RE_DOWNLOADED_LIST_FILE.match(path.name):
-            continue
-        with tarfile.open(path, "r:gz") as tar:
-            meta_member = tar.getmember("metadata.json")
-            meta_fp = tar.extractfile(meta_member)
-            assert meta_fp is not None
-            adapter = TypeAdapter(Top500ListInfo)
-            list_info = adapter.validate_json(meta_fp.read())
-            yield list_info
+    catalog = None if refresh else _load_cached_catalog()
+    if catalog is None:
+        catalog = list(_scrape_lists_online())
+        _store_cached_catalog(catalog)
+    return catalog
 
 
-def _get_key(list_info_or_key: str | Top500ListInfo) -> str:
-    if isinstance(list_info_or_key, str):
-        key = list_info_or_key
-        assert _RE_LIST_KEY.match(key)
-        return key
-    if isinstance(list_info_or_key, Top500ListInfo):
-        key = list_info_or_key.key
-        assert _RE_LIST_KEY.match(key)
-        return key
-    raise ValueError(
-        f"list_info_or_key must be either str or Top500ListInfo, passed {type(list_info_or_key)}"
-    )
+async def _aget_online_catalog(refresh: bool = False) -> list[Top500ListInfo]:
+    """Like `_get_online_catalog()`, but for the asyncio API."""
+    import asyncio
 
+    catalog = None if refresh else await asyncio.to_thread(_load_cached_catalog)
+    if catalog is None:
+        overview_url = get_http_settings().overview_url
+        response = await _afetch(overview_url, use_cache=True)
 
-def _get_list_info_from_key(key: str) -> Top500ListInfo:
-    print(
-        "Warning: When downloading multiple lists at once, it is not recommended to specify it using only its key."
-        + "Pass a Top500ListInfo instead!"
-    )
-    assert _RE_LIST_KEY.match(key)
-    for list_info in iter_lists_online():
-        if list_info.key == key:
-            return list_info
-    raise RuntimeError(f'List info for key "{key}" was not found online.')
+        def parse_and_store() -> list[Top500ListInfo]:
+            catalog = list(_parse_lists_overview(response.content, overview_url))
+            _store_cached_catalog(catalog)
+            return catalog
 
+        catalog = await asyncio.to_thread(parse_and_store)
+    return catalog
 
-def _get_list_info(list_info_or_key: str | Top500ListInfo) -> Top500ListInfo:
-    if isinstance(list_info_or_key, str):
-        key = list_info_or_key
-        list_info = _get_list_info_from_key(key)
-        return list_info
-    if isinstance(list_info_or_key, Top500ListInfo):
-        list_info = list_info_or_key
-        return list_info
-    raise ValueError(
-        f"list_info_or_key must be either str or Top500ListInfo, passed {type(list_info_or_key)}"
-    )
 
+def _load_cached_catalog() -> list[Top500ListInfo] | None:
+    """Load the cached catalog, if it is younger than `HttpSettings.catalog_ttl`."""
+    catalog_path = _get_catalog_path()
+    try:
+        age = time.time() - catalog_path.stat().st_mtime
+        if age < get_http_settings().catalog_ttl:
+            return _LIST_INFOS_ADAPTER.validate_json(catalog_path.read_bytes())
+    except (OSError, pydantic.ValidationError):
+        pass
+    return None
 
-def download_list(list_info_or_key: str | Top500ListInfo) -> None:
-    """Download a TOP500 list issue. If the list is already present locally, it will not be downloaded again.
 
-    This will create a `.tar.gz` file (e.g. `2025-06.tar.gz`) containing for example
-    ```
-    ├── metadata.json (the list info as json)
-    ├── TOP500_202506_all.tsv (the XML file below converted to tsv)
-    ├── TOP500_202506_all.xml (the downloaded XML file)
-    ├── TOP500_202506.tsv (the Excel file below converted to tsv)
-    └── TOP500_202506.xlsx (the downloaded Excel file)
-    ```
+def _store_cached_catalog(catalog: list[Top500ListInfo]) -> None:
+    catalog_path = _get_catalog_path()
+    try:
+        catalog_path.parent.mkdir(parents=True, exist_ok=True)
+        with _atomic_output(catalog_path) as f:
+            f.write(_LIST_INFOS_ADAPTER.dump_json(catalog, indent=2))
+    except OSError:
+        # The cache is optional, so an unwritable cache directory is not an error.
+        pass
 
-    To get more information about why we are creating a tsv file (and not csv) and which preprocessing steps are
-    involved, see the nested function `write_tsv_from_excel()`.
 
-    Args:
+def iter_lists_online(
+    newest_first: bool = True, refresh: bool = False
+) -> Iterator[Top500ListInfo]:
+    """Iterate over the TOP500 list issues that are available online.
+
+    The result is cached on disk for `HttpSettings.catalog_ttl` seconds (a day by default), so that repeated calls do
+    not scrape the overview page of top500.org again.
+
+    Args:
+        newest_first (bool, optional): Wether the lists shall be sorted newest-first. Defaults to True.
+        refresh (bool, optional): Wether the overview page shall be scraped even if the cached result is still fresh.
+            Defaults to False.
+
+    Yields:
+        Iterator[Top500ListInfo]: An iterator over Top500ListInfo.
+    """
+    catalog = _get_online_catalog(refresh=refresh)
+    if not newest_first:
+        catalog.reverse()
+    yield from catalog
+
+
+async def aiter_lists_online(
+    newest_first: bool = True, refresh: bool = False
+) -> AsyncIterator[Top500ListInfo]:
+    """Like `iter_lists_online()`, but for asyncio. The event loop is not blocked while the catalog is fetched.
+
+    Args:
+        newest_first (bool, optional): Wether the lists shall be sorted newest-first. Defaults to True.
+        refresh (bool, optional): Wether the overview page shall be scraped even if the cached result is still fresh.
+            Defaults to False.
+
+    Yields:
+        AsyncIterator[Top500ListInfo]: An async iterator over Top500ListInfo.
+    """
+    catalog = await _aget_online_catalog(refresh=refresh)
+    if not newest_first:
+        catalog.reverse()
+    for list_info in catalog:
+        yield list_info
+
+
+# The version of the tsv conversion and the normalization. It is stored in every archive (see `_SchemaInfo`) and must be
+# incremented whenever `_tsv_from_xml()`, `_tsv_from_excel()` or `_normalize_list()` produce different results, so that
+# `rebuild_local_lists()` knows which archives are outdated.
+_SCHEMA_VERSION = 1
+
+
+@pydantic.dataclasses.dataclass
+class _SchemaInfo:
+    """The content of `schema.json` in a list archive, describing how its derived files have been created."""
+
+    schema_version: int
+    inputs_sha256: str  # SHA-256 checksum over the raw XML and Excel file as hex digest
+    # Checksum of the normalized schema the tsv files have been validated against, see `_get_normalized_schema_sha256()`
+    normalized_schema_sha256: str | None = None
+
+
+@pydantic.dataclasses.dataclass
+class _LocalIndexEntry:
+    """An entry of the local index, describing a single downloaded list archive."""
+
+    list_info: Top500ListInfo
+    size: int  # Size of the archive in bytes
+    mtime_ns: int  # Modification time of the archive in nanoseconds
+    sha256: str  # SHA-256 checksum of the archive as hex digest
+    schema_info: _SchemaInfo | None = (
+        None  # The archive's `schema.json`, None for archives of older versions
+    )
+
+
+@pydantic.dataclasses.dataclass
+class _NormalizedListInfo:
+    """The content of `<key>.normalized.json` next to a normalized Arrow IPC file, describing how it has been created."""
+
+    schema_version: int
+    normalized_schema_sha256: str  # See `_get_normalized_schema_sha256()`
+
+
+_LIST_INFO_ADAPTER = TypeAdapter(Top500ListInfo)
+_SCHEMA_INFO_ADAPTER = TypeAdapter(_SchemaInfo)
+_NORMALIZED_LIST_INFO_ADAPTER = TypeAdapter(_NormalizedListInfo)
+_LOCAL_INDEX_ADAPTER = TypeAdapter(dict[str, _LocalIndexEntry])
+_local_index_lock = threading.Lock()
+
+
+def _get_local_index_path() -> Path:
+    return get_download_dir() / "index.json"
+
+
+def _load_local_index() -> dict[str, _LocalIndexEntry]:
+    try:
+        return _LOCAL_INDEX_ADAPTER.validate_json(_get_local_index_path().read_bytes())
+    except (OSError, pydantic.ValidationError):
+        return {}
+
+
+def _store_local_index(index: dict[str, _LocalIndexEntry]) -> None:
+    try:
+        with _atomic_output(_get_local_index_path()) as f:
+            f.write(_LOCAL_INDEX_ADAPTER.dump_json(index, indent=2))
+    except OSError:
+        # The index is only a cache, so a read-only download directory is not an error.
+        pass
+
+
+def _index_list_archive(path: Path) -> _LocalIndexEntry:
+    stat = path.stat()
+    with open(path, "rb") as f:
+        sha256 = hashlib.file_digest(f, "sha256").hexdigest()
+    with _ListArchive(path) as archive:
+        with archive.open("metadata.json") as meta_fp:
+            list_info = _LIST_INFO_ADAPTER.validate_json(meta_fp.read())
+        schema_info = _read_schema_info(archive)
+    return _LocalIndexEntry(
+        list_info=list_info,
+        size=stat.st_size,
+        mtime_ns=stat.st_mtime_ns,
+        sha256=sha256,
+        schema_info=schema_info,
+    )
+
+
+def _update_local_index(rebuild: bool = False) -> dict[str, _LocalIndexEntry]:
+    """Bring the local index in line with the archives in the download directory.
+
+    Archives whose size and modification time match their index entry are not opened. New or changed archives are
+    (re-)indexed and entries of archives that no longer exist are dropped.
+
+    Args:
+        rebuild (bool, optional): Wether the existing index shall be discarded and all archives shall be re-indexed.
+            Defaults to False.
+
+    Returns:
+        dict[str, _LocalIndexEntry]: The updated index, by list key.
+    """
+    with _local_index_lock, _stage("index") as counters:
+        old_index = {} if rebuild else _load_local_index()
+        new_index = {}
+        counters["indexed"] = 0
+        for dir_entry in os.scandir(get_download_dir()):
+            m = _RE_DOWNLOADED_LIST_FILE.match(dir_entry.name)
+            if not m:
+                continue
+            key = f"{m[1]}-{m[2]}"
+            if dir_entry.name != _get_list_path(key).name:
+                # The list also exists in a preferred format.
+                continue
+            stat = dir_entry.stat()
+            index_entry = old_index.get(key)
+            if (
+                index_entry is None
+                or index_entry.size != stat.st_size
+                or index_entry.mtime_ns != stat.st_mtime_ns
+            ):
+                index_entry = _index_list_archive(Path(dir_entry.path))
+                counters["indexed"] += 1
+            new_index[key] = index_entry
+        counters["archives"] = len(new_index)
+        if rebuild or new_index != old_index:
+            _store_local_index(new_index)
+        return new_index
+
+
+def rebuild_local_index() -> None:
+    """Rebuild the index of local lists from scratch.
+
+    The index (`index.json` in the download directory) allows `iter_lists_local()` to list the local lists without
+    opening every archive. It is updated automatically whenever an archive is added or the size or modification time of
+    an archive changes, so this function is only needed when the index has been damaged otherwise.
+
+    The history index of `system_history()` and `site_history()` and the aggregates of `aggregates()` are rebuilt as
+    well.
+    """
+    if _download_dir is None and not _DEFAULT_DOWNLOAD_DIR.exists():
+        return
+    _update_local_index(rebuild=True)
+    _get_history_table("system-id", rebuild=True)
+    _update_aggregates(rebuild=True)
+
+
+def iter_lists_local(newest_first: bool = True) -> Iterator[Top500ListInfo]:
+    """Iterate over the TOP500 list issues that are available locally in the download directory.
+
+    The list infos are served from the index of local lists (see `rebuild_local_index()`), so only archives that are
+    new or have changed since the last call are opened.
+
+    Args:
+        newest_first (bool, optional): Wether the lists shall be sorted newest-first. Defaults to True.
+
+    Yields:
+        Iterator[Top500ListInfo]: An iterator over Top500ListInfo.
+    """
+    if _download_dir is None and not _DEFAULT_DOWNLOAD_DIR.exists():
+        return
+    index = _update_local_index()
+    for key in sorted(index.keys(), reverse=newest_first):
+        yield index[key].list_info
+
+
+def _get_key(list_info_or_key: str | Top500ListInfo) -> str:
+    if isinstance(list_info_or_key, str):
+        key = list_info_or_key
+        assert _RE_LIST_KEY.match(key)
+        return key
+    if isinstance(list_info_or_key, Top500ListInfo):
+        key = list_info_or_key.key
+        assert _RE_LIST_KEY.match(key)
+        return key
+    raise ValueError(
+        f"list_info_or_key must be either str or Top500ListInfo, passed {type(list_info_or_key)}"
+    )
+
+
+def _get_list_info_from_key(key: str) -> Top500ListInfo:
+    assert _RE_LIST_KEY.match(key)
+    # When the key is missing from the cached catalog, a new list might have been published in the meantime.
+    for refresh in (False, True):
+        for list_info in iter_lists_online(refresh=refresh):
+            if list_info.key == key:
+                return list_info
+    raise RuntimeError(f'List info for key "{key}" was not found online.')
+
+
+async def _aget_list_info_from_key(key: str) -> Top500ListInfo:
+    assert _RE_LIST_KEY.match(key)
+    for refresh in (False, True):
+        for list_info in await _aget_online_catalog(refresh=refresh):
+            if list_info.key == key:
+                return list_info
+    raise RuntimeError(f'List info for key "{key}" was not found online.')
+
+
+def _get_list_info(list_info_or_key: str | Top500ListInfo) -> Top500ListInfo:
+    if isinstance(list_info_or_key, str):
+        key = list_info_or_key
+        list_info = _get_list_info_from_key(key)
+        return list_info
+    if isinstance(list_info_or_key, Top500ListInfo):
+        list_info = list_info_or_key
+        return list_info
+    raise ValueError(
+        f"list_info_or_key must be either str or Top500ListInfo, passed {type(list_info_or_key)}"
+    )
+
+
+def _get_list_path(key: str) -> Path:
+    """Get the path of the archive of a list: the existing archive in any format, or else the path of the archive in the
+    format set via `set_archive_format()`."""
+    download_dir = get_download_dir()
+    for archive_format in _ARCHIVE_FORMATS:
+        path = download_dir / f"{key}.{archive_format}"
+        if path.exists():
+            return path
+    return download_dir / f"{key}.{_archive_format}"
+
+
+class _ListArchive:
+    """Read access to the members of a list archive in any of the `_ARCHIVE_FORMATS`.
+
+    The format is detected from the first bytes of the file, not from its name.
+    """
+
+    def __init__(self, path: Path):
+        self._zip: zipfile.ZipFile | None = None
+        self._tar: TarFile | None = None
+        self._zstd_fp: IO[bytes] | None = None
+        with open(path, "rb") as f:
+            magic = f.read(4)
+        if magic == b"PK\x03\x04":
+            self._zip = zipfile.ZipFile(path)
+        elif magic == b"\x28\xb5\x2f\xfd":
+            self._zstd_fp = _open_zstd_reader(path)
+            self._tar = tarfile.open(fileobj=self._zstd_fp, mode="r:")
+        else:
+            self._tar = tarfile.open(path, "r:gz")
+
+    def __enter__(self) -> Self:
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
+
+    def close(self) -> None:
+        if self._zip is not None:
+            self._zip.close()
+        else:
+            self._tar.close()
+        if self._zstd_fp is not None:
+            self._zstd_fp.close()
+
+    def names(self) -> list[str]:
+        """Get the names of all members, in the order they were written."""
+        if self._zip is not None:
+            return self._zip.namelist()
+        return self._tar.getnames()
+
+    def open(self, name: str) -> IO[bytes]:
+        """Open a member for reading. For zip archives, no other member is decompressed."""
+        if self._zip is not None:
+            return self._zip.open(name)
+        fp = self._tar.extractfile(name)
+        assert fp is not None
+        return fp
+
+
+def _read_schema_info(archive: _ListArchive) -> _SchemaInfo | None:
+    """Read `schema.json` from a list archive. Archives written by older versions of this module do not have one."""
+    try:
+        with archive.open("schema.json") as schema_fp:
+            return _SCHEMA_INFO_ADAPTER.validate_json(schema_fp.read())
+    except KeyError:
+        return None
+
+
+def _open_zstd_reader(path: Path) -> IO[bytes]:
+    """Open a zstd-compressed file for reading, as a seekable file object of the decompressed content."""
+    zstd = _get_zstd_backend()
+    if zstd.__name__ == "compression.zstd":
+        return zstd.ZstdFile(path, "r")
+    # The readers of the zstandard package can only seek forward, but `tarfile` seeks back to read a member.
+    with open(path, "rb") as f, zstd.ZstdDecompressor().stream_reader(f) as reader:
+        return BytesIO(reader.read())
+
+
+def _open_zstd_writer(f: IO[bytes], level: int) -> IO[bytes]:
+    """Wrap `f` in a file object that zstd-compresses what is written to it. Closing it does not close `f`."""
+    zstd = _get_zstd_backend()
+    if zstd.__name__ == "compression.zstd":
+        return zstd.ZstdFile(f, "w", level=level)
+    return zstd.ZstdCompressor(level=level).stream_writer(f, closefd=False)
+
+
+def _write_archive(
+    f: IO[bytes], archive_format: str, members: Iterable[tuple[str, bytes]]
+) -> None:
+    """Write the given (name, content) members as an archive in the given format to `f`, with the compression level
+    from `_get_compression_level()`."""
+    level = _get_compression_level(archive_format)
+
+    def write_tar(tar: TarFile) -> None:
+        for name, content in members:
+            tarinfo = TarInfo(name=name)
+            tarinfo.size = len(content)
+            tar.addfile(tarinfo, BytesIO(content))
+
+    if archive_format == "zip":
+        with zipfile.ZipFile(f, "w") as zf:
+            for name, content in members:
+                # xlsx files are zip files themselves, so compressing them again would only cost time.
+                compress_type = (
+                    zipfile.ZIP_STORED
+                    if name.endswith(".xlsx")
+                    else zipfile.ZIP_DEFLATED
+                )
+                zf.writestr(zipfile.ZipInfo(name), content, compress_type, level)
+    elif archive_format == "tar.zst":
+        with (
+            _open_zstd_writer(f, level) as zstd_fp,
+            tarfile.open(fileobj=zstd_fp, mode="w|") as tar,
+        ):
+            write_tar(tar)
+    else:
+        with tarfile.open(fileobj=f, mode="w:gz", compresslevel=level) as tar:
+            write_tar(tar)
+
+
+def _get_normalized_list_path(key: str) -> Path:
+    return get_download_dir() / f"{key}.normalized.arrow"
+
+
+def _get_normalized_list_info_path(key: str) -> Path:
+    return get_download_dir() / f"{key}.normalized.json"
+
+
+def _is_normalized_list_up_to_date(key: str) -> bool:
+    """Check if the normalized Arrow IPC file of a list exists, is at least as new as the list's archive and has been
+    written with the current schema (see `_NormalizedListInfo`)."""
+    normalized_path = _get_normalized_list_path(key)
+    if not normalized_path.exists():
+        return False
+    if normalized_path.stat().st_mtime_ns < _get_list_path(key).stat().st_mtime_ns:
+        return False
+    try:
+        normalized_list_info = _NORMALIZED_LIST_INFO_ADAPTER.validate_json(
+            _get_normalized_list_info_path(key).read_bytes()
+        )
+    except (OSError, pydantic.ValidationError):
+        return False
+    return _is_schema_verified(normalized_list_info)
+
+
+def _read_tsv(
+    source: IO[bytes], columns: Collection[str] | None = None
+) -> pl.DataFrame:
+    """Read a tsv file that has been written by `_tsv_from_xml()` or `_tsv_from_excel()`.
+
+    Args:
+        source (IO[bytes]): The tsv file.
+        columns (Collection[str] | None, optional): When given, only these columns are parsed. Columns that do not
+            exist in the file are skipped. Defaults to None.
+
+    Returns:
+        pl.DataFrame: The table.
+    """
+    import polars as pl
+
+    with _stage("parse-tsv") as counters:
+        if columns is not None:
+            content = source.read()
+            header = content[: content.find(b"\n")].decode("utf-8").split("\t")
+            columns = [column for column in header if column in columns]
+            source = BytesIO(content)
+        df = pl.read_csv(
+            source,
+            separator="\t",
+            infer_schema_length=10000,
+            quote_char=None,
+            columns=columns,
+        )
+        counters["rows"] = df.height
+    return df
+
+
+def _read_tsv_member(
+    name: str, archive: _ListArchive, columns: Collection[str] | None = None
+) -> pl.DataFrame:
+    with archive.open(name) as tsv_fp:
+        return _read_tsv(tsv_fp, columns)
+
+
+def _get_normalized_source_columns(
+    columns: Collection[str] | None,
+) -> dict[str, set[str] | None]:
+    """Get the columns of the tables from the XML and the Excel file that `_normalize_list()` needs to build the given
+    normalized columns.
+
+    Args:
+        columns (Collection[str] | None): The keys of the normalized columns, or None for all columns.
+
+    Returns:
+        dict[str, set[str] | None]: The needed columns by data source ("xml" or "excel"), where None means all columns.
+            Data sources that are not needed at all are missing.
+    """
+    if columns is None:
+        return {"xml": None, "excel": None}
+    source_columns: dict[str, set[str]] = {}
+    for m in _get_normalized_column_mappings():
+        if m.key in columns:
+            source_columns.setdefault(m.data_source, set()).update(m.names_in_source)
+    if "energy-efficiency-gflopw" in columns:
+        # Older lists only have the efficiency in Mflops/Watt.
+        source_columns["excel"].add("Mflops/Watt")
+    # The rank is always read: the tables are joined on it, and it keeps the table at its full height even when none of
+    # the selected columns exists in an older list.
+    rank_columns = {"xml": "rank", "excel": "Rank"}
+    for data_source, names in source_columns.items():
+        names.add(rank_columns[data_source])
+    return source_columns
+
+
+def _normalize_list(
+    df_xml: pl.DataFrame | None,
+    df_excel: pl.DataFrame | None,
+    columns: Sequence[str] | None = None,
+    validate: bool = True,
+) -> pl.DataFrame:
+    """Merge the tables from the XML and the Excel file into a table with the columns in `_get_normalized_column_mappings()`.
+
+    The columns of each table are renamed, filled in and converted by a single `select()`, so the table is only built
+    once per source.
+
+    Args:
+        df_xml (pl.DataFrame | None): The table read from `from_xml.tsv`. May be None if no column from the XML file is
+            selected.
+        df_excel (pl.DataFrame | None): The table read from `from_excel.tsv`. May be None if no column from the Excel
+            file is selected.
+        columns (Sequence[str] | None, optional): When given, only these normalized columns are built, in this order,
+            and the tables are only joined if the columns come from both files. The tables only need to contain the
+            columns named by `_get_normalized_source_columns()`. Defaults to None.
+        validate (bool, optional): Wether the join shall be checked to be one-to-one and the result shall be checked
+            against the normalized schema (see `_validate_normalized_list()`). Can be disabled for tables whose
+            archive records that they have been validated when it was written (see `_is_schema_verified()`). Defaults
+            to True.
+
+    Returns:
+        pl.DataFrame: The normalized table.
+    """
+    import polars as pl
+
+    mappings = _get_normalized_column_mappings()
+    if columns is not None:
+        mappings = tuple(m for m in mappings if m.key in columns)
+    data_sources = {m.data_source for m in mappings}
+    if not data_sources:
+        raise ValueError(f"No normalized column selected, passed {columns}.")
+
+    def get_column_expr(m: NormalizedColumnMapping, df: pl.DataFrame) -> pl.Expr:
+        if m.key == "energy-efficiency-gflopw" and "Mflops/Watt" in df.columns:
+            # Older lists only have the efficiency in Mflops/Watt.
+            return (pl.col("Mflops/Watt") / 1000).alias(m.key)
+        for col_name in m.names_in_source:
+            if col_name in df.columns:
+                expr = pl.col(col_name)
+                if m.key == "processor-speed-mhz" or (
+                    m.dtype.is_float() and df.schema[col_name].is_integer()
+                ):
+                    # Some columns are inferred with another dtype from the tsv files, e.g. float columns in which all
+                    # values are whole numbers.
+                    expr = expr.cast(m.dtype)
+                return expr.alias(m.key)
+        return pl.lit(None, dtype=m.dtype).alias(m.key)
+
+    def get_filtered_df(
+        df: pl.DataFrame, data_source: str, rank_column: str | None = None
+    ) -> pl.DataFrame:
+        exprs = [
+            get_column_expr(m, df) for m in mappings if m.data_source == data_source
+        ]
+        if rank_column is not None and not any(
+            m.key == "rank" for m in mappings if m.data_source == data_source
+        ):
+            exprs.append(pl.col(rank_column).alias("rank"))
+        return df.select(exprs)
+
+    with _stage("normalize") as counters:
+        join = len(data_sources) == 2
+        if "excel" in data_sources:
+            assert df_excel is not None
+            df_excel = get_filtered_df(
+                df_excel, "excel", rank_column="Rank" if join else None
+            )
+        if "xml" in data_sources:
+            assert df_xml is not None
+            df_xml = get_filtered_df(
+                df_xml, "xml", rank_column="rank" if join else None
+            )
+        if join:
+            df_joined = df_xml.join(
+                df_excel, on="rank", how="inner", validate="1:1" if validate else "m:m"
+            )
+        else:
+            df_joined = df_xml if "xml" in data_sources else df_excel
+        if columns is not None:
+            df_joined = df_joined.select(columns)
+        else:
+            df_joined = df_joined.select(m.key for m in mappings)
+        if validate:
+            _validate_normalized_list(df_joined)
+        counters["rows"] = df_joined.height
+    return df_joined
+
+
+def _validate_normalized_list(df: pl.DataFrame, compact: bool = False) -> None:
+    """Check that a (possibly projected) normalized table has 500 rows and the dtypes of the normalized schema.
+
+    Raises:
+        RuntimeError: When the table does not match the normalized schema.
+    """
+    schema = _get_normalized_schema(compact)
+    mismatches = {
+        column: (str(dtype), str(schema.get(column)))
+        for column, dtype in df.schema.items()
+        if dtype != schema.get(column)
+    }
+    if mismatches:
+        raise RuntimeError(
+            f"The normalized table does not match the schema, found (dtype, expected dtype) {mismatches}."
+        )
+    if df.height != 500:
+        raise RuntimeError(f"The normalized table has {df.height} rows instead of 500.")
+
+
+@functools.cache
+def _get_normalized_schema_sha256() -> str:
+    """Get a checksum over the normalized schema and the source columns it is built from.
+
+    It is stored in the `schema.json` of every archive whose normalized table has been validated when it was written.
+    """
+    description = [
+        (m.key, str(m.dtype), m.data_source, m.names_in_source)
+        for m in _get_normalized_column_mappings()
+    ]
+    return hashlib.sha256(json.dumps(description).encode("utf-8")).hexdigest()
+
+
+def _is_schema_verified(schema_info: _SchemaInfo | _NormalizedListInfo | None) -> bool:
+    """Check if the derived files of an archive (or a normalized table) have been written and validated by the current
+    version of this module."""
+    return (
+        schema_info is not None
+        and schema_info.schema_version == _SCHEMA_VERSION
+        and schema_info.normalized_schema_sha256 == _get_normalized_schema_sha256()
+    )
+
+
+def _write_normalized_list(df: pl.DataFrame, key: str) -> None:
+    """Store the normalized table of a list as an uncompressed Arrow IPC file, so that it can be memory-mapped."""
+    with (
+        _stage("write-normalized", key) as counters,
+        _atomic_output(_get_normalized_list_path(key)) as f,
+    ):
+        df.write_ipc(f, compression="uncompressed")
+        counters["bytes"] = f.tell()
+    # The info is written after the table, so that it never vouches for a table written with another schema.
+    normalized_list_info = _NormalizedListInfo(
+        schema_version=_SCHEMA_VERSION,
+        normalized_schema_sha256=_get_normalized_schema_sha256(),
+    )
+    with _atomic_output(_get_normalized_list_info_path(key)) as f:
+        f.write(_NORMALIZED_LIST_INFO_ADAPTER.dump_json(normalized_list_info))
+
+
+def _tsv_from_excel(excel_content: bytes) -> bytes:
+    """Create a tsv file from an Excel file (.xls or .xslx).
+
+    We are writing .tsv (and not .csv), because commas are plenty in the tables and quoting / escaping is annoying.
+    There are a few instances of tabs in the cell content, but these are only a result of careless copy-pasting, so
+    it's okay to remove them.
+    To convert the Excel files to .tsv, we use `pandas.read_excel()` and `pandas.to_csv()`.
+    We are unable to use polars for this task, because `polars.read_excel()` fails on some of the Excel files.
+    The preprocessing is kept minimal; all cell content is preserved as-is, whereever possible.
+
+    Preprocessing steps:
+        - Replace tabs and line breaks with spaces.
+        - Remove all rows and columns that are empty or only contain whitespace. This is necessary, because the
+          lists up until 2007-11 contained an empty header line.
+
+    Args:
+        excel_content (bytes): The content of the Excel file.
+
+    Returns:
+        bytes: The content of the tsv file.
+    """
+    import pandas as pd
+
+    with _stage("convert-excel") as counters:
+        df = pd.read_excel(BytesIO(excel_content), dtype=str, header=None)
+        df = df.fillna("")
+        # Work column by column with vectorized string methods instead of calling a Python function for every row.
+        df = df.apply(lambda col: col.str.replace(r"[\t\n\r]", " ", regex=True))
+        is_blank = df.apply(lambda col: col.str.fullmatch(r"\s*"))
+        df = df.loc[~is_blank.all(axis=1), ~is_blank.all(axis=0)]
+        bio = BytesIO()
+        df.to_csv(bio, index=False, header=False, sep="\t", quoting=csv.QUOTE_NONE)
+        counters["bytes"] = len(excel_content)
+        counters["rows"] = len(df)
+    return bio.getvalue()
+
+
+# The strings that `pandas.read_xml()` (which was used in earlier versions) turns into missing values.
+_PANDAS_NA_VALUES = frozenset(
+    (
+        "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan", "1.#IND", "1.#QNAN", "<NA>", "N/A",
+        "NA", "NULL", "NaN", "None", "n/a", "nan", "null",
+    )
+)  # fmt: skip
+
+
+def _tsv_from_xml(xml_content: bytes) -> bytes:
+    """Create a tsv file from an XML file.
+
+    The XML file contains one element per system below the root element, whose child elements are the columns. The
+    nested `top500:installation-site` element (and any other child element that has child elements itself) is
+    flattened, so that its children become columns as well. Namespace prefixes are removed from the column names.
+
+    The document is streamed with `lxml.etree.iterparse()` and every system element is discarded once it has been
+    read, so only the small per-row dicts are kept in memory instead of several copies of the whole document.
+    The output is identical to that of `pandas.read_xml()` and `pandas.DataFrame.to_csv()`, which were used in earlier
+    versions: columns appear in the order they are first encountered, missing and NA-like values are empty, and tabs are
+    replaced with spaces.
+
+    Args:
+        xml_content (bytes): The content of the XML file.
+
+    Returns:
+        bytes: The content of the tsv file.
+    """
+    from lxml import etree
+
+    def local_name(tag: str) -> str:
+        return tag.split("}")[1] if "}" in tag else tag
+
+    def clean(value: str | None) -> str | None:
+        if value is None:
+            return None
+        value = value.replace("\t", " ")
+        return None if value in _PANDAS_NA_VALUES else value
+
+    def iter_leaves(elem: etree._Element) -> Iterator[etree._Element]:
+        for child in elem.iterchildren(tag=etree.Element):
+            if len(child) > 0:
+                yield from iter_leaves(child)
+            else:
+                yield child
+
+    with _stage("convert-xml") as counters:
+        rows: list[dict[str, str | None]] = []
+        columns: dict[str, None] = {}
+        depth = 0
+        for event, elem in etree.iterparse(
+            BytesIO(xml_content), events=("start", "end")
+        ):
+            if event == "start":
+                depth += 1
+                continue
+            depth -= 1
+            if depth != 1:
+                continue
+            row = {local_name(k): clean(v) for k, v in elem.attrib.items()}
+            if elem.text and not elem.text.isspace():
+                row[local_name(elem.tag)] = clean(elem.text)
+            for leaf in iter_leaves(elem):
+                row[local_name(leaf.tag)] = clean(leaf.text)
+            rows.append(row)
+            columns.update(dict.fromkeys(row))
+            # Free the memory of the rows that have been read.
+            elem.clear()
+            while elem.getprevious() is not None:
+                del elem.getparent()[0]
+        sio = StringIO()
+        # Same dialect as `pandas.DataFrame.to_csv(sep="\t", quoting=csv.QUOTE_NONE)`.
+        writer = csv.writer(
+            sio,
+            delimiter="\t",
+            quoting=csv.QUOTE_NONE,
+            quotechar=None,
+            doublequote=True,
+            escapechar=None,
+            lineterminator=os.linesep,
+        )
+        writer.writerow(columns)
+        for row in rows:
+            writer.writerow(row.get(column) for column in columns)
+        counters["bytes"] = len(xml_content)
+        counters["rows"] = len(rows)
+    return sio.getvalue().encode("utf-8")
+
+
+@dataclasses.dataclass
+class _RawFile:
+    """A file of a list issue as it was downloaded from top500.org, together with the HTTP validators of the response."""
+
+    name: str
+    content: bytes
+    url: str
+    etag: str | None = None
+    last_modified: str | None = None
+
+    @classmethod
+    def from_fetch_result(cls, result: _FetchResult) -> _RawFile:
+        return cls(
+            name=result.url[result.url.rfind("/") + 1 :],
+            content=result.content,
+            url=result.url,
+            etag=result.etag,
+            last_modified=result.last_modified,
+        )
+
+
+@dataclasses.dataclass
+class _RawListFiles:
+    """The files of a list issue as they were downloaded from top500.org, before any conversion."""
+
+    xml: _RawFile
+    excel: _RawFile
+
+
+def _get_raw_file_urls(list_info: Top500ListInfo) -> dict[str, str]:
+    """Get the URLs of the XML and the Excel file of a list issue from its page on top500.org.
+
+    Returns:
+        dict[str, str]: The URLs by kind ("xml" and "excel").
+    """
+    response = _fetch(list_info.url, use_cache=True)
+    return _parse_raw_file_urls(response.content, list_info)
+
+
+def _parse_raw_file_urls(content: bytes, list_info: Top500ListInfo) -> dict[str, str]:
+    """Parse the URLs of the XML and the Excel file of a list issue from the content of its page."""
+    from bs4 import BeautifulSoup
+
+    def get_url_from_link_text(link_text: str, anchors: Iterable[HtmlTag]) -> str:
+        download_anchor = next(filter(lambda a: a.text == link_text, anchors), None)
+        assert download_anchor is not None, ("No download link found", link_text)
+        href = download_anchor["href"]
+        assert href is not None
+        return str(HttpUrl(urljoin(str(list_info.url), href)))
+
+    html = BeautifulSoup(content, "html.parser")
+    navbar = html.find(id="navbarSupportedContentSubmenu")
+    anchors = navbar.find_all("a")
+    return {
+        "xml": get_url_from_link_text("TOP500 List (XML)", anchors),
+        "excel": get_url_from_link_text("TOP500 List (Excel)", anchors),
+    }
+
+
+def _fetch_raw_list_files(list_info: Top500ListInfo) -> _RawListFiles:
+    urls = _get_raw_file_urls(list_info)
+    return _RawListFiles(
+        xml=_RawFile.from_fetch_result(_fetch(urls["xml"])),
+        excel=_RawFile.from_fetch_result(_fetch(urls["excel"])),
+    )
+
+
+async def _afetch_raw_list_files(list_info: Top500ListInfo) -> _RawListFiles:
+    import asyncio
+
+    response = await _afetch(list_info.url, use_cache=True)
+    urls = await asyncio.to_thread(_parse_raw_file_urls, response.content, list_info)
+    xml_result, excel_result = await asyncio.gather(
+        _afetch(urls["xml"]), _afetch(urls["excel"])
+    )
+    return _RawListFiles(
+        xml=_RawFile.from_fetch_result(xml_result),
+        excel=_RawFile.from_fetch_result(excel_result),
+    )
+
+
+@pydantic.dataclasses.dataclass
+class _RemoteFileState:
+    """The state of a raw file of a list issue on top500.org as of its last download, used by `sync_lists()`."""
+
+    name: str
+    url: str
+    etag: str | None
+    last_modified: str | None
+    sha256: str  # SHA-256 checksum of the content as hex digest
+
+    @classmethod
+    def from_raw_file(cls, raw_file: _RawFile) -> _RemoteFileState:
+        return cls(
+            name=raw_file.name,
+            url=raw_file.url,
+            etag=raw_file.etag,
+            last_modified=raw_file.last_modified,
+            sha256=hashlib.sha256(raw_file.content).hexdigest(),
+        )
+
+
+_SYNC_STATE_ADAPTER = TypeAdapter(dict[str, dict[str, _RemoteFileState]])
+_sync_state_lock = threading.Lock()
+
+
+def _get_sync_state_path() -> Path:
+    return get_download_dir() / "sync.json"
+
+
+def _load_sync_state() -> dict[str, dict[str, _RemoteFileState]]:
+    try:
+        return _SYNC_STATE_ADAPTER.validate_json(_get_sync_state_path().read_bytes())
+    except (OSError, pydantic.ValidationError):
+        return {}
+
+
+def _record_sync_state(key: str, file_states: dict[str, _RemoteFileState]) -> None:
+    with _sync_state_lock:
+        state = _load_sync_state()
+        state[key] = file_states
+        try:
+            with _atomic_output(_get_sync_state_path()) as f:
+                f.write(_SYNC_STATE_ADAPTER.dump_json(state, indent=2))
+        except OSError:
+            # Without the state, the next sync has to fetch the files unconditionally, which is slower but correct.
+            pass
+
+
+def _record_raw_files(key: str, raw_files: _RawListFiles) -> None:
+    _record_sync_state(
+        key,
+        {
+            "xml": _RemoteFileState.from_raw_file(raw_files.xml),
+            "excel": _RemoteFileState.from_raw_file(raw_files.excel),
+        },
+    )
+
+
+def _get_inputs_sha256(xml_content: bytes, excel_content: bytes) -> str:
+    h = hashlib.sha256()
+    for content in (xml_content, excel_content):
+        h.update(len(content).to_bytes(8))
+        h.update(content)
+    return h.hexdigest()
+
+
+def _write_list_archive(
+    list_info: Top500ListInfo,
+    raw_xml: tuple[str, bytes],
+    raw_excel: tuple[str, bytes],
+    tsv_from_xml: bytes,
+    tsv_from_excel: bytes,
+    target_path: Path,
+) -> None:
+    # The callers have validated the normalized table built from the tsv files, see `_normalize_list()`.
+    schema_info = _SchemaInfo(
+        schema_version=_SCHEMA_VERSION,
+        inputs_sha256=_get_inputs_sha256(raw_xml[1], raw_excel[1]),
+        normalized_schema_sha256=_get_normalized_schema_sha256(),
+    )
+    # The small members come first, so that reading them from a tarball does not decompress the large ones.
+    members = [
+        ("metadata.json", _LIST_INFO_ADAPTER.dump_json(list_info, indent=2)),
+        ("schema.json", _SCHEMA_INFO_ADAPTER.dump_json(schema_info, indent=2)),
+        raw_xml,
+        raw_excel,
+        ("from_xml.tsv", tsv_from_xml),
+        ("from_excel.tsv", tsv_from_excel),
+    ]
+    archive_format = next(
+        fmt for fmt in _ARCHIVE_FORMATS if target_path.name.endswith(f".{fmt}")
+    )
+    with _stage("write-archive", list_info.key) as counters:
+        if _download_dir is None:
+            _DEFAULT_DOWNLOAD_DIR.mkdir(exist_ok=True)
+        # The archive is written to a temporary file in the download directory and renamed to `target_path`, so it is
+        # never copied and `iter_lists_local()` never sees a partially written archive.
+        with _atomic_output(target_path, durable=True) as f:
+            _write_archive(f, archive_format, members)
+        counters["bytes"] = target_path.stat().st_size
+
+
+def _download_list(
+    list_info: Top500ListInfo,
+    convert_pool: Executor | None = None,
+    raw_files: _RawListFiles | None = None,
+    replace: bool = False,
+) -> None:
+    """Download a single list issue and write its archive.
+
+    The list is locked via `_list_lock()` meanwhile, so that concurrent downloads of the same list in other threads or
+    processes wait for this one instead of doing the same work again.
+
+    Args:
+        list_info (Top500ListInfo): The list issue to download.
+        convert_pool (Executor | None, optional): When given, the tsv conversion is submitted to this executor, so
+            that the calling thread only waits for it instead of doing the CPU-heavy work itself. Defaults to None.
+        raw_files (_RawListFiles | None, optional): The raw files of the list, if they have been fetched already.
+            Defaults to None.
+        replace (bool, optional): Wether an existing archive shall be replaced. If False, nothing is done when the
+            archive exists, e.g. because it has been written by another process in the meantime. Defaults to False.
+    """
+    with _list_lock(list_info.key), _stage("download", list_info.key):
+        target_path = _get_list_path(list_info.key)
+        if target_path.exists() and not replace:
+            return
+        if raw_files is None:
+            raw_files = _fetch_raw_list_files(list_info)
+        if convert_pool is None:
+            tsv_from_xml = _tsv_from_xml(raw_files.xml.content)
+            tsv_from_excel = _tsv_from_excel(raw_files.excel.content)
+        else:
+            xml_future = convert_pool.submit(
+                _call_with_stages, _tsv_from_xml, raw_files.xml.content
+            )
+            excel_future = convert_pool.submit(
+                _call_with_stages, _tsv_from_excel, raw_files.excel.content
+            )
+            tsv_from_xml, xml_events = xml_future.result()
+            tsv_from_excel, excel_events = excel_future.result()
+            for event in xml_events + excel_events:
+                _record_stage(event)
+        # The normalized table is validated before the archive is written, so that the archive can record it.
+        df_normalized = _normalize_list(
+            _read_tsv(BytesIO(tsv_from_xml)), _read_tsv(BytesIO(tsv_from_excel))
+        )
+        _write_list_archive(
+            list_info,
+            (raw_files.xml.name, raw_files.xml.content),
+            (raw_files.excel.name, raw_files.excel.content),
+            tsv_from_xml,
+            tsv_from_excel,
+            target_path,
+        )
+        _record_raw_files(list_info.key, raw_files)
+        _update_local_index()
+        _update_derived_files([list_info.key], {list_info.key: df_normalized})
+
+
+def _update_derived_files(
+    keys: list[str], normalized: dict[str, pl.DataFrame] | None = None
+) -> None:
+    """Bring the files derived from the archives of the given lists up to date: the normalized tables, the diffs to the
+    adjacent lists and the aggregates.
+
+    The archives have been stored already and all derived files are rebuilt lazily when they are read, so a failure is
+    logged instead of raised. A derived file that could not be updated is stale: it is older than the archive (the
+    normalized tables and the diffs) or its state does not match the local index (the aggregates).
+
+    Args:
+        keys (list[str]): The keys of the lists whose archives have been written.
+        normalized (dict[str, pl.DataFrame] | None, optional): The normalized tables to store, by list key. Defaults to
+            None.
+    """
+    try:
+        for key, df in (normalized or {}).items():
+            _write_normalized_list(df, key)
+        _update_adjacent_list_diffs(keys)
+    except Exception:
+        _logger.exception("Failed to update the derived files of %s.", keys)
+    try:
+        _update_aggregates()
+    except Exception:
+        _logger.exception("Failed to update the aggregates.")
+
+
+def download_list(list_info_or_key: str | Top500ListInfo) -> None:
+    """Download a TOP500 list issue. If the list is already present locally, it will not be downloaded again.
+
+    This will create an archive in the format set via `set_archive_format()` (e.g. `2025-06.tar.gz` or `2025-06.zip`)
+    containing for example
+    ```
+    ├── metadata.json (the list info as json)
+    ├── schema.json (the version of the tsv conversion, see `rebuild_local_lists()`)
+    ├── TOP500_202506_all.tsv (the XML file below converted to tsv)
+    ├── TOP500_202506_all.xml (the downloaded XML file)
+    ├── TOP500_202506.tsv (the Excel file below converted to tsv)
+    └── TOP500_202506.xlsx (the downloaded Excel file)
+    ```
+
+    To get more information about why we are creating a tsv file (and not csv) and which preprocessing steps are
+    involved, see `_tsv_from_excel()`.
+
+    Next to the archive, the normalized table (see `read_list()`) is stored as an uncompressed Arrow IPC file (e.g.
+    `2025-06.normalized.arrow`), so that normalized reads can memory-map it instead of parsing and joining the tsv
+    files again. The schema it has been written with is recorded next to it (e.g. `2025-06.normalized.json`); after a
+    change of the normalized schema, it is derived from the tsv files and rewritten on the next read.
+
+    The archive only appears under its final name once it has been written completely. Concurrent calls for the same
+    list, also from different processes, download it only once.
+
+    To re-download lists that have changed online after they were downloaded, see `sync_lists()`.
+
+    Args:
         list_info_or_key (str | Top500ListInfo): An identifier describing the list that shall be downloaded, either as a
-            Top500ListInfo object or only the key as a str. When only the key is passed, `iter_lists_online()` will be
-            called to construct the corresponding list info object. It is therefore discouraged to download multiple
-            lists by only specifying the key. Instead, call `iter_lists_online()` once and store the result.
+            Top500ListInfo object or only the key as a str. When only the key is passed, the corresponding list info
+            object is looked up via `iter_lists_online()`, which is served from a cache most of the time.
+    """
+    key = _get_key(list_info_or_key)
+
+    target_path = _get_list_path(key)
+    if target_path.exists():
+        return
+
+    list_info = _get_list_info(list_info_or_key)
+    _download_list(list_info)
+
+
+def download_all_lists(jobs: int = 1) -> None:
+    """Downloaded all TOP500 list issues that are available online to the download directory.
+
+    Lists that are already present locally are skipped. A failure while downloading one list does not abort the
+    others; all failures are raised together as an `ExceptionGroup` after the remaining lists have been processed.
+
+    With `jobs > 1`, up to `jobs` lists are downloaded by a pool of threads at the same time. All threads share the
+    rate limit of `_fetch()`, so top500.org does not see more requests per second than in a sequential run; the
+    parallelism mostly hides network latency. The tsv conversion is moved to a pool of `jobs` processes, so that it
+    overlaps with the downloads of the next lists.
+
+    Args:
+        jobs (int, optional): The number of lists that are processed concurrently. Defaults to 1.
+            With `jobs > 1`, the worker processes are started with the "spawn" method, which imports the main module
+            of the program again. A script that calls this function must therefore do so under an
+            `if __name__ == "__main__":` guard.
+
+    Raises:
+        ValueError: When `jobs` is smaller than 1.
+        ExceptionGroup: When downloading at least one list failed.
+    """
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, passed {jobs}.")
+    list_infos = [
+        info
+        for info in iter_lists_online(refresh=True)
+        if not _get_list_path(info.key).exists()
+    ]
+    errors: list[Exception] = []
+    if jobs == 1:
+        for info in list_infos:
+            try:
+                _download_list(info)
+            except Exception as e:
+                e.add_note(f'While downloading list "{info.key}".')
+                errors.append(e)
+    else:
+        import multiprocessing
+        from concurrent.futures import (
+            ProcessPoolExecutor,
+            ThreadPoolExecutor,
+            as_completed,
+        )
+
+        # The conversion workers are spawned (instead of forked), because forking a multi-threaded process is unsafe.
+        mp_context = multiprocessing.get_context("spawn")
+        with (
+            ProcessPoolExecutor(
+                max_workers=jobs, mp_context=mp_context
+            ) as convert_pool,
+            ThreadPoolExecutor(max_workers=jobs) as download_pool,
+        ):
+            futures = {
+                download_pool.submit(_download_list, info, convert_pool): info
+                for info in list_infos
+            }
+            for future in as_completed(futures):
+                e = future.exception()
+                if e is not None:
+                    e.add_note(f'While downloading list "{futures[future].key}".')
+                    errors.append(e)
+    if errors:
+        raise ExceptionGroup(f"Failed to download {len(errors)} list(s).", errors)
+
+
+async def _adownload_list(
+    list_info: Top500ListInfo, convert_pool: Executor | None = None
+) -> None:
+    """Like `_download_list()`, but the files are fetched on the event loop and the rest is run in a worker thread."""
+    import asyncio
+
+    raw_files = await _afetch_raw_list_files(list_info)
+    # The conversion is CPU-bound, so it must not run on the event loop.
+    await asyncio.to_thread(_download_list, list_info, convert_pool, raw_files)
+
+
+async def adownload_list(list_info_or_key: str | Top500ListInfo) -> None:
+    """Like `download_list()`, but for asyncio.
+
+    The requests share the rate limit and the connection pool with the blocking API and are awaited instead of
+    blocking a thread, and the conversion runs in a worker thread, so that the event loop is never blocked.
+
+    Args:
+        list_info_or_key (str | Top500ListInfo): An identifier describing the list that shall be downloaded, either as a
+            Top500ListInfo object or only the key as a str.
+    """
+    key = _get_key(list_info_or_key)
+    if _get_list_path(key).exists():
+        return
+    if isinstance(list_info_or_key, str):
+        list_info = await _aget_list_info_from_key(key)
+    else:
+        list_info = _get_list_info(list_info_or_key)
+    await _adownload_list(list_info)
+
+
+async def adownload_all_lists(jobs: int = 1) -> None:
+    """Like `download_all_lists()`, but for asyncio.
+
+    Up to `jobs` lists are downloaded concurrently within the event loop, all of them within the shared rate limit.
+    With `jobs > 1`, the tsv conversion is moved to a pool of `jobs` processes.
+
+    Args:
+        jobs (int, optional): The number of lists that are processed concurrently. Defaults to 1.
+            With `jobs > 1`, the call must be guarded by `if __name__ == "__main__":`, see `download_all_lists()`.
+
+    Raises:
+        ValueError: When `jobs` is smaller than 1.
+        ExceptionGroup: When downloading at least one list failed.
+    """
+    import asyncio
+
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, passed {jobs}.")
+    list_infos = [
+        info
+        async for info in aiter_lists_online(refresh=True)
+        if not _get_list_path(info.key).exists()
+    ]
+    semaphore = asyncio.Semaphore(jobs)
+
+    async def download(info: Top500ListInfo, convert_pool: Executor | None) -> None:
+        async with semaphore:
+            try:
+                await _adownload_list(info, convert_pool)
+            except Exception as e:
+                e.add_note(f'While downloading list "{info.key}".')
+                raise
+
+    convert_pool = None
+    if jobs > 1:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor
+
+        # The conversion workers are spawned (instead of forked), because forking a multi-threaded process is unsafe.
+        convert_pool = ProcessPoolExecutor(
+            max_workers=jobs, mp_context=multiprocessing.get_context("spawn")
+        )
+    try:
+        results = await asyncio.gather(
+            *(download(info, convert_pool) for info in list_infos),
+            return_exceptions=True,
+        )
+    finally:
+        if convert_pool is not None:
+            # Waiting for the workers to exit takes a while, so it must not block the event loop.
+            await asyncio.to_thread(convert_pool.shutdown)
+    errors = [result for result in results if isinstance(result, Exception)]
+    if errors:
+        raise ExceptionGroup(f"Failed to download {len(errors)} list(s).", errors)
+
+
+@dataclasses.dataclass
+class SyncReport:
+    """The outcome of `sync_lists()`, as lists of list keys."""
+
+    added: list[str] = dataclasses.field(
+        default_factory=list
+    )  # Lists that were not available locally
+    updated: list[str] = dataclasses.field(
+        default_factory=list
+    )  # Lists that changed online and were re-downloaded
+    unchanged: list[str] = dataclasses.field(
+        default_factory=list
+    )  # Lists that are up to date
+    failed: list[str] = dataclasses.field(
+        default_factory=list
+    )  # Lists that could not be synced
+
+
+class SyncError(ExceptionGroup):
+    """Raised by `sync_lists()` when at least one list could not be synced.
+
+    The exceptions carry a note with the key of the list they belong to. The report of the lists that were synced is
+    available as `report`.
+    """
+
+    def __new__(cls, message: str, exceptions: list[Exception], report: SyncReport):
+        self = super().__new__(cls, message, exceptions)
+        self.report = report
+        return self
+
+    def __init__(self, message: str, exceptions: list[Exception], report: SyncReport):
+        super().__init__(message, exceptions)
+
+    def derive(self, exceptions):
+        return SyncError(self.message, exceptions, self.report)
+
+
+def _sync_list(
+    list_info: Top500ListInfo,
+    local_list_info: Top500ListInfo,
+    file_states: dict[str, _RemoteFileState] | None,
+) -> bool:
+    """Re-download a local list issue if it has changed online.
+
+    Files with stored HTTP validators are requested conditionally. A file counts as changed when its content hash (or
+    name) differs from the stored state, or, if there is no state, from the file in the local archive.
+
+    Returns:
+        bool: Wether the list has changed and was re-downloaded.
+    """
+    key = list_info.key
+    if file_states is not None and file_states.keys() == {"xml", "excel"}:
+        urls = {kind: file_state.url for kind, file_state in file_states.items()}
+    else:
+        urls = _get_raw_file_urls(list_info)
+        file_states = {}
+    changed = list_info != local_list_info
+    raw_files: dict[str, _RawFile] = {}
+    new_file_states: dict[str, _RemoteFileState] = {}
+    with _ListArchive(_get_list_path(key)) as archive:
+        for kind, url in urls.items():
+            file_state = file_states.get(kind)
+            if file_state is None:
+                result = _fetch_if_changed(url, None, None)
+            else:
+                result = _fetch_if_changed(
+                    url, file_state.etag, file_state.last_modified
+                )
+            if result is None:
+                assert file_state is not None
+                new_file_states[kind] = file_state
+                continue
+            raw_files[kind] = _RawFile.from_fetch_result(result)
+            new_file_states[kind] = _RemoteFileState.from_raw_file(raw_files[kind])
+            if file_state is not None:
+                changed |= (
+                    new_file_states[kind].name,
+                    new_file_states[kind].sha256,
+                ) != (
+                    file_state.name,
+                    file_state.sha256,
+                )
+            elif new_file_states[kind].name in archive.names():
+                with archive.open(new_file_states[kind].name) as f:
+                    changed |= raw_files[kind].content != f.read()
+            else:
+                changed = True
+        if changed:
+            # Files that were not modified are taken from the local archive instead of being fetched again.
+            for kind, file_state in new_file_states.items():
+                if kind not in raw_files:
+                    with archive.open(file_state.name) as f:
+                        raw_files[kind] = _RawFile(
+                            name=file_state.name,
+                            content=f.read(),
+                            url=file_state.url,
+                            etag=file_state.etag,
+                            last_modified=file_state.last_modified,
+                        )
+    if changed:
+        _download_list(list_info, raw_files=_RawListFiles(**raw_files), replace=True)
+    else:
+        _record_sync_state(key, new_file_states)
+    return changed
+
+
+def sync_lists() -> SyncReport:
+    """Bring the download directory in line with the TOP500 list issues that are available online.
+
+    Unlike `download_all_lists()`, which only downloads lists that are missing locally, this also detects lists whose
+    XML or Excel file or whose metadata has changed on top500.org since they were downloaded, and re-downloads and
+    re-converts only those. To keep unchanged lists cheap, the HTTP validators (ETag and Last-Modified) and content
+    hashes of the raw files are stored in `sync.json` in the download directory, so that most files can be checked with
+    a conditional request. Lists that were downloaded before this state existed are compared against the files in
+    their archive once.
+
+    A failure while syncing one list does not abort the others.
+
+    Raises:
+        SyncError: When syncing at least one list failed. The report of the other lists is attached as `report`.
+
+    Returns:
+        SyncReport: Which lists have been added, updated or were unchanged.
+    """
+    if _download_dir is None:
+        _DEFAULT_DOWNLOAD_DIR.mkdir(exist_ok=True)
+    local_index = _update_local_index()
+    sync_state = _load_sync_state()
+    report = SyncReport()
+    errors: list[Exception] = []
+    for info in iter_lists_online(refresh=True):
+        try:
+            if info.key not in local_index:
+                _download_list(info)
+                report.added.append(info.key)
+            elif _sync_list(
+                info, local_index[info.key].list_info, sync_state.get(info.key)
+            ):
+                report.updated.append(info.key)
+            else:
+                report.unchanged.append(info.key)
+        except Exception as e:
+            e.add_note(f'While syncing list "{info.key}".')
+            errors.append(e)
+            report.failed.append(info.key)
+    if errors:
+        raise SyncError(f"Failed to sync {len(errors)} list(s).", errors, report)
+    return report
+
+
+@dataclasses.dataclass(frozen=True)
+class CacheInfo:
+    """Statistics of the in-memory cache of `read_list()`."""
+
+    hits: int  # Number of reads that were served from the cache
+    misses: int  # Number of reads that had to read the list from disk
+    entries: int  # Number of tables that are currently cached
+    size_bytes: int  # Estimated size of the cached tables in bytes
+    max_size_bytes: int  # Byte budget of the cache, see `set_cache_size()`
+
+
+class _ReadCache:
+    """A thread-safe LRU cache for tables read by `read_list()` with a budget in bytes.
+
+    Entries are stored per (list key, source) together with a stamp (size and modification time of the list archive).
+    A lookup with a different stamp is a miss and drops the outdated entry.
+    """
+
+    def __init__(self, max_size_bytes: int):
+        self._entries: OrderedDict[
+            tuple[str, str], tuple[tuple[int, int], pl.DataFrame, int]
+        ] = OrderedDict()
+        self._lock = threading.Lock()
+        self._max_size_bytes = max_size_bytes
+        self._size_bytes = 0
+        self._hits = 0
+        self._misses = 0
+
+    def get(
+        self, cache_key: tuple[str, str], stamp: tuple[int, int]
+    ) -> pl.DataFrame | None:
+        with self._lock:
+            entry = self._entries.get(cache_key)
+            if entry is not None and entry[0] == stamp:
+                self._entries.move_to_end(cache_key)
+                self._hits += 1
+                return entry[1]
+            if entry is not None:
+                self._remove(cache_key)
+            self._misses += 1
+            return None
+
+    def put(
+        self, cache_key: tuple[str, str], stamp: tuple[int, int], df: pl.DataFrame
+    ) -> None:
+        size = df.estimated_size()
+        with self._lock:
+            if cache_key in self._entries:
+                self._remove(cache_key)
+            if size > self._max_size_bytes:
+                return
+            self._entries[cache_key] = (stamp, df, size)
+            self._size_bytes += size
+            self._evict()
+
+    def resize(self, max_size_bytes: int) -> None:
+        with self._lock:
+            self._max_size_bytes = max_size_bytes
+            self._evict()
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+            self._size_bytes = 0
+            self._hits = 0
+            self._misses = 0
+
+    def info(self) -> CacheInfo:
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                entries=len(self._entries),
+                size_bytes=self._size_bytes,
+                max_size_bytes=self._max_size_bytes,
+            )
+
+    def _remove(self, cache_key: tuple[str, str]) -> None:
+        _, _, size = self._entries.pop(cache_key)
+        self._size_bytes -= size
+
+    def _evict(self) -> None:
+        while self._size_bytes > self._max_size_bytes:
+            _, (_, _, size) = self._entries.popitem(last=False)
+            self._size_bytes -= size
+
+
+_DEFAULT_CACHE_SIZE_BYTES = 256 * 1024 * 1024
+_read_cache = _ReadCache(_DEFAULT_CACHE_SIZE_BYTES)
+
+
+def set_cache_size(max_size_bytes: int) -> None:
+    """Set the byte budget of the in-memory cache of `read_list()`.
+
+    When the cached tables exceed the budget, the least recently used ones are evicted. A budget of 0 disables the
+    cache. Defaults to 256 MiB.
+
+    Args:
+        max_size_bytes (int): The maximum estimated size of all cached tables in bytes.
+
+    Raises:
+        ValueError: When `max_size_bytes` is negative.
+    """
+    if max_size_bytes < 0:
+        raise ValueError(
+            f"max_size_bytes must not be negative, passed {max_size_bytes}."
+        )
+    _read_cache.resize(max_size_bytes)
+
+
+def clear_cache() -> None:
+    """Remove all tables from the in-memory cache of `read_list()` and reset its statistics."""
+    _read_cache.clear()
+
+
+def cache_info() -> CacheInfo:
+    """Get statistics about the in-memory cache of `read_list()`.
+
+    Returns:
+        CacheInfo: The current cache statistics.
+    """
+    return _read_cache.info()
+
+
+def read_list(
+    list_info_or_key: str | Top500ListInfo,
+    allow_download: bool = True,
+    source: str = "normalized",
+    columns: Iterable[str] | None = None,
+    validate: bool = False,
+) -> pl.DataFrame:
+    """Read a list as a polars DataFrame. Supports downloading the list automatically if it is not available locally.
+
+    Tables that have been read before are served from an in-memory LRU cache (see `set_cache_size()`, `cache_info()`
+    and `clear_cache()`), as long as the list's archive has not changed since. "normalized-pretty" reuses the cached
+    "normalized" table.
+
+    The low-cardinality columns of the normalized table can be read as `pl.Categorical`, see `set_compact_schema()`.
+
+    With `columns`, only the selected columns are read from disk: from the normalized Arrow IPC file if it is up to date,
+    or else only from the tsv files they come from, so that the XML and the Excel table are only parsed and joined
+    when the selection spans both. Projected reads are served from the cache when the full table is cached, but are
+    not cached themselves.
+
+    The normalized table is checked against the normalized schema once, when the list is downloaded or rebuilt, and the
+    archive records the version and a checksum of the schema it has been checked against. Reads of such lists skip the
+    check; lists of older versions are checked on every read until they are rebuilt (see `rebuild_local_lists()`).
+
+    Args:
+        list_info_or_key (str | Top500ListInfo): An identifier describing the list that shall be read, either as a
+            Top500ListInfo object or only the key as a str. If the file must be downloaded and only the key is given,
+            the list info object is looked up via `iter_lists_online()`, which is served from a cache most of the
+            time.
+        allow_download (bool, optional): Wether downloading the list is allowed when it is not stored locally. If False,
+            a RuntimeError will be raised when the list is not downloaded. Defaults to True.
+        source (str, optional): The data source to read from. Can be one of {"excel", "xml", "normalized",
+            "normalized-pretty"}.
+        columns (Iterable[str] | None, optional): The columns to read, in the order they shall appear in the result.
+            The names are those of the given source, e.g. "r-max-gflops" for "normalized" and "Rmax [GFlop/s]" for
+            "normalized-pretty". Defaults to None, which reads all columns.
+        validate (bool, optional): Wether a normalized table shall be checked against the normalized schema on every
+            read, even when it is served from the cache or its archive records that it has been validated when it was
+            written. Defaults to False.
+
+    Raises:
+        RuntimeError: When `allow_download` is set to `False` and the file is not available locally, or when
+            `validate` is set and the normalized table does not match the schema.
+        ValueError: When `source` is invalid, `columns` is empty or a column does not exist in the source.
+
+    Returns:
+        pl.DataFrame: A polars DataFrame containing the TOP500 list issue data.
+    """
+    import polars as pl
+
+    def select_columns(df: pl.DataFrame, selection: list[str]) -> pl.DataFrame:
+        missing = [column for column in selection if column not in df.columns]
+        if missing:
+            raise ValueError(
+                f'Columns {missing} not found in source "{source}" of list "{key}".'
+            )
+        return df.select(selection)
+
+    def read_tsv(name: str, filename: Path) -> pl.DataFrame:
+        with _ListArchive(filename) as archive:
+            df = _read_tsv_member(name, archive, columns)
+        return df if columns is None else select_columns(df, columns)
+
+    def read_tsv_excel(filename: Path) -> pl.DataFrame:
+        return read_tsv("from_excel.tsv", filename)
+
+    def read_tsv_xml(filename: Path) -> pl.DataFrame:
+        return read_tsv("from_xml.tsv", filename)
+
+    def read_normalized(filename: Path) -> pl.DataFrame:
+        normalized_filename = _get_normalized_list_path(key)
+        if _is_normalized_list_up_to_date(key):
+            with _stage("read-ipc", key) as counters:
+                df = pl.read_ipc(normalized_filename, columns=normalized_columns)
+                counters["bytes"] = normalized_filename.stat().st_size
+        else:
+            source_columns = _get_normalized_source_columns(normalized_columns)
+            mtime_ns = filename.stat().st_mtime_ns
+            with _ListArchive(filename) as archive:
+                verified = _is_schema_verified(_read_schema_info(archive))
+                dfs = {
+                    data_source: _read_tsv_member(
+                        f"from_{data_source}.tsv", archive, names
+                    )
+                    for data_source, names in source_columns.items()
+                }
+            # The tsv files of archives written by the current version have been validated already.
+            df = _normalize_list(
+                dfs.get("xml"),
+                dfs.get("excel"),
+                normalized_columns,
+                validate=validate or not verified,
+            )
+            if normalized_columns is None:
+                # Replace the missing or outdated normalized table, unless the archive has been replaced meanwhile.
+                try:
+                    with _list_lock(key):
+                        if filename.stat().st_mtime_ns == mtime_ns:
+                            _write_normalized_list(df, key)
+                except OSError:
+                    _logger.exception(
+                        'Failed to write the normalized table of list "%s".', key
+                    )
+        if compact:
+            df = _to_compact_schema(df)
+        return df
+
+    def read_normalized_cached(filename: Path) -> pl.DataFrame:
+        df = read_cached(
+            normalized_source, read_normalized, filename, normalized_columns
+        )
+        if validate:
+            _validate_normalized_list(df, compact)
+        return df
+
+    def read_cached(
+        source: str,
+        reader: Callable[[Path], pl.DataFrame],
+        filename: Path,
+        selection: list[str] | None,
+    ) -> pl.DataFrame:
+        stat = filename.stat()
+        stamp = (stat.st_size, stat.st_mtime_ns)
+        df = _read_cache.get((key, source), stamp)
+        read_counters["cache_hits"] = int(df is not None)
+        read_counters["cache_misses"] = int(df is None)
+        if df is not None:
+            if selection is not None:
+                return select_columns(df, selection)
+        else:
+            df = reader(filename)
+            if selection is not None:
+                # Only complete tables are cached.
+                return df
+            _read_cache.put((key, source), stamp, df)
+        # Cloning a polars DataFrame does not copy the data, but protects the cached frame from in-place changes.
+        return df.clone()
+
+    def read_normalized_pretty(filename: Path) -> pl.DataFrame:
+        friendly_names = {
+            m.key: m.friendly_name for m in _get_normalized_column_mappings()
+        }
+        df = read_normalized_cached(filename)
+        df.columns = [friendly_names[column] for column in df.columns]
+        return df
+
+    readers = {
+        "excel": lambda filename: read_cached(
+            "excel", read_tsv_excel, filename, columns
+        ),
+        "xml": lambda filename: read_cached("xml", read_tsv_xml, filename, columns),
+        "normalized": read_normalized_cached,
+        "normalized-pretty": read_normalized_pretty,
+    }
+    allowed_source = set(readers.keys())
+    if source not in allowed_source:
+        raise ValueError(f'source "{source}" not allowed. Must be in {allowed_source}.')
+    normalized_columns = None
+    if columns is not None:
+        columns = list(columns)
+        if not columns:
+            raise ValueError(
+                "columns must not be empty, pass None to read all columns."
+            )
+        if len(set(columns)) != len(columns):
+            raise ValueError(f"columns must not contain duplicates, passed {columns}.")
+        if source in ("normalized", "normalized-pretty"):
+            mappings = _get_normalized_column_mappings()
+            keys_by_name = {
+                (m.key if source == "normalized" else m.friendly_name): m.key
+                for m in mappings
+            }
+            unknown = [column for column in columns if column not in keys_by_name]
+            if unknown:
+                raise ValueError(
+                    f'Columns {unknown} not found in source "{source}". Must be in {list(keys_by_name)}.'
+                )
+            normalized_columns = [keys_by_name[column] for column in columns]
+    compact = _compact_schema
+    # The compact table is cached separately, so that switching the schema does not return stale dtypes.
+    normalized_source = "normalized-compact" if compact else "normalized"
+    key = _get_key(list_info_or_key)
+    assert _RE_LIST_KEY.match(key)
+    filename = _get_list_path(key)
+    if not filename.exists():
+        if not allow_download:
+            raise RuntimeError(
+                f'List "{key}" was not found locally and allow_download == False.'
+            )
+        download_list(list_info_or_key)
+    assert filename.exists()
+    with _stage("read", key) as read_counters:
+        df = readers[source](filename)
+        read_counters["rows"] = df.height
+    return df
+
+
+async def aread_list(
+    list_info_or_key: str | Top500ListInfo,
+    allow_download: bool = True,
+    source: str = "normalized",
+    columns: Iterable[str] | None = None,
+    validate: bool = False,
+) -> pl.DataFrame:
+    """Like `read_list()`, but for asyncio. A missing list is downloaded via `adownload_list()` and the table is read in
+    a worker thread, so the event loop is never blocked.
+
+    Args:
+        list_info_or_key (str | Top500ListInfo): An identifier describing the list that shall be read, either as a
+            Top500ListInfo object or only the key as a str.
+        allow_download (bool, optional): Wether downloading the list is allowed when it is not stored locally. If False,
+            a RuntimeError will be raised when the list is not downloaded. Defaults to True.
+        source (str, optional): The data source to read from, see `read_list()`.
+        columns (Iterable[str] | None, optional): The columns to read, see `read_list()`. Defaults to None.
+        validate (bool, optional): Wether the normalized table shall be checked against the schema, see `read_list()`.
+            Defaults to False.
+
+    Raises:
+        RuntimeError: When `allow_download` is set to `False` and the file is not available locally.
+
+    Returns:
+        pl.DataFrame: A polars DataFrame containing the TOP500 list issue data.
+    """
+    import asyncio
+
+    key = _get_key(list_info_or_key)
+    if not _get_list_path(key).exists():
+        if not allow_download:
+            raise RuntimeError(
+                f'List "{key}" was not found locally and allow_download == False.'
+            )
+        await adownload_list(list_info_or_key)
+    return await asyncio.to_thread(read_list, key, False, source, columns, validate)
+
+
+def _get_list_info_columns_schema() -> dict[str, pl.DataType]:
+    """Get the schema of the columns that `_prepend_list_info_columns()` adds."""
+    import polars as pl
+
+    return {"list_key": pl.String, "list_number": pl.Int64, "published_on": pl.Date}
+
+
+def _prepend_list_info_columns[F: (pl.DataFrame, pl.LazyFrame)](
+    df: F, list_info: Top500ListInfo
+) -> F:
+    """Prepend the columns `list_key`, `list_number` and `published_on`, so that rows of multiple lists can be told apart."""
+    import polars as pl
+
+    return df.select(
+        pl.lit(list_info.key).alias("list_key"),
+        pl.lit(list_info.number, dtype=pl.Int64).alias("list_number"),
+        pl.lit(list_info.published_on).alias("published_on"),
+        pl.all(),
+    )
+
+
+def scan_lists(
+    keys: Iterable[str | Top500ListInfo] | None = None,
+    source: str = "normalized",
+    newest_first: bool = True,
+) -> pl.LazyFrame:
+    """Lazily scan multiple local lists as a single polars LazyFrame.
+
+    The normalized tables of all lists are concatenated and the columns `list_key`, `list_number` and `published_on`
+    are prepended, so that the lists can be told apart. For lists that have an up-to-date normalized Arrow IPC file
+    (see `download_list()`), the file is scanned via `pl.scan_ipc()`, so that projections and predicates are pushed
+    down to the storage layer and e.g. selecting the #1 Rmax of every list only reads two columns per list. Other lists
+    are read via `read_list()`. The low-cardinality columns can be scanned as `pl.Categorical`, see
+    `set_compact_schema()`.
+
+    Lists are never downloaded by this function.
+
+    Args:
+        keys (Iterable[str | Top500ListInfo] | None, optional): The lists that shall be scanned, in this order. If None,
+            all local lists are scanned. Defaults to None.
+        source (str, optional): The data source to read from. Can be one of {"normalized", "normalized-pretty"}. The
+            sources "excel" and "xml" are not supported, because their columns differ between the lists. Defaults to
+            "normalized".
+        newest_first (bool, optional): Wether the lists shall be sorted newest-first when `keys` is None. Defaults to
+            True.
+
+    Raises:
+        ValueError: When `source` is not supported.
+        RuntimeError: When one of the given lists is not available locally.
+
+    Returns:
+        pl.LazyFrame: A LazyFrame containing the rows of all lists.
+    """
+    import polars as pl
+
+    allowed_source = {"normalized", "normalized-pretty"}
+    if source not in allowed_source:
+        raise ValueError(f'source "{source}" not allowed. Must be in {allowed_source}.')
+    local_list_infos = {
+        list_info.key: list_info
+        for list_info in iter_lists_local(newest_first=newest_first)
+    }
+    if keys is None:
+        keys = local_list_infos.keys()
+    mappings = _get_normalized_column_mappings()
+    compact = _compact_schema
+    frames = []
+    for list_info_or_key in keys:
+        key = _get_key(list_info_or_key)
+        list_info = local_list_infos.get(key)
+        if list_info is None:
+            raise RuntimeError(f'List "{key}" was not found locally.')
+        if _is_normalized_list_up_to_date(key):
+            lf = pl.scan_ipc(_get_normalized_list_path(key))
+        else:
+            lf = read_list(key, allow_download=False, source="normalized").lazy()
+        if compact:
+            lf = _to_compact_schema(lf)
+        frames.append(_prepend_list_info_columns(lf, list_info))
+    if frames:
+        lf = pl.concat(frames, how="vertical")
+    else:
+        lf = pl.LazyFrame(
+            schema={
+                **_get_list_info_columns_schema(),
+                **_get_normalized_schema(compact),
+            }
+        )
+    if source == "normalized-pretty":
+        lf = lf.rename({m.key: m.friendly_name for m in mappings})
+    return lf
+
+
+class ReadListsError(ExceptionGroup):
+    """Raised by `read_lists()` when at least one list could not be read.
+
+    The exceptions carry a note with the key of the list they belong to. The lists that were read successfully are
+    available as `results`, in the same form `read_lists()` would have returned them.
+    """
+
+    def __new__(
+        cls,
+        message: str,
+        exceptions: list[Exception],
+        results: dict[str, pl.DataFrame] | pl.DataFrame,
+    ):
+        self = super().__new__(cls, message, exceptions)
+        self.results = results
+        return self
+
+    def __init__(
+        self,
+        message: str,
+        exceptions: list[Exception],
+        results: dict[str, pl.DataFrame] | pl.DataFrame,
+    ):
+        super().__init__(message, exceptions)
+
+    def derive(self, exceptions):
+        return ReadListsError(self.message, exceptions, self.results)
+
+
+def read_lists(
+    keys: Iterable[str | Top500ListInfo] | None = None,
+    source: str = "normalized",
+    workers: int | None = None,
+    concat: bool = False,
+    newest_first: bool = True,
+) -> dict[str, pl.DataFrame] | pl.DataFrame:
+    """Read multiple local lists in parallel.
+
+    The lists are read via `read_list()` by a pool of threads. Decompressing the archives and parsing the tables
+    releases the GIL, so the lists are read on multiple cores without copying the tables between processes. A list
+    that cannot be read does not abort the others; all failures are raised together as a `ReadListsError` after the
+    remaining lists have been read, which also carries the successful results.
+
+    Lists are never downloaded by this function.
+
+    Args:
+        keys (Iterable[str | Top500ListInfo] | None, optional): The lists that shall be read, in this order. If None,
+            all local lists are read. Defaults to None.
+        source (str, optional): The data source to read from, see `read_list()`. Defaults to "normalized".
+        workers (int | None, optional): The maximum number of lists that are read at the same time. If None, the
+            default of `concurrent.futures.ThreadPoolExecutor` is used, which depends on the number of CPUs. Defaults to
+            None.
+        concat (bool, optional): Wether a single DataFrame shall be returned instead of a dict. The tables are
+            concatenated and the columns `list_key`, `list_number` and `published_on` are prepended (see
+            `scan_lists()`). For the sources "excel" and "xml", whose columns differ between the lists, missing columns
+            are filled with nulls and differing types are cast to a common supertype. Defaults to False.
+        newest_first (bool, optional): Wether the lists shall be sorted newest-first when `keys` is None. Defaults to
+            True.
+
+    Raises:
+        ValueError: When `source` or `workers` is invalid.
+        ReadListsError: When reading at least one list failed.
+
+    Returns:
+        dict[str, pl.DataFrame] | pl.DataFrame: The tables by list key, in the order of `keys`, or a single table when
+            `concat` is True.
     """
+    from concurrent.futures import ThreadPoolExecutor
 
-    def download_file_from_link_text(
-        link_text: str, anchors: Iterable[HtmlTag], tar: TarFile
-    ):
-        download_anchor = next(filter(lambda a: a.text == link_text, anchors), None)
-        assert download_anchor is not None, ("No download link found", link_text)
-        href = download_anchor["href"]
-        assert href is not None
-        full_download_url = HttpUrl(urljoin(str(list_info.url), href))
-        response2 = _fetch(full_download_url)
-        response2.raise_for_status()
-        content = response2.content
-        url = str(full_download_url)
-        filename_from_url = url[url.rfind("/") + 1 :]
-        tarinfo = TarInfo(name=filename_from_url)
-        tarinfo.size = len(content)
-        bio = BytesIO(content)
-        tar.addfile(tarinfo, bio)
-        bio.seek(0)
-        return bio
-
-    def write_tsv_from_excel(excel_buf: Buffer, tar: TarFile):
-        """Create a tsv file from an Excel file (.xls or .xslx) and write it to a tar file.
-
-        We are writing .tsv (and not .csv), because commas are plenty in the tables and quoting / escaping is annoying.
-        There are a few instances of tabs in the cell content, but these are only a result of careless copy-pasting, so
-        it's okay to remove them.
-        To convert the Excel files to .tsv, we use `pandas.read_excel()` and `pandas.to_csv()`.
-        We are unable to use polars for this task, because `polars.read_excel()` fails on some of the Excel files.
-        The preprocessing is kept minimal; all cell content is preserved as-is, whereever possible.
-
-        Preprocessing steps:
-            - Replace tabs and line breaks with spaces.
-            - Remove all rows and columns that are empty or only contain whitespace. This is necessary, because the
-              lists up until 2007-11 contained an empty header line.
-
-        Args:
-            excel_buf (Buffer): A buffer containing the Excel data.
-            tar (TarFile): The tar file to write to.
-        """
-        df = pd.read_excel(excel_buf, dtype=str, header=None)
-        df = df.replace({r"[\t\n\r]": " "}, regex=True)
-        df = df.fillna("")
-        df = df[~df.apply(lambda row: row.str.fullmatch(r"\s*").all(), axis=1)]
-        df = df.loc[:, ~df.apply(lambda col: col.str.fullmatch(r"\s*").all(), axis=0)]
-        sio = BytesIO()
-        df.to_csv(sio, index=False, header=False, sep="\t", quoting=csv.QUOTE_NONE)
-        sio_len = sio.tell()
-        sio.seek(0)
-        tarinfo = TarInfo(name="from_excel.tsv")
-        tarinfo.size = sio_len
-        tar.addfile(tarinfo, sio)
-
-    def write_tsv_from_xml(xml_buf: Buffer, tar: TarFile):
-        """Create a tsv file from an XML file and write to a tar file.
-
-        Args:
-            xml_buf (Buffer): A buffer containing the XML data.
-            tar (TarFile): The tar file to write to.
-        """
-        sio = StringIO(xml_buf.read().decode("utf-8"))
-        sio2 = StringIO()
-        re_installation_site = re.compile(r"</?top500:installation-site>")
-        for line in sio:
-            if re_installation_site.match(line.strip()):
-                continue
-            sio2.write(line.replace("\t", " ") + "\n")
-        df = pd.read_xml(sio2, dtype=str)
-        sio3 = BytesIO()
-        df.to_csv(sio3, index=False, header=True, sep="\t", quoting=csv.QUOTE_NONE)
-        sio_len = sio3.tell()
-        sio3.seek(0)
-        tarinfo = TarInfo(name="from_xml.tsv")
-        tarinfo.size = sio_len
-        tar.addfile(tarinfo, sio3)
-
-    def write_metadata(list_info: Top500ListInfo, tar: TarFile):
-        bio = BytesIO()
-        adapter = TypeAdapter(Top500ListInfo)
-        json_bytes = adapter.dump_json(list_info, indent=2)
-        bio = BytesIO(json_bytes)
-        tarinfo = TarInfo(name="metadata.json")
-        tarinfo.size = len(json_bytes)
-        tar.addfile(tarinfo, bio)
+    import polars as pl
 
-    key = _get_key(list_info_or_key)
+    allowed_source = {"excel", "xml", "normalized", "normalized-pretty"}
+    if source not in allowed_source:
+        raise ValueError(f'source "{source}" not allowed. Must be in {allowed_source}.')
+    if workers is not None and workers < 1:
+        raise ValueError(f"workers must be at least 1, passed {workers}.")
+    local_list_infos = {
+        list_info.key: list_info
+        for list_info in iter_lists_local(newest_first=newest_first)
+    }
+    if keys is None:
+        keys = local_list_infos.values()
+    list_infos = {}
+    for list_info_or_key in keys:
+        key = _get_key(list_info_or_key)
+        if isinstance(list_info_or_key, Top500ListInfo):
+            list_infos[key] = list_info_or_key
+        else:
+            list_infos[key] = local_list_infos.get(key)
+    frames: dict[str, pl.DataFrame] = {}
+    errors: list[Exception] = []
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = {
+            key: pool.submit(read_list, key, allow_download=False, source=source)
+            for key in list_infos
+        }
+        for key, future in futures.items():
+            e = future.exception()
+            if e is not None:
+                e.add_note(f'While reading list "{key}".')
+                errors.append(e)
+            else:
+                frames[key] = future.result()
+    results: dict[str, pl.DataFrame] | pl.DataFrame = frames
+    if concat:
+        if frames:
+            results = pl.concat(
+                (
+                    _prepend_list_info_columns(df, list_infos[key])
+                    for key, df in frames.items()
+                ),
+                how="vertical"
+                if source.startswith("normalized")
+                else "diagonal_relaxed",
+            )
+        else:
+            schema = _get_list_info_columns_schema()
+            if source.startswith("normalized"):
+                mappings = _get_normalized_column_mappings()
+                names = {
+                    "normalized": [m.key for m in mappings],
+                    "normalized-pretty": [m.friendly_name for m in mappings],
+                }[source]
+                dtypes = _get_normalized_schema(_compact_schema).values()
+                schema |= dict(zip(names, dtypes))
+            results = pl.DataFrame(schema=schema)
+    if errors:
+        raise ReadListsError(f"Failed to read {len(errors)} list(s).", errors, results)
+    return results
 
-    target_path = get_download_dir() / f"{key}.tar.gz"
-    if target_path.exists():
-        return
 
-    list_info = _get_list_info(list_info_or_key)
+# The columns of the history index, see `system_history()`.
+_HISTORY_COLUMNS = (
+    "system-id",
+    "site-id",
+    "rank",
+    "name",
+    "site",
+    "r-max-gflops",
+    "rpeak-gflops",
+    "power-kw",
+)
+_HISTORY_STATE_ADAPTER = TypeAdapter(dict[str, str])
+_history_lock = threading.Lock()
+
+
+def _get_history_paths() -> tuple[Path, Path, Path]:
+    """Get the paths of the history index: the table sorted by system ID, the table sorted by site ID and the state,
+    which maps the key of every list in the tables to the SHA-256 checksum of its archive."""
+    download_dir = get_download_dir()
+    return (
+        download_dir / "history.systems.arrow",
+        download_dir / "history.sites.arrow",
+        download_dir / "history.json",
+    )
+
 
-    with tempfile.NamedTemporaryFile(delete_on_close=True) as tmp:
-        with tarfile.open(name=tmp.name, mode="w:gz") as tar:
-            write_metadata(list_info, tar)
-            response = _fetch(list_info.url)
-            response.raise_for_status()
-            html = BeautifulSoup(response.text, "html.parser")
-            navbar = html.find(id="navbarSupportedContentSubmenu")
-            anchors = navbar.find_all("a")
-            xml_buf = download_file_from_link_text("TOP500 List (XML)", anchors, tar)
-            excel_buf = download_file_from_link_text(
-                "TOP500 List (Excel)", anchors, tar
+def _load_history_state() -> dict[str, str]:
+    try:
+        return _HISTORY_STATE_ADAPTER.validate_json(
+            _get_history_paths()[2].read_bytes()
+        )
+    except (OSError, pydantic.ValidationError):
+        return {}
+
+
+def _get_history_table(id_column: str, rebuild: bool = False) -> pl.DataFrame:
+    """Get the history of all local lists, sorted by `id_column` (either "system-id" or "site-id") and publication
+    date, with missing IDs last.
+
+    The table is stored in the download directory, once sorted by system ID and once by site ID, and kept up to date
+    incrementally: only the rows of lists that were added or changed since (according to the local index) are read
+    from the normalized tables, and the rows of removed lists are dropped.
+
+    Args:
+        id_column (str): The column that the table shall be sorted by.
+        rebuild (bool, optional): Wether the stored tables shall be discarded and rebuilt from all lists. Defaults to
+            False.
+
+    Returns:
+        pl.DataFrame: The sorted table.
+    """
+    import polars as pl
+
+    systems_path, sites_path, state_path = _get_history_paths()
+    path = {"system-id": systems_path, "site-id": sites_path}[id_column]
+    with _history_lock:
+        wanted_state = {
+            key: entry.sha256 for key, entry in _update_local_index().items()
+        }
+        state = {} if rebuild else _load_history_state()
+        if state == wanted_state and path.exists():
+            return pl.read_ipc(path)
+        changed_keys = [
+            key for key, sha256 in wanted_state.items() if state.get(key) != sha256
+        ]
+        if state and systems_path.exists():
+            df = pl.read_ipc(systems_path).filter(
+                pl.col("list_key").is_in(
+                    [key for key in wanted_state if key not in changed_keys]
+                )
             )
-            write_tsv_from_xml(xml_buf, tar)
-            write_tsv_from_excel(excel_buf, tar)
+        else:
+            changed_keys = list(wanted_state)
+            df = None
+        df_changed = (
+            scan_lists(changed_keys).select(
+                "list_key", "list_number", "published_on", *_HISTORY_COLUMNS
+            )
+        ).collect()
+        df = df_changed if df is None else pl.concat([df, df_changed])
+        tables = {
+            column: df.sort(column, "published_on", nulls_last=True)
+            for column in ("system-id", "site-id")
+        }
+        try:
+            with _atomic_output(systems_path) as f:
+                tables["system-id"].write_ipc(f, compression="uncompressed")
+            with _atomic_output(sites_path) as f:
+                tables["site-id"].write_ipc(f, compression="uncompressed")
+            # The state is written last, so that an interrupted update is repeated.
+            with _atomic_output(state_path) as f:
+                f.write(_HISTORY_STATE_ADAPTER.dump_json(wanted_state, indent=2))
+        except OSError:
+            # The history index is only a cache, so a read-only download directory is not an error.
+            pass
+        return tables[id_column]
 
-        if _download_dir is None:
-            _DEFAULT_DOWNLOAD_DIR.mkdir(exist_ok=True)
 
-        # For now, let's just copy the file for safety.
-        # Later, let's fo a hard-link if supported.
-        shutil.copy(tmp.name, target_path)
+def _query_history(id_column: str, id_value: int) -> pl.DataFrame:
+    with _stage("history", f"{id_column}={id_value}") as counters:
+        df = _get_history_table(id_column)
+        # The table is sorted by the ID with missing IDs last, so the rows of an ID can be found by binary search.
+        ids = df[id_column]
+        ids = ids[: len(ids) - ids.null_count()]
+        start = ids.search_sorted(id_value, side="left")
+        end = ids.search_sorted(id_value, side="right")
+        df = df.slice(start, end - start)
+        counters["rows"] = df.height
+    return df
 
 
-def download_all_lists() -> None:
-    """Downloaded all TOP500 list issues that are available online to the download directory."""
-    for info in iter_lists_online():
-        download_list(info)
+def system_history(system_id: int) -> pl.DataFrame:
+    """Get every appearance of a system in the local lists, oldest first.
 
+    The appearances are looked up in a history index in the download directory (`history.systems.arrow`), which is
+    sorted by system ID and memory-mapped, so the per-list archives are not touched. The index is brought up to date
+    when lists have been added or changed since the last query, which only reads the new lists.
+
+    Args:
+        system_id (int): The ID of the system, see the `system-id` column of the normalized table.
+
+    Returns:
+        pl.DataFrame: One row per list the system appears in, with the columns `list_key`, `list_number`,
+            `published_on`, `system-id`, `site-id`, `rank`, `name`, `site`, `r-max-gflops`, `rpeak-gflops` and
+            `power-kw`. Empty if the system does not appear in any local list.
+    """
+    return _query_history("system-id", system_id)
 
-def read_list(
-    list_info_or_key: str | Top500ListInfo,
-    allow_download: bool = True,
-    source: str = "normalized",
-) -> pl.DataFrame:
-    """Read a list as a polars DataFrame. Supports downloading the list automatically if it is not available locally.
+
+def site_history(site_id: int) -> pl.DataFrame:
+    """Get every appearance of a system of a site in the local lists, oldest first.
+
+    Like `system_history()`, but for all systems of the given site (see the `site-id` column of the normalized table),
+    looked up in `history.sites.arrow`.
 
     Args:
-        list_info_or_key (str | Top500ListInfo): An identifier describing the list that shall be read, either as a
-            Top500ListInfo object or only the key as a str. If the file must be downloaded and only the key is given,
-            the list info object will be constructed by calling `iter_lists_online()`. It is therefore discouraged to
-            pass only the key when multiple lists shall be read. Instead, call `iter_lists_online()` once and store
-            the list info objects.
-        allow_download (bool, optional): Wether downloading the list is allowed when it is not stored locally. If False,
-            a RuntimeError will be raised when the list is not downloaded. Defaults to True.
-        source (str, optional): The data source to read from. Can be one of {"excel", "xml", "normalized",
-            "normalized-pretty"}.
+        site_id (int): The ID of the site.
+
+    Returns:
+        pl.DataFrame: One row per list and system of the site, with the same columns as `system_history()`.
+    """
+    return _query_history("site-id", site_id)
+
+
+# The values of the `change` column of `diff_lists()`.
+_DIFF_CHANGES = ("entered", "exited", "upgraded", "moved", "unchanged")
+
+
+def _get_previous_local_keys() -> dict[str, str]:
+    """Map the key of every local list whose previous issue is available locally as well to the key of that issue.
+
+    The previous issue is found via the running list number instead of the key, because the keys are not regular: the
+    November 1995 issue has the key "1995-12".
+    """
+    index = _update_local_index()
+    keys_by_number = {
+        index_entry.list_info.number: key for key, index_entry in index.items()
+    }
+    return {
+        key: keys_by_number[index_entry.list_info.number - 1]
+        for key, index_entry in index.items()
+        if index_entry.list_info.number - 1 in keys_by_number
+    }
+
+
+def _get_list_diff_path(key: str) -> Path:
+    """Get the path of the materialized diff from the previous list issue to the given one."""
+    return get_download_dir() / f"{key}.diff.arrow"
+
+
+def _is_list_diff_up_to_date(old_key: str, new_key: str) -> bool:
+    """Check if the materialized diff between two consecutive lists exists and is at least as new as the archives of
+    both lists."""
+    diff_path = _get_list_diff_path(new_key)
+    if not diff_path.exists():
+        return False
+    return diff_path.stat().st_mtime_ns >= max(
+        _get_list_path(old_key).stat().st_mtime_ns,
+        _get_list_path(new_key).stat().st_mtime_ns,
+    )
+
+
+def _get_list_diff_schema() -> dict[str, pl.DataType]:
+    import polars as pl
+
+    return {
+        "old_list_key": pl.String,
+        "new_list_key": pl.String,
+        "system-id": pl.Int64,
+        "name": pl.String,
+        "site": pl.String,
+        "change": pl.String,
+        "old-rank": pl.Int64,
+        "new-rank": pl.Int64,
+        "rank-change": pl.Int64,
+        "old-r-max-gflops": pl.Float64,
+        "new-r-max-gflops": pl.Float64,
+        "r-max-change-gflops": pl.Float64,
+    }
+
+
+def _compute_list_diff(old_key: str, new_key: str) -> pl.DataFrame:
+    """Join two local lists on the system ID and classify every system, see `diff_lists()`."""
+    import polars as pl
+
+    columns = ["system-id", "rank", "name", "site", "r-max-gflops"]
+    with _stage("diff", f"{old_key}..{new_key}") as counters:
+        # A system ID should only appear once per list. Should it appear more than once, the occurrences are paired up
+        # in rank order instead of multiplying the rows.
+        join_columns = ["system-id", "occurrence"]
+        df_old, df_new = (
+            read_list(key, allow_download=False, columns=columns)
+            .sort("rank")
+            .with_columns(pl.int_range(pl.len()).over("system-id").alias("occurrence"))
+            .rename({c: f"{prefix}-{c}" for c in columns if c not in join_columns})
+            for key, prefix in ((old_key, "old"), (new_key, "new"))
+        )
+        df = df_old.join(df_new, on=join_columns, how="full", coalesce=True)
+        old_rank, new_rank = pl.col("old-rank"), pl.col("new-rank")
+        old_r_max, new_r_max = pl.col("old-r-max-gflops"), pl.col("new-r-max-gflops")
+        df = df.select(
+            pl.lit(old_key).alias("old_list_key"),
+            pl.lit(new_key).alias("new_list_key"),
+            "system-id",
+            pl.coalesce("new-name", "old-name").alias("name"),
+            pl.coalesce("new-site", "old-site").alias("site"),
+            pl.when(old_rank.is_null())
+            .then(pl.lit("entered"))
+            .when(new_rank.is_null())
+            .then(pl.lit("exited"))
+            .when(old_r_max.ne_missing(new_r_max))
+            .then(pl.lit("upgraded"))
+            .when(old_rank != new_rank)
+            .then(pl.lit("moved"))
+            .otherwise(pl.lit("unchanged"))
+            .alias("change"),
+            old_rank,
+            new_rank,
+            # Positive values are moves towards the top of the list.
+            (old_rank - new_rank).alias("rank-change"),
+            old_r_max,
+            new_r_max,
+            (new_r_max - old_r_max).alias("r-max-change-gflops"),
+        ).sort("new-rank", "old-rank", nulls_last=True)
+        assert df.schema == _get_list_diff_schema()
+        counters["rows"] = df.height
+    return df
+
+
+def _write_list_diff(df: pl.DataFrame, key: str) -> None:
+    try:
+        with _atomic_output(_get_list_diff_path(key)) as f:
+            df.write_ipc(f, compression="uncompressed")
+    except OSError:
+        # The diff is derived data, so a read-only download directory is not an error.
+        pass
+
+
+def _get_consecutive_list_diff(old_key: str, new_key: str) -> pl.DataFrame:
+    """Get the diff between two consecutive list issues, from its materialized file if it is up to date."""
+    import polars as pl
+
+    if _is_list_diff_up_to_date(old_key, new_key):
+        return pl.read_ipc(_get_list_diff_path(new_key))
+    df = _compute_list_diff(old_key, new_key)
+    _write_list_diff(df, new_key)
+    return df
+
+
+def _update_adjacent_list_diffs(keys: Iterable[str]) -> None:
+    """Materialize the diffs between the given lists and their previous and next list issues, as far as they are
+    available locally and not up to date already."""
+    previous_keys = _get_previous_local_keys()
+    keys = set(keys)
+    for new_key, old_key in sorted(previous_keys.items()):
+        if (old_key in keys or new_key in keys) and not _is_list_diff_up_to_date(
+            old_key, new_key
+        ):
+            _write_list_diff(_compute_list_diff(old_key, new_key), new_key)
+
+
+def diff_lists(a: str | Top500ListInfo, b: str | Top500ListInfo) -> pl.DataFrame:
+    """Compare two local lists system by system.
+
+    The lists are joined on the `system-id` column of the normalized table. Every system that appears in at least one
+    of the lists gets a row, whose `change` column is one of
+    - "entered": The system is only in list `b`.
+    - "exited": The system is only in list `a`.
+    - "upgraded": The system is in both lists, but its Rmax has changed.
+    - "moved": The system is in both lists with the same Rmax, but at a different rank.
+    - "unchanged": The system is in both lists at the same rank and with the same Rmax.
+
+    Diffs between consecutive list issues (e.g. "2024-11" and "2025-06") are materialized next to the archive of the
+    newer list (e.g. `2025-06.diff.arrow`) when a list is downloaded, so they are only computed once. See
+    `scan_list_diffs()` to read the diffs of all consecutive issues at once.
+
+    Lists are never downloaded by this function.
+
+    Args:
+        a (str | Top500ListInfo): The older list.
+        b (str | Top500ListInfo): The newer list.
 
     Raises:
-        RuntimeError: When `allow_download` is set to `False` and the file is not available locally.
+        RuntimeError: When one of the lists is not available locally.
 
     Returns:
-        pl.DataFrame: A polars DataFrame containing the TOP500 list issue data.
+        pl.DataFrame: The columns `old_list_key`, `new_list_key`, `system-id`, `name` and `site` (from the newer list if
+            the system is in both), `change`, `old-rank`, `new-rank`, `rank-change` (positive when the system moved up),
+            `old-r-max-gflops`, `new-r-max-gflops` and `r-max-change-gflops`, sorted by the new and then the old rank.
     """
+    old_key = _get_key(a)
+    new_key = _get_key(b)
+    for key in (old_key, new_key):
+        if not _get_list_path(key).exists():
+            raise RuntimeError(f'List "{key}" was not found locally.')
+    if old_key == _get_previous_local_keys().get(new_key):
+        return _get_consecutive_list_diff(old_key, new_key)
+    return _compute_list_diff(old_key, new_key)
 
-    def read_tsv(name: str, tar: TarFile) -> pl.DataFrame:
-        tsv_member = tar.getmember(name)
-        tsv_fp = tar.extractfile(tsv_member)
-        df = pl.read_csv(
-            tsv_fp, separator="\t", infer_schema_length=10000, quote_char=None
+
+def scan_list_diffs(newest_first: bool = True) -> pl.LazyFrame:
+    """Lazily scan the diffs between all consecutive local list issues as a single polars LazyFrame.
+
+    The diffs have the columns of `diff_lists()`. Diffs that have not been materialized yet (e.g. for lists downloaded
+    by an older version) are computed and stored first. Pairs where one of the issues is missing locally are skipped.
+
+    Args:
+        newest_first (bool, optional): Wether the diffs shall be sorted newest-first. Defaults to True.
+
+    Returns:
+        pl.LazyFrame: A LazyFrame containing the rows of all diffs.
+    """
+    import polars as pl
+
+    previous_keys = _get_previous_local_keys()
+    frames = []
+    for new_key in sorted(previous_keys, reverse=newest_first):
+        old_key = previous_keys[new_key]
+        if _is_list_diff_up_to_date(old_key, new_key):
+            frames.append(pl.scan_ipc(_get_list_diff_path(new_key)))
+        else:
+            frames.append(_get_consecutive_list_diff(old_key, new_key).lazy())
+    if not frames:
+        return pl.LazyFrame(schema=_get_list_diff_schema())
+    return pl.concat(frames, how="vertical")
+
+
+# The columns of the normalized table that `aggregates()` can group by, and the Top-N cutoffs it is computed for.
+_AGGREGATE_DIMENSIONS = (
+    "country",
+    "manufacturer",
+    "accelerator",
+    "interconnect-family",
+    "segment",
+)
+_AGGREGATE_TOP_N = (10, 50, 100, 500)
+_AGGREGATES_STATE_ADAPTER = TypeAdapter(dict[str, str])
+_aggregates_lock = threading.Lock()
+# The aggregates of the last query, split by dimension and cutoff, together with the download directory and the
+# checksums of its archives by list key (from the local index) when they were loaded.
+_aggregates_memo: (
+    tuple[tuple[Path, dict[str, str]], dict[tuple[str, int], pl.DataFrame]] | None
+) = None
+
+
+def _get_aggregates_paths() -> tuple[Path, Path]:
+    """Get the paths of the materialized aggregates and of their state, which maps the key of every list in the table
+    to the SHA-256 checksum of its archive."""
+    download_dir = get_download_dir()
+    return download_dir / "aggregates.arrow", download_dir / "aggregates.json"
+
+
+def _compute_aggregates(lf: pl.LazyFrame) -> pl.DataFrame:
+    """Compute the aggregates of the lists in a LazyFrame as returned by `scan_lists()`, see `aggregates()`."""
+    import polars as pl
+
+    list_columns = list(_get_list_info_columns_schema())
+    frames = []
+    for top_n in _AGGREGATE_TOP_N:
+        lf_top = lf.filter(pl.col("rank") <= top_n)
+        for dimension in ("all", *_AGGREGATE_DIMENSIONS):
+            group_columns = (
+                list_columns if dimension == "all" else [*list_columns, dimension]
+            )
+            frames.append(
+                lf_top.group_by(group_columns)
+                .agg(
+                    pl.len().cast(pl.Int64).alias("systems"),
+                    pl.col("r-max-gflops").sum().alias("r-max-total-gflops"),
+                    pl.col("r-max-gflops").median().alias("r-max-median-gflops"),
+                    pl.col("power-kw").sum().alias("power-total-kw"),
+                )
+                .select(
+                    *list_columns,
+                    pl.lit(dimension).alias("dimension"),
+                    (
+                        pl.lit(None, dtype=pl.String)
+                        if dimension == "all"
+                        else pl.col(dimension).cast(pl.String)
+                    ).alias("value"),
+                    pl.lit(top_n, dtype=pl.Int64).alias("top-n"),
+                    "systems",
+                    "r-max-total-gflops",
+                    "r-max-median-gflops",
+                    "power-total-kw",
+                    (
+                        pl.col("systems") / pl.col("systems").sum().over("list_key")
+                    ).alias("system-share"),
+                    (
+                        pl.col("r-max-total-gflops")
+                        / pl.col("r-max-total-gflops").sum().over("list_key")
+                    ).alias("r-max-share"),
+                )
+            )
+    return pl.concat(frames).collect()
+
+
+def _update_aggregates(rebuild: bool = False) -> pl.DataFrame:
+    """Bring the materialized aggregates (`aggregates.arrow` in the download directory) up to date.
+
+    Like the history index (see `_get_history_table()`), only the lists that were added or changed since the last
+    update (according to the local index) are aggregated, and the rows of removed lists are dropped.
+
+    Args:
+        rebuild (bool, optional): Wether the stored aggregates shall be discarded and recomputed from all lists.
+            Defaults to False.
+
+    Returns:
+        pl.DataFrame: The aggregates of all local lists, sorted by dimension, cutoff and list number.
+    """
+    import polars as pl
+
+    table_path, state_path = _get_aggregates_paths()
+    with _aggregates_lock, _stage("aggregate") as counters:
+        wanted_state = {
+            key: entry.sha256 for key, entry in _update_local_index().items()
+        }
+        state = {} if rebuild else _load_aggregates_state()
+        if state == wanted_state and table_path.exists():
+            counters["lists"] = 0
+            return pl.read_ipc(table_path)
+        changed_keys = [
+            key for key, sha256 in wanted_state.items() if state.get(key) != sha256
+        ]
+        if state and table_path.exists():
+            df = pl.read_ipc(table_path).filter(
+                pl.col("list_key").is_in(
+                    [key for key in wanted_state if key not in changed_keys]
+                )
+            )
+        else:
+            changed_keys = list(wanted_state)
+            df = None
+        df_changed = _compute_aggregates(scan_lists(changed_keys))
+        df = df_changed if df is None else pl.concat([df, df_changed])
+        df = df.sort(
+            "dimension",
+            "top-n",
+            "list_number",
+            "systems",
+            "value",
+            descending=[False, False, False, True, False],
+            nulls_last=True,
         )
+        counters["lists"] = len(changed_keys)
+        try:
+            with _atomic_output(table_path) as f:
+                df.write_ipc(f, compression="uncompressed")
+            # The state is written last, so that an interrupted update is repeated.
+            with _atomic_output(state_path) as f:
+                f.write(_AGGREGATES_STATE_ADAPTER.dump_json(wanted_state, indent=2))
+        except OSError:
+            # The aggregates are only a cache, so a read-only download directory is not an error.
+            pass
         return df
 
-    def read_tsv_excel(tar: TarFile) -> pl.DataFrame:
-        return read_tsv("from_excel.tsv", tar)
-
-    def read_tsv_xml(tar: TarFile) -> pl.DataFrame:
-        return read_tsv("from_xml.tsv", tar)
-
-    def read_tsv_normalized(tar: TarFile) -> pl.DataFrame:
-        def set_col_name(
-            mapping: NormalizedColumnMapping, df: pl.DataFrame
-        ) -> pl.DataFrame:
-            for col_name in mapping.names_in_source:
-                if col_name in df.columns:
-                    df = df.rename({col_name: mapping.key})
-                    return df
-            df = df.with_columns(
-                pl.lit(None, dtype=mapping.dtype).alias(mapping.key),
+
+def _load_aggregates_state() -> dict[str, str]:
+    try:
+        return _AGGREGATES_STATE_ADAPTER.validate_json(
+            _get_aggregates_paths()[1].read_bytes()
+        )
+    except (OSError, pydantic.ValidationError):
+        return {}
+
+
+def aggregates(
+    by: str | None = None,
+    top_n: int = 500,
+    keys: Iterable[str | Top500ListInfo] | None = None,
+    refresh: bool = False,
+) -> pl.DataFrame:
+    """Get aggregates of the local lists per issue, optionally grouped by a column.
+
+    For every list and every value of the column `by` among the first `top_n` systems, the result contains the number
+    of systems (`systems`), the total and the median Rmax (`r-max-total-gflops`, `r-max-median-gflops`), the total
+    power (`power-total-kw`) and the share of the value in the systems and in the total Rmax of the list
+    (`system-share`, `r-max-share`).
+
+    The aggregates are materialized in the download directory (`aggregates.arrow`) and updated incrementally when lists
+    are downloaded, normalized or queried after lists have been added or changed, so they are computed once per list.
+    As long as the local index records the same archives as for the previous query, queries are answered from memory
+    without scanning the download directory. Archives that have been changed by other means than this module are only
+    noticed with `refresh`.
+
+    Lists are never downloaded by this function.
+
+    Args:
+        by (str | None, optional): The column to group by. Can be one of {"country", "manufacturer", "accelerator",
+            "interconnect-family", "segment"}. If None, there is a single row per list. Defaults to None.
+        top_n (int, optional): Only aggregate the first `top_n` systems of each list. Can be one of {10, 50, 100,
+            500}. Defaults to 500.
+        keys (Iterable[str | Top500ListInfo] | None, optional): Only return the rows of these lists. If None, the rows
+            of all local lists are returned. Defaults to None.
+        refresh (bool, optional): Wether the download directory shall be scanned for added, changed or removed
+            archives even if the local index matches the previous query. Defaults to False.
+
+    Raises:
+        ValueError: When `by` or `top_n` is not supported.
+
+    Returns:
+        pl.DataFrame: The columns `list_key`, `list_number`, `published_on`, the column `by` (if given) and the
+            aggregates, oldest list first and then by the number of systems, descending.
+    """
+    import polars as pl
+
+    global _aggregates_memo
+
+    if by is not None and by not in _AGGREGATE_DIMENSIONS:
+        raise ValueError(
+            f'by "{by}" not allowed. Must be None or in {set(_AGGREGATE_DIMENSIONS)}.'
+        )
+    if top_n not in _AGGREGATE_TOP_N:
+        raise ValueError(
+            f"top_n {top_n} not allowed. Must be in {set(_AGGREGATE_TOP_N)}."
+        )
+    download_dir = get_download_dir()
+    if not download_dir.exists():
+        partitions = {}
+    else:
+        # The aggregates are outdated when an archive has been added, changed or removed. The stored index is checked
+        # first, so that a query only scans the download directory when it might have to update the aggregates.
+        stamp = (
+            download_dir,
+            {key: entry.sha256 for key, entry in _load_local_index().items()},
+        )
+        memo = _aggregates_memo
+        if refresh or memo is None or memo[0] != stamp:
+            # The checksums are taken before the update, so that a change during the update is not missed.
+            stamp = (
+                download_dir,
+                {key: entry.sha256 for key, entry in _update_local_index().items()},
             )
-            return df
-
-        mappings = _NORMALIZED_COLUMN_MAPPINGS
-
-        def get_filtered_df(
-            df: pl.DataFrame, data_source: str, extra_columns: list[str] | None = None
-        ) -> pl.DataFrame:
-            my_mappings = [m for m in mappings if m.data_source == data_source]
-            for m in my_mappings:
-                df = set_col_name(m, df)
-            result_column_names = [m.key for m in my_mappings]
-            if extra_columns is not None:
-                result_column_names += extra_columns
-            df = df.select(result_column_names)
-            return df
-
-        df_excel = read_tsv_excel(tar)
-        if "Mflops/Watt" in df_excel.columns:
-            df_excel = df_excel.with_columns(
-                (pl.col("Mflops/Watt") / 1000).alias("Energy Efficiency [GFlops/Watts]")
+        if memo is None or memo[0] != stamp:
+            memo = (
+                stamp,
+                {
+                    (dimension, n): df.drop("dimension", "top-n")
+                    for (dimension, n), df in _update_aggregates()
+                    .partition_by("dimension", "top-n", as_dict=True)
+                    .items()
+                },
             )
-        df_excel = get_filtered_df(df_excel, "excel", extra_columns=["Rank"])
-        df_excel = df_excel.with_columns(
-            pl.col("processor-speed-mhz").cast(pl.Int64).alias("processor-speed-mhz")
-        )
-        df_excel = df_excel.rename({"Rank": "rank"})
-        df_xml = read_tsv_xml(tar)
-        df_xml = get_filtered_df(df_xml, "xml")
-        df_joined = df_xml.join(df_excel, on="rank", how="inner", validate="1:1")
-        df_joined = df_joined.select(m.key for m in mappings)
-        for actual_dtype, m in zip(df_joined.dtypes, mappings):
-            assert actual_dtype == m.dtype, (actual_dtype, m.dtype, m.key)
-        assert df_joined.shape == (500, len(mappings))
-        return df_joined
-
-    def read_tsv_normalized_pretty(tar: TarFile) -> pl.DataFrame:
-        mappings = _NORMALIZED_COLUMN_MAPPINGS
-        df = read_tsv_normalized(tar)
-        df.columns = [m.friendly_name for m in mappings]
-        assert df.shape == (500, len(mappings))
-        return df
+            _aggregates_memo = memo
+        partitions = memo[1]
+    df = partitions.get((by or "all", top_n))
+    if df is None:
+        df = pl.DataFrame(schema=_get_aggregates_schema()).drop("dimension", "top-n")
+    if keys is not None:
+        df = df.filter(pl.col("list_key").is_in([_get_key(key) for key in keys]))
+    if by is None:
+        return df.drop("value")
+    return df.rename({"value": by})
 
-    readers = {
-        "excel": read_tsv_excel,
-        "xml": read_tsv_xml,
-        "normalized": read_tsv_normalized,
-        "normalized-pretty": read_tsv_normalized_pretty,
+
+def _get_aggregates_schema() -> dict[str, pl.DataType]:
+    import polars as pl
+
+    return {
+        **_get_list_info_columns_schema(),
+        "dimension": pl.String,
+        "value": pl.String,
+        "top-n": pl.Int64,
+        "systems": pl.Int64,
+        "r-max-total-gflops": pl.Float64,
+        "r-max-median-gflops": pl.Float64,
+        "power-total-kw": pl.Float64,
+        "system-share": pl.Float64,
+        "r-max-share": pl.Float64,
     }
-    allowed_source = set(readers.keys())
-    if source not in allowed_source:
-        raise ValueError(f'source "{source}" not allowed. Must be in {allowed_source}.')
-    key = _get_key(list_info_or_key)
-    assert _RE_LIST_KEY.match(key)
-    filename = get_download_dir() / f"{key}.tar.gz"
-    if not filename.exists():
-        if not allow_download:
-            raise RuntimeError(
-                f'List "{key}" was not found locally and allow_download == False.'
+
+
+def normalize_local_lists() -> None:
+    """Write the normalized Arrow IPC file for every local list that does not have an up-to-date one yet.
+
+    Lists downloaded by older versions of this module only contain the raw data and the tsv files. This function
+    derives the normalized table from the tsv files once and stores it next to the archive, so that subsequent
+    `read_list()` calls can skip the parsing and joining. No network access is required.
+    """
+    for list_info in iter_lists_local():
+        key = list_info.key
+        if _is_normalized_list_up_to_date(key):
+            continue
+        with _ListArchive(_get_list_path(key)) as archive:
+            df = _normalize_list(
+                _read_tsv_member("from_xml.tsv", archive),
+                _read_tsv_member("from_excel.tsv", archive),
             )
-        download_list(list_info_or_key)
-    assert filename.exists()
-    with tarfile.open(filename, "r:gz") as tar:
-        return readers[source](tar)
+        _write_normalized_list(df, key)
+    _update_aggregates()
+
+
+def _get_raw_members(
+    members: dict[str, bytes],
+) -> tuple[tuple[str, bytes], tuple[str, bytes]]:
+    """Find the raw XML and Excel file among the (name, content) members of a list archive."""
+    raw_names = [
+        name
+        for name in members
+        if name not in ("metadata.json", "schema.json") and not name.endswith(".tsv")
+    ]
+    xml_names = [name for name in raw_names if name.endswith(".xml")]
+    excel_names = [name for name in raw_names if name.endswith((".xls", ".xlsx"))]
+    if len(xml_names) != 1 or len(excel_names) != 1:
+        raise RuntimeError(
+            f"Expected exactly one XML and one Excel file in the archive, found {raw_names}."
+        )
+    return (
+        (xml_names[0], members[xml_names[0]]),
+        (excel_names[0], members[excel_names[0]]),
+    )
+
+
+def _rebuild_list(
+    key: str, settings: tuple[Path | None, str, int | None] | None, force: bool
+) -> bool:
+    """Re-create the derived files of a local list from the raw files in its archive, unless they are up to date.
+
+    Args:
+        key (str): The key of the list.
+        settings (tuple[Path | None, str, int | None] | None): The download directory, the archive format and the
+            compression level set via `set_download_dir()` and `set_archive_format()`, or None to keep the current
+            settings. Passed explicitly, because this function runs in the worker processes of `rebuild_local_lists()`,
+            which do not share the settings of the parent process.
+        force (bool): Wether the derived files shall be re-created even if they are up to date.
+
+    Returns:
+        bool: Wether the derived files have been re-created.
+    """
+    if settings is not None:
+        download_dir, archive_format, compression_level = settings
+        if download_dir is not None:
+            set_download_dir(download_dir)
+        set_archive_format(archive_format, compression_level)
+    with _list_lock(key), _stage("rebuild", key) as counters:
+        counters["rebuilt"] = 0
+        path = _get_list_path(key)
+        with _ListArchive(path) as archive:
+            members = {}
+            for name in archive.names():
+                with archive.open(name) as member_fp:
+                    members[name] = member_fp.read()
+        list_info = _LIST_INFO_ADAPTER.validate_json(members["metadata.json"])
+        raw_xml, raw_excel = _get_raw_members(members)
+        schema_info = (
+            _SCHEMA_INFO_ADAPTER.validate_json(members["schema.json"])
+            if "schema.json" in members
+            else None
+        )
+        if (
+            not force
+            and _is_schema_verified(schema_info)
+            and schema_info.inputs_sha256
+            == _get_inputs_sha256(raw_xml[1], raw_excel[1])
+        ):
+            if _is_normalized_list_up_to_date(key):
+                return False
+            # The tsv files are up to date, only the normalized table is missing or outdated.
+            counters["rebuilt"] = 1
+            df_normalized = _normalize_list(
+                _read_tsv(BytesIO(members["from_xml.tsv"])),
+                _read_tsv(BytesIO(members["from_excel.tsv"])),
+            )
+            _write_normalized_list(df_normalized, key)
+            return True
+        counters["rebuilt"] = 1
+        tsv_from_xml = _tsv_from_xml(raw_xml[1])
+        tsv_from_excel = _tsv_from_excel(raw_excel[1])
+        df_normalized = _normalize_list(
+            _read_tsv(BytesIO(tsv_from_xml)), _read_tsv(BytesIO(tsv_from_excel))
+        )
+        # The archive is replaced before the normalized table is written, so that an interruption in between leaves a
+        # normalized table that is older than the archive and thus gets rebuilt.
+        _write_list_archive(
+            list_info, raw_xml, raw_excel, tsv_from_xml, tsv_from_excel, path
+        )
+        _write_normalized_list(df_normalized, key)
+    return True
+
+
+def _get_rebuild_error(key: str, cause: Exception) -> RuntimeError:
+    """Wrap an exception raised while rebuilding a list.
+
+    When a worker process of `rebuild_local_lists()` dies, all pending futures raise the same `BrokenProcessPool`
+    instance, so it is wrapped per list instead of being collected (and annotated) once per list.
+    """
+    error = RuntimeError(f'Failed to rebuild list "{key}".')
+    error.__cause__ = cause
+    return error
+
+
+def rebuild_local_lists(jobs: int = 1, force: bool = False) -> list[str]:
+    """Re-create the tsv files and the normalized tables of the local lists from the raw XML and Excel files in their
+    archives. No network access is required.
+
+    Every archive records the version of the conversion that created its derived files (`schema.json`, see
+    `download_list()`), together with a checksum of the raw files they were created from and of the normalized schema
+    they were validated against. Lists whose archive has been written by the current version from the raw files it
+    contains and whose normalized table is up to date are skipped, so after upgrading this module, only the outdated
+    lists are converted again. Checking a list decompresses its archive, but this is cheap compared to the conversion.
+
+    The archives and the normalized tables are replaced atomically, so readers never see partially written files. The
+    diffs between adjacent lists, the history index and the aggregates are brought up to date afterwards.
+
+    Args:
+        jobs (int, optional): The number of lists that are converted concurrently by a pool of processes. Defaults to 1.
+            With `jobs > 1`, the call must be guarded by `if __name__ == "__main__":`, see `download_all_lists()`.
+        force (bool, optional): Wether all lists shall be rebuilt, even the ones that are up to date. Defaults to
+            False.
+
+    Raises:
+        ValueError: When `jobs` is smaller than 1.
+        ExceptionGroup: When rebuilding at least one list failed.
+
+    Returns:
+        list[str]: The keys of the lists that have been rebuilt.
+    """
+    if jobs < 1:
+        raise ValueError(f"jobs must be at least 1, passed {jobs}.")
+    if _download_dir is None and not _DEFAULT_DOWNLOAD_DIR.exists():
+        return []
+    keys = sorted(_update_local_index())
+    rebuilt: list[str] = []
+    errors: list[Exception] = []
+    if jobs == 1 or len(keys) <= 1:
+        for key in keys:
+            try:
+                if _rebuild_list(key, None, force):
+                    rebuilt.append(key)
+            except Exception as e:
+                errors.append(_get_rebuild_error(key, e))
+    else:
+        import multiprocessing
+        from concurrent.futures import ProcessPoolExecutor, as_completed
+
+        # See `download_all_lists()` on why the workers are spawned.
+        mp_context = multiprocessing.get_context("spawn")
+        settings = (_download_dir, _archive_format, _compression_level)
+        with ProcessPoolExecutor(
+            max_workers=min(jobs, len(keys)), mp_context=mp_context
+        ) as pool:
+            futures = {
+                pool.submit(_call_with_stages, _rebuild_list, key, settings, force): key
+                for key in keys
+            }
+            for future in as_completed(futures):
+                key = futures[future]
+                try:
+                    was_rebuilt, events = future.result()
+                except Exception as e:
+                    errors.append(_get_rebuild_error(key, e))
+                    continue
+                for event in events:
+                    _record_stage(event)
+                if was_rebuilt:
+                    rebuilt.append(key)
+        rebuilt.sort()
+    if rebuilt:
+        _update_local_index()
+        _update_derived_files(rebuilt)
+    if errors:
+        raise ExceptionGroup(f"Failed to rebuild {len(errors)} list(s).", errors)
+    return rebuilt
+
+
+def migrate_local_lists(archive_format: str | None = None) -> None:
+    """Convert the archives of all local lists to the given format in place (see `set_archive_format()`).
+
+    Every archive is rewritten with the same members and modification time, so that the normalized tables stay valid,
+    and the old archive is removed afterwards. No network access is required.
+
+    Args:
+        archive_format (str | None, optional): The target format. Can be one of {"tar.gz", "tar.zst", "zip"}. If None,
+            the format set via `set_archive_format()` is used. Defaults to None.
+
+    Raises:
+        ValueError: When the given archive format is invalid.
+        RuntimeError: When "tar.zst" is requested, but neither `compression.zstd` nor `zstandard` is available.
+    """
+    if archive_format is None:
+        archive_format = _archive_format
+    if archive_format not in _ARCHIVE_FORMATS:
+        raise ValueError(
+            f'archive_format "{archive_format}" not allowed. Must be in {set(_ARCHIVE_FORMATS)}.'
+        )
+    if archive_format == "tar.zst":
+        _get_zstd_backend()
+    for list_info in iter_lists_local():
+        key = list_info.key
+        old_path = _get_list_path(key)
+        new_path = get_download_dir() / f"{key}.{archive_format}"
+        if old_path == new_path:
+            continue
+        with _list_lock(key):
+            with _ListArchive(old_path) as archive:
+                members = []
+                for name in archive.names():
+                    with archive.open(name) as member_fp:
+                        members.append((name, member_fp.read()))
+            stat = old_path.stat()
+            with _atomic_output(new_path, durable=True) as f:
+                _write_archive(f, archive_format, members)
+            os.utime(new_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+            old_path.unlink()
+    _update_local_index()
 
 
 def main() -> None:
@@ -630,10 +3850,33 @@ def main() -> None:
         metavar="dir",
         help=f'Set the download dir. Defaults to "{_DEFAULT_DOWNLOAD_DIR}".',
     )
+    parser.add_argument(
+        "--archive-format",
+        choices=_ARCHIVE_FORMATS,
+        help='Set the format of the archives of newly downloaded lists. Defaults to "tar.gz".',
+    )
+    parser.add_argument(
+        "--compression-level",
+        action="store",
+        type=int,
+        metavar="N",
+        help='Set the compression level of the archives of newly downloaded lists, 0-9 for "tar.gz" and "zip" and 1-22 '
+        'for "tar.zst". Defaults to 6 for "tar.gz" and "zip" and 3 for "tar.zst".',
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print the time spent in each stage (fetching, converting, reading, ...) to stderr when done.",
+    )
     subparsers = parser.add_subparsers(dest="action", required=True)
-    subparsers.add_parser(
+    list_online_parser = subparsers.add_parser(
         "list-online", help="List TOP500 list issues that are available online."
     )
+    list_online_parser.add_argument(
+        "--refresh",
+        action="store_true",
+        help="Visit the TOP500 website even if the cached list of issues is still fresh.",
+    )
     subparsers.add_parser(
         "list-local", help="List TOP500 list issues that are available locally."
     )
@@ -642,20 +3885,109 @@ def main() -> None:
         help='Download a TOP500 list issue (see "download --help" for more info).',
     )
     download_parser.add_argument("key", help='The key of the list, e.g. "2025-06".')
-    subparsers.add_parser(
+    download_all_parser = subparsers.add_parser(
         "download-all",
         help="Download all TOP500 list issues that are available online.",
     )
+    download_all_parser.add_argument(
+        "-j",
+        "--jobs",
+        action="store",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Download and convert up to N lists concurrently. Defaults to 1.",
+    )
+    subparsers.add_parser(
+        "sync",
+        help="Download new TOP500 list issues and re-download the ones that have changed online.",
+    )
+    subparsers.add_parser(
+        "reindex",
+        help="Rebuild the index of TOP500 list issues that are available locally.",
+    )
+    subparsers.add_parser(
+        "normalize",
+        help="Write the normalized table of local lists that were downloaded by an older version.",
+    )
+    rebuild_parser = subparsers.add_parser(
+        "rebuild",
+        help="Convert the raw files of local lists again that were converted by an older version. No network access.",
+    )
+    rebuild_parser.add_argument(
+        "-j",
+        "--jobs",
+        action="store",
+        type=int,
+        default=1,
+        metavar="N",
+        help="Convert up to N lists concurrently. Defaults to 1.",
+    )
+    rebuild_parser.add_argument(
+        "--force",
+        action="store_true",
+        help="Also convert the lists that are up to date.",
+    )
+    history_parser = subparsers.add_parser(
+        "history",
+        help="Show every appearance of a system or of the systems of a site in the local lists.",
+    )
+    history_group = history_parser.add_mutually_exclusive_group(required=True)
+    history_group.add_argument(
+        "--system", type=int, metavar="ID", help="The system ID (system-id)."
+    )
+    history_group.add_argument(
+        "--site", type=int, metavar="ID", help="The site ID (site-id)."
+    )
+    diff_parser = subparsers.add_parser(
+        "diff",
+        help="Show the systems that entered, exited, were upgraded or moved between two local lists.",
+    )
+    diff_parser.add_argument("a", help='The key of the older list, e.g. "2024-11".')
+    diff_parser.add_argument("b", help='The key of the newer list, e.g. "2025-06".')
+    diff_parser.add_argument(
+        "--all",
+        action="store_true",
+        help="Also show the systems that are unchanged.",
+    )
+    migrate_parser = subparsers.add_parser(
+        "migrate",
+        help="Convert the archives of all local lists to another format.",
+    )
+    migrate_parser.add_argument(
+        "archive_format",
+        choices=_ARCHIVE_FORMATS,
+        metavar="format",
+        help='The target format, "zip" (members can be read individually), "tar.zst" (fast) or "tar.gz".',
+    )
     display_parser = subparsers.add_parser(
         "display",
         help='Display a TOP500 list on the console (see "display --help" for more info).',
     )
     display_parser.add_argument("key", help='The key of the list, e.g. "2025-06".')
+    display_parser.add_argument(
+        "-c",
+        "--columns",
+        action="store",
+        type=lambda columns: columns.split(","),
+        default="rank,name,country,manufacturer,r-max-gflops,rpeak-gflops,power-kw",
+        metavar="COLS",
+        help='Comma-separated keys of the normalized columns to display. Only these are read. Defaults to "%(default)s".',
+    )
     args = parser.parse_args()
     if args.download_dir:
         set_download_dir(args.download_dir)
+    if args.archive_format or args.compression_level is not None:
+        try:
+            set_archive_format(
+                args.archive_format or get_archive_format(), args.compression_level
+            )
+        except (ValueError, RuntimeError) as e:
+            parser.error(str(e))
 
     def display_list_list(lists: Iterable[Top500ListInfo]) -> None:
+        import polars as pl
+
         with pl.Config(tbl_rows=-1, fmt_str_lengths=1000):
             df = pl.DataFrame(lists)
             if len(df) == 0:
@@ -663,27 +3995,108 @@ def main() -> None:
                 return
             print(df)
 
-    match args.action:
-        case "list-online":
-            display_list_list(iter_lists_online())
-        case "list-local":
-            display_list_list(iter_lists_local())
-        case "download":
-            download_list(args.key)
-        case "download-all":
-            download_all_lists()
-        case "display":
-            df = read_list(args.key, allow_download=True, source="normalized-pretty")
-            df = df.select(
-                "Rank",
-                "System Name",
-                "Country",
-                "Manufacturer",
-                "Rmax [GFlop/s]",
-                "Rpeak [GFlop/s]",
-                "Power [kW]",
+    def print_sync_report(report: SyncReport) -> None:
+        for title, keys in (
+            ("Added", report.added),
+            ("Updated", report.updated),
+            ("Failed", report.failed),
+        ):
+            if keys:
+                print(f"{title} ({len(keys)}): {', '.join(keys)}")
+        print(f"Unchanged: {len(report.unchanged)}")
+
+    def print_profile() -> None:
+        profile = get_profile()
+        if not profile:
+            return
+        width = max(len(stage) for stage in profile)
+        print(
+            f"{'Stage':<{width}}  {'Calls':>6}  {'Total [s]':>10}  {'Mean [ms]':>10}  Counters",
+            file=sys.stderr,
+        )
+        for stage, stats in profile.items():
+            counters = ", ".join(
+                f"{name}={int(value) if float(value).is_integer() else round(value, 3)}"
+                for name, value in stats.counters.items()
+            )
+            mean_ms = stats.duration / stats.calls * 1000
+            print(
+                f"{stage:<{width}}  {stats.calls:>6}  {stats.duration:>10.3f}  {mean_ms:>10.1f}  {counters}",
+                file=sys.stderr,
             )
-            with pl.Config(tbl_rows=-1):
-                print(df)
-        case _:
-            raise RuntimeError(f'Encountered an unexpected argument "{args.action}"')
+
+    try:
+        match args.action:
+            case "list-online":
+                display_list_list(iter_lists_online(refresh=args.refresh))
+            case "list-local":
+                display_list_list(iter_lists_local())
+            case "download":
+                download_list(args.key)
+            case "download-all":
+                download_all_lists(jobs=args.jobs)
+            case "sync":
+                try:
+                    report = sync_lists()
+                except SyncError as e:
+                    print_sync_report(e.report)
+                    raise
+                print_sync_report(report)
+            case "reindex":
+                rebuild_local_index()
+            case "normalize":
+                normalize_local_lists()
+            case "rebuild":
+                rebuilt = rebuild_local_lists(jobs=args.jobs, force=args.force)
+                print(f"Rebuilt {len(rebuilt)} list(s).")
+            case "history":
+                import polars as pl
+
+                if args.system is not None:
+                    df = system_history(args.system)
+                else:
+                    df = site_history(args.site)
+                if len(df) == 0:
+                    print("No entries!")
+                else:
+                    with pl.Config(tbl_rows=-1, tbl_cols=-1, fmt_str_lengths=1000):
+                        print(df)
+            case "diff":
+                import polars as pl
+
+                df = diff_lists(args.a, args.b)
+                counts = df["change"].value_counts()
+                print(
+                    ", ".join(
+                        f"{change}: {dict(counts.iter_rows()).get(change, 0)}"
+                        for change in _DIFF_CHANGES
+                    )
+                )
+                if not args.all:
+                    df = df.filter(pl.col("change") != "unchanged")
+                with pl.Config(tbl_rows=-1, tbl_cols=-1, fmt_str_lengths=1000):
+                    print(df.drop("old_list_key", "new_list_key"))
+            case "migrate":
+                migrate_local_lists(args.archive_format)
+            case "display":
+                import polars as pl
+
+                df = read_list(
+                    args.key,
+                    allow_download=True,
+                    source="normalized",
+                    columns=args.columns,
+                )
+                friendly_names = {
+                    m.key: m.friendly_name for m in _get_normalized_column_mappings()
+                }
+                df.columns = [friendly_names[column] for column in df.columns]
+                with pl.Config(tbl_rows=-1, tbl_cols=-1):
+                    print(df)
+            case _:
+                raise RuntimeError(
+                    f'Encountered an unexpected argument "{args.action}"'
+                )
+    finally:
+        if args.profile:
+            print_profile()